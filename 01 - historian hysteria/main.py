@@ -1,10 +1,37 @@
+import os
+import sys
+from bisect import bisect_left, bisect_right
 from collections import Counter
+from itertools import groupby
+from math import isqrt
+from pathlib import Path
 
-def sort_lists():
+# make the shared aoc package importable when run from this folder
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from aoc.external import MERGE_WIDTH, RUN_LENGTH, ExternalSorter
+from aoc.inputs import InputBuffer
+from aoc.ints import as_numpy, columns
+
+try:
+    import numpy
+except ImportError:  # numpy is optional, the list path below needs nothing else
+    numpy = None
+
+# inputs bigger than this are solved out of core by main() rather than read into memory
+EXTERNAL_SORT_BYTES = 256 * 1024 * 1024
+
+# bytes of the input file parsed at a time when streaming it
+CHUNK_BYTES = 1 << 20
+
+# fewest segments per block of the incremental distance; blocks are rebuilt
+# around the square root of the segment count as it grows
+MIN_BLOCK_SEGMENTS = 32
+
+def sort_lists(left_list, right_list):
     """Sorts the lists into 2, separate, sorted lists"""
-    left_list, right_list = read_file()
-    left_list.sort()
-    right_list.sort()
+    left_list = sorted(left_list)
+    right_list = sorted(right_list)
     return left_list, right_list
 
 def find_distance(left_list, right_list):
@@ -14,21 +41,18 @@ def find_distance(left_list, right_list):
         total_distance += abs(int(left) - int(right))
     return total_distance
 
-def read_file():
+def read_file(file_path="input.txt"):
     """Reads the file and returns the two lists"""
-    left_list = []
-    right_list = []
-    with open("input.txt", "r") as file:
-        for line in file:
-            left, right = line.split()
-            left_list.append(int(left))
-            right_list.append(int(right))
+    with open(file_path, "r") as file:
+        return parse_lists(file.read())
+
+def parse_lists(input_text):
+    """Parses the input text into the two lists"""
+    left_list, right_list = columns(input_text, 2)
     return left_list, right_list
 
-def create_occurrences_dict():
+def create_occurrences_dict(left_list, right_list):
     """Creates a dictionary of the # of times each number in the left list appears in the right list"""
-    left_list, right_list = read_file()
-    
     # count occurrences in the right list
     right_counts = Counter(right_list)
     return left_list, right_counts
@@ -40,13 +64,311 @@ def find_similarity_score(left_list, right_counts):
         similarity_score += number * right_counts[number]
     return similarity_score
 
+def find_distance_vectorized(left_list, right_list):
+    """Finds the total distance with NumPy: both columns sorted, then one abs-diff sum"""
+    left = numpy.sort(as_numpy(left_list))
+    right = numpy.sort(as_numpy(right_list))
+    return int(numpy.abs(left - right).sum())
+
+def find_similarity_vectorized(left_list, right_list):
+    """Finds the similarity score with NumPy, looking each left number up in the right list's counts"""
+    left = as_numpy(left_list)
+    values, counts = numpy.unique(as_numpy(right_list), return_counts=True)
+    if not len(values):
+        return 0
+
+    # binary search every left number among the distinct right values at once;
+    # numbers missing from the right list land on a neighbour and count 0
+    positions = numpy.searchsorted(values, left).clip(max=len(values) - 1)
+    occurrences = numpy.where(values[positions] == left, counts[positions], 0)
+    return int((left * occurrences).sum())
+
+def read_column_chunks(file_path, chunk_bytes=CHUNK_BYTES):
+    """Streams the two lists from a file a chunk of lines at a time, as (left, right) arrays"""
+    with InputBuffer.open(file_path) as buffer:
+        for chunk in buffer.chunks(chunk_bytes):
+            yield columns(chunk, 2)
+
+def find_merged_similarity_score(left_sorted, right_sorted):
+    """Finds the similarity score from both lists in sorted order, walking them together (a merge join)"""
+    right_numbers = iter(right_sorted)
+    right = next(right_numbers, None)
+    similarity_score = 0
+    for number, group in groupby(left_sorted):
+        # skip the smaller right numbers, then count the ones matching this number
+        while right is not None and right < number:
+            right = next(right_numbers, None)
+        matches = 0
+        while right == number:
+            matches += 1
+            right = next(right_numbers, None)
+        if matches:
+            similarity_score += number * matches * sum(1 for _ in group)
+    return similarity_score
+
+def solve_external(file_path="input.txt", directory=None, run_length=RUN_LENGTH,
+                   merge_width=MERGE_WIDTH):
+    """
+    Solves both parts in bounded memory, for lists too big to load: each list
+    is sorted into runs on disk, and the merged runs are streamed past the
+    distance sum and the similarity merge join (with both lists merging at
+    once, up to twice merge_width run files are open)
+    """
+    with ExternalSorter(directory, run_length, merge_width=merge_width) as left_sorted, \
+            ExternalSorter(directory, run_length, merge_width=merge_width) as right_sorted:
+        for left_list, right_list in read_column_chunks(file_path):
+            left_sorted.extend(left_list)
+            right_sorted.extend(right_list)
+        total_distance = find_distance(left_sorted, right_sorted)
+        similarity_score = find_merged_similarity_score(left_sorted, right_sorted)
+    return total_distance, similarity_score
+
+class GapBlock:
+    """
+    A run of consecutive segments of the number line, each with a width and
+    the difference (left count - right count) of the numbers up to it. Adding
+    to every difference at once is a pending offset; the widths are also
+    totalled per stored difference, so that takes O(1) too.
+    """
+    __slots__ = ("starts", "widths", "diffs", "offset", "weights", "total", "negative")
+
+    def __init__(self, starts, widths, diffs):
+        self.starts = starts
+        self.widths = widths
+        self.diffs = diffs
+        self.offset = 0
+        # total width per stored difference (a dict, as Counter's misses go through Python)
+        self.weights = {}
+        for width, diff in zip(widths, diffs):
+            self.weights[diff] = self.weights.get(diff, 0) + width
+        self.total = sum(widths)
+        self.negative = sum(width for width, diff in zip(widths, diffs) if diff < 0)
+
+    def segments(self):
+        """(start, width, difference) of each segment, with the offset applied"""
+        return [
+            (start, width, diff + self.offset)
+            for start, width, diff in zip(self.starts, self.widths, self.diffs)
+        ]
+
+    def shift(self, step):
+        """Add step (1 or -1) to every difference; returns the change in the distance"""
+        if step > 0:
+            # |d + 1| - |d| is 1 for d >= 0 and -1 below
+            change = self.total - 2 * self.negative
+            self.negative -= self.weights.get(-1 - self.offset, 0)
+        else:
+            # |d - 1| - |d| is 1 for d <= 0 and -1 above
+            nonpositive = self.negative + self.weights.get(-self.offset, 0)
+            change = 2 * nonpositive - self.total
+            self.negative = nonpositive
+        self.offset += step
+        return change
+
+    def shift_range(self, first, stop, step):
+        """shift() for the segments first..stop-1 only, one at a time"""
+        widths, diffs, weights = self.widths, self.diffs, self.weights
+        # the (stored) differences at or above this one gain |step| in absolute value
+        # when stepping up, and lose it when stepping down
+        threshold = -self.offset if step > 0 else 1 - self.offset
+        total = above = 0
+        for index in range(first, stop):
+            width = widths[index]
+            diff = diffs[index]
+            weights[diff] -= width
+            weights[diff + step] = weights.get(diff + step, 0) + width
+            diffs[index] = diff + step
+            total += width
+            if diff >= threshold:
+                above += width
+
+        # segments moving between -1 and 0 change sign
+        crossed = -self.offset if step > 0 else -1 - self.offset
+        self.negative -= step * sum(
+            widths[index] for index in range(first, stop) if diffs[index] == crossed
+        )
+        return 2 * above - total if step > 0 else total - 2 * above
+
+    def resize(self, index, width):
+        """Change a segment's width"""
+        change = width - self.widths[index]
+        self.widths[index] = width
+        self.weights[self.diffs[index]] += change
+        self.total += change
+        if self.diffs[index] + self.offset < 0:
+            self.negative += change
+
+    def insert(self, index, start, width, diff):
+        """Add a segment at index, with diff as its actual difference"""
+        self.starts.insert(index, start)
+        self.widths.insert(index, width)
+        self.diffs.insert(index, diff - self.offset)
+        self.weights[diff - self.offset] = self.weights.get(diff - self.offset, 0) + width
+        self.total += width
+        if diff < 0:
+            self.negative += width
+
+class IncrementalHistorian:
+    """
+    Keeps both answers current while (left, right) pairs keep arriving,
+    without re-sorting: the similarity score from a running Counter of each
+    list, in O(1) per pair, and the total distance in O(sqrt(n)) per pair,
+    n being the count of distinct numbers.
+
+    The distance of two sorted lists of equal length is the area between
+    their counting functions: the sum over every integer t of
+    |#left <= t - #right <= t|. A pair (left, right) adds 1 to that
+    difference on [left, right) (or -1 on [right, left)), so the numbers
+    seen so far cut the number line into segments kept in sqrt-sized
+    GapBlocks, and each pair shifts a range of them.
+    """
+
+    def __init__(self, pairs=()):
+        self.left_counts = Counter()
+        self.right_counts = Counter()
+        self.similarity_score = 0
+        self.total_distance = 0
+        self.pairs = 0
+        # the segments, in number order; the last one is open-ended with width 0
+        self.blocks = []
+        self.firsts = []
+        self.segments = 0
+        self.block_segments = MIN_BLOCK_SEGMENTS
+        self.rebuild_at = 4 * MIN_BLOCK_SEGMENTS ** 2
+        for left, right in pairs:
+            self.add(left, right)
+
+    def add(self, left, right):
+        """Take in one more pair and bring both answers up to date"""
+        # each new number scores against the matching numbers already on the other side
+        self.similarity_score += left * self.right_counts[left]
+        self.left_counts[left] += 1
+        self.similarity_score += right * self.left_counts[right]
+        self.right_counts[right] += 1
+        self.pairs += 1
+
+        if left != right:
+            self.mark(left)
+            self.mark(right)
+            if left < right:
+                self.total_distance += self.shift(left, right, 1)
+            else:
+                self.total_distance += self.shift(right, left, -1)
+
+    def mark(self, number):
+        """Make a segment start at number, splitting the segment it falls in"""
+        if not self.blocks:
+            self.blocks.append(GapBlock([number], [0], [0]))
+            self.firsts.append(number)
+            self.segments = 1
+            return
+
+        index = bisect_right(self.firsts, number) - 1
+        if index < 0:
+            # below every number so far: the counts are equal up to the old first one
+            index = 0
+            block = self.blocks[0]
+            block.insert(0, number, self.firsts[0] - number, 0)
+            self.firsts[0] = number
+        else:
+            block = self.blocks[index]
+            position = bisect_right(block.starts, number) - 1
+            start = block.starts[position]
+            if start == number:
+                return
+            # the split halves keep the segment's difference
+            last = index == len(self.blocks) - 1 and position == len(block.starts) - 1
+            rest = 0 if last else start + block.widths[position] - number
+            block.resize(position, number - start)
+            block.insert(position + 1, number, rest, block.diffs[position] + block.offset)
+
+        self.segments += 1
+        if self.segments > self.rebuild_at:
+            self.rebuild()
+        elif len(block.starts) > 2 * self.block_segments:
+            self.split(index)
+
+    def shift(self, low, high, step):
+        """Add step to the differences of the segments starting in [low, high); returns the distance change"""
+        first = bisect_right(self.firsts, low) - 1
+        last = bisect_left(self.firsts, high) - 1
+        block = self.blocks[first]
+        start = bisect_left(block.starts, low)
+        if first == last:
+            return block.shift_range(start, bisect_left(block.starts, high), step)
+
+        # only the blocks at either end can be partly in the range
+        change = block.shift_range(start, len(block.starts), step)
+        for block in self.blocks[first + 1:last]:
+            change += block.shift(step)
+        block = self.blocks[last]
+        stop = bisect_left(block.starts, high)
+        if stop == len(block.starts):
+            change += block.shift(step)
+        else:
+            change += block.shift_range(0, stop, step)
+        return change
+
+    def split(self, index):
+        """Split an overfull block in two"""
+        segments = self.blocks[index].segments()
+        halves = [segments[:len(segments) // 2], segments[len(segments) // 2:]]
+        self.blocks[index:index + 1] = [self.new_block(half) for half in halves]
+        self.firsts[index:index + 1] = [half[0][0] for half in halves]
+
+    def rebuild(self):
+        """Regroup every segment into blocks sized to the square root of their count, as it quadruples"""
+        segments = [segment for block in self.blocks for segment in block.segments()]
+        # a shift costs a step per block plus one per segment of the two end blocks,
+        # and segments cost a few times more than blocks, so blocks stay under the root
+        self.block_segments = max(MIN_BLOCK_SEGMENTS, isqrt(len(segments)) // 2)
+        self.rebuild_at = 4 * len(segments)
+        size = self.block_segments
+        self.blocks = [self.new_block(segments[i:i + size]) for i in range(0, len(segments), size)]
+        self.firsts = [block.starts[0] for block in self.blocks]
+
+    def new_block(self, segments):
+        """A block of (start, width, difference) segments"""
+        starts, widths, diffs = (list(column) for column in zip(*segments))
+        return GapBlock(starts, widths, diffs)
+
+def stream(lines):
+    """Streams both answers, yielding them after each line of pairs as it arrives"""
+    historian = IncrementalHistorian()
+    for line in lines:
+        if line.strip():
+            left, right = map(int, line.split())
+            historian.add(left, right)
+        yield {1: historian.total_distance, 2: historian.similarity_score}
+
+def parse(input_text):
+    """Parses the input text into the two lists both parts work from"""
+    return parse_lists(input_text)
+
+def part1(lists):
+    """Solves part 1: total distance between the sorted lists"""
+    # the columns are int64 arrays, so NumPy can take them over without a copy
+    if numpy is not None:
+        return find_distance_vectorized(*lists)
+    left_list, right_list = sort_lists(*lists)
+    return find_distance(left_list, right_list)
+
+def part2(lists):
+    """Solves part 2: similarity score of the lists"""
+    if numpy is not None:
+        return find_similarity_vectorized(*lists)
+    left_list, right_counts = create_occurrences_dict(*lists)
+    return find_similarity_score(left_list, right_counts)
+
 def main():
     """Main function"""
-    left_list, right_list = sort_lists()
-    total_distance = find_distance(left_list, right_list)
+    if os.path.getsize("input.txt") > EXTERNAL_SORT_BYTES:
+        total_distance, similarity_score = solve_external()
+    else:
+        lists = read_file()
+        total_distance = part1(lists)
+        similarity_score = part2(lists)
     print('Total Distance: ', total_distance)
-    left_list, right_counts = create_occurrences_dict()
-    similarity_score = find_similarity_score(left_list, right_counts)
     print('Similarity Score: ', similarity_score)
     
 if __name__ == "__main__":
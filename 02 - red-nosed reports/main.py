@@ -1,3 +1,23 @@
+import sys
+from pathlib import Path
+
+# make the shared aoc package importable when run from this folder
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from aoc.inputs import InputBuffer
+from aoc.ints import line_ints
+
+try:
+    import numpy
+except ImportError:  # numpy is optional, the per-report checks need nothing else
+    numpy = None
+
+# levels the problem dampener can remove from a report
+DAMPENER_REMOVALS = 1
+
+# bytes of reports evaluated per batch when streaming a file through NumPy
+CHUNK_BYTES = 1 << 20
+
 def is_safe(levels):
     """Determines if the levels are safe"""
 
@@ -26,32 +46,148 @@ def is_safe(levels):
 
     return True
 
-def is_safe_with_dampener(levels):
-    """Checks if the levels are safe with the dampener. Basically, it removes the
-    i element from the list and checks if it would be safe without it"""
-    for i in range(len(levels)):
-        # safe from up until i, and from i+1 to the end
-        if is_safe(levels[:i] + levels[i+1:]):
-            return True
+def is_safe_with_removals(levels, removals):
+    """Determines if the levels are safe once up to removals of them are taken out,
+    in one pass per trend and without copying the levels"""
+    # down to a single level (or none), which is safe by definition
+    if len(levels) - 1 <= removals:
+        return True
+
+    for low, high in ((1, 3), (-3, -1)):
+        # fewest[i]: fewest levels removed before i so the kept ones, ending at i, step
+        # by low..high; the level kept before i is at most removals + 1 back
+        fewest = []
+        for i, level in enumerate(levels):
+            best = i
+            for previous in range(max(0, i - removals - 1), i):
+                if low <= level - levels[previous] <= high:
+                    # the levels between previous and i are the ones removed
+                    candidate = fewest[previous] + i - previous - 1
+                    if candidate < best:
+                        best = candidate
+            fewest.append(best)
+
+            # everything after i can go too
+            if best + len(levels) - 1 - i <= removals:
+                return True
+
     return False
 
+def is_safe_with_dampener(levels, removals=DAMPENER_REMOVALS):
+    """Checks if the levels are safe with the dampener, which tolerates removing
+    a level (or as many as removals allows)"""
+    return is_safe_with_removals(levels, removals)
+
+def length_groups(reports):
+    """Stacks the reports into one NumPy matrix per report length, with no padding,
+    and returns them with the reports too short to vectorize"""
+    groups = {}
+    short = []
+    for levels in reports:
+        # every level needs room for the step over it
+        if len(levels) < 3:
+            short.append(levels)
+        else:
+            groups.setdefault(len(levels), []).append(levels)
+    return [numpy.array(group, dtype=numpy.int64) for group in groups.values()], short
+
+def safe_rows(matrix, dampener=False):
+    """Marks the rows of a matrix of equal-length reports that are safe, or safe
+    once the dampener takes out a level"""
+    rows, width = matrix.shape
+    edge = numpy.ones((rows, 1), dtype=bool)
+
+    # step t goes from level t to t + 1, and the bridge over level i from i - 1 to i + 1
+    steps = numpy.diff(matrix, axis=1)
+    if dampener:
+        bridges = matrix[:, 2:] - matrix[:, :-2]
+        removals = numpy.arange(width)
+        kept_before = numpy.maximum(removals - 1, 0)
+        kept_after = numpy.minimum(removals + 1, width - 1)
+
+    safe = numpy.zeros(rows, dtype=bool)
+    for low, high in ((1, 3), (-3, -1)):
+        good = (steps >= low) & (steps <= high)
+        if not dampener:
+            safe |= good.all(axis=1)
+            continue
+
+        # before[:, t]: the steps before t are all good; after[:, t]: the steps from t on are
+        before = numpy.hstack([edge, numpy.logical_and.accumulate(good, axis=1)])
+        after = numpy.hstack([numpy.logical_and.accumulate(good[:, ::-1], axis=1)[:, ::-1], edge])
+        # the first and last levels have nothing to bridge
+        bridged = numpy.hstack([edge, (bridges >= low) & (bridges <= high), edge])
+
+        # removing level i keeps the steps before i - 1, the steps from i + 1 on, and its
+        # bridge (a report safe as it is stays safe without its first level)
+        safe |= (before[:, kept_before] & after[:, kept_after] & bridged).any(axis=1)
+
+    return safe
+
+def count_safe_vectorized(reports, dampener=False):
+    """Counts the safe reports (with the dampener, if asked), checking all the
+    reports of each length at once"""
+    matrices, short = length_groups(reports)
+    check = is_safe_with_dampener if dampener else is_safe
+    return (
+        sum(int(safe_rows(matrix, dampener).sum()) for matrix in matrices)
+        + sum(1 for levels in short if check(levels))
+    )
+
+def count_safe_file(file_path, chunk_bytes=CHUNK_BYTES):
+    """Counts the safe reports of a file, without and with the dampener, streaming
+    it through NumPy a batch of reports at a time"""
+    total = dampener_total = 0
+    with InputBuffer.open(file_path) as buffer:
+        for chunk in buffer.chunks(chunk_bytes):
+            reports = line_ints(chunk)
+            total += count_safe_vectorized(reports)
+            dampener_total += count_safe_vectorized(reports, dampener=True)
+    return total, dampener_total
+
+def parse_reports(input_text):
+    """Parses the input text into a list of reports (lists of levels)"""
+    return line_ints(input_text)
+
+def parse(input_text):
+    """Parses the input text into the reports both parts check"""
+    return parse_reports(input_text)
+
+def part1(reports):
+    """Solves part 1: number of safe reports"""
+    if numpy is not None:
+        return count_safe_vectorized(reports)
+    return sum(1 for levels in reports if is_safe(levels))
+
+def part2(reports, removals=DAMPENER_REMOVALS):
+    """Solves part 2: number of safe reports with the dampener"""
+    # the vectorized check covers the one-level dampener; other policies go report by report
+    if numpy is not None and removals == 1:
+        return count_safe_vectorized(reports, dampener=True)
+    return sum(1 for levels in reports if is_safe_with_dampener(levels, removals))
+
 def main():
     """Main function"""
-    with open('input.txt', 'r') as f:
-        lines = f.readlines()
-        total = 0
-        for line in lines:
-            levels = list(map(int, line.strip().split()))
-            if is_safe(levels):
-                total += 1
+    if numpy is not None:
+        total, dampener_total = count_safe_file('input.txt')
         print('Total safe: ', total)
-        
-        dampener_total = 0
-        for line in lines:
-            levels = list(map(int, line.strip().split()))
-            if is_safe_with_dampener(levels):
-                dampener_total += 1
         print('Total safe with dampener: ', dampener_total)
+        return
+
+    with open('input.txt', 'r') as f:
+        reports = parse_reports(f.read())
+
+    total = 0
+    for levels in reports:
+        if is_safe(levels):
+            total += 1
+    print('Total safe: ', total)
+
+    dampener_total = 0
+    for levels in reports:
+        if is_safe_with_dampener(levels):
+            dampener_total += 1
+    print('Total safe with dampener: ', dampener_total)
 
 if __name__ == '__main__':
     main()
\ No newline at end of file
@@ -1,22 +1,78 @@
+import os
 import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain, takewhile
+from pathlib import Path
 
-def read_file():
-    """Reads input text file."""
-    with open("input.txt") as f:
-        return f.read().strip()
+# make the shared aoc package importable when run from this folder
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from aoc.inputs import InputBuffer, as_buffer
+
+# the runner hands parse the memory-mapped file rather than a str
+BUFFER_INPUT = True
+
+# regex patterns for `mul(X,Y)` and `do()/don't()`
+MUL_PATTERN = rb"mul\((\d{1,3}),(\d{1,3})\)"
+STATE_PATTERN = rb"(do\(\)|don't\(\))"
+INSTRUCTION = re.compile(MUL_PATTERN + b"|" + STATE_PATTERN)
+
+# no instruction is longer than mul(123,456), so a match starting further than
+# this from the end of a chunk can't be cut off by it
+MAX_INSTRUCTION = len(b"mul(123,456)")
+
+# bytes read at a time when streaming a dump
+CHUNK_BYTES = 1 << 20
+
+# dumps bigger than this are streamed a chunk at a time by main() rather than mapped whole
+STREAMING_BYTES = 64 * 1024 * 1024
+
+# dumps bigger than this are scanned in parallel by main()
+PARALLEL_BYTES = 64 * 1024 * 1024
+
+# segments per worker when a dump is summarized in parallel, so a slow one doesn't hold up the rest
+SEGMENTS_PER_WORKER = 4
+
+def read_file(file_path="input.txt"):
+    """Maps the input file."""
+    return InputBuffer.open(file_path)
 
 def extract_instructions(input_data):
     """
     Extracts all relevant instructions from the input data in order.
     This includes `mul(X,Y)` and `do()/don't()` instructions.
     """
-    # regex patterns for `mul(X,Y)` and `do()/don't()`
-    mul_pattern = r"mul\((\d{1,3}),(\d{1,3})\)"
-    state_pattern = r"(do\(\)|don't\(\))"
-    combined_pattern = f"{mul_pattern}|{state_pattern}"
+    # find all matches and return as iter objects (bytes patterns scan
+    # the mapped file in place, without decoding it to a str)
+    return INSTRUCTION.finditer(as_buffer(input_data).data)
 
-    # find all matches and return as iter objects
-    return re.finditer(combined_pattern, input_data)
+def stream_instructions(file, chunk_bytes=CHUNK_BYTES):
+    """
+    Yields the instructions of a binary file object chunk by chunk, as one
+    list of matches per chunk, carrying any instruction cut by a chunk
+    boundary over into the next chunk
+    """
+    carry = b""
+    while True:
+        chunk = file.read(chunk_bytes)
+        data = carry + chunk
+        if not chunk:
+            yield list(INSTRUCTION.finditer(data))
+            return
+
+        # matches starting before the boundary are whole; scanning resumes at
+        # the boundary (or past the last match, if that ran over it)
+        boundary = max(len(data) - MAX_INSTRUCTION + 1, 0)
+        matches = []
+        resume = boundary
+        for match in INSTRUCTION.finditer(data):
+            if match.start() >= boundary:
+                break
+            matches.append(match)
+            resume = max(resume, match.end())
+        yield matches
+        carry = data[resume:]
 
 def process_instruction(match, is_enabled):
     """
@@ -29,28 +85,114 @@ def process_instruction(match, is_enabled):
             return x * y, is_enabled
         return 0, is_enabled
     elif match.group(3):  # do() or don't() group matched
-        if match.group(3) == "do()":
+        if match.group(3) == b"do()":
             return 0, True
-        elif match.group(3) == "don't()":
+        elif match.group(3) == b"don't()":
             return 0, False
     return 0, is_enabled
 
-def calculate_total(instructions):
-    """Calculates total sum of enabled `mul` results based on instructions."""
+def run_instructions(instructions, is_enabled=True):
+    """Sums the enabled `mul` results of some instructions, starting in the given state;
+    returns the sum and the state after them"""
     total = 0
-    is_enabled = True  # mul instructions are enabled to start
 
     for match in instructions:
         result, is_enabled = process_instruction(match, is_enabled)
         total += result
 
+    return total, is_enabled
+
+def calculate_total(instructions):
+    """Calculates total sum of enabled `mul` results based on instructions."""
+    # mul instructions are enabled to start
+    total, _ = run_instructions(instructions, is_enabled=True)
+    return total
+
+def calculate_total_streaming(file_path, chunk_bytes=CHUNK_BYTES):
+    """
+    Calculates the same total as calculate_total, reading the dump a chunk
+    at a time so memory stays bounded however big it is
+    """
+    total = 0
+    is_enabled = True
+    with open(file_path, "rb") as file:
+        # the enabled state carries over from each chunk into the next
+        for matches in stream_instructions(file, chunk_bytes):
+            result, is_enabled = run_instructions(matches, is_enabled)
+            total += result
+    return total
+
+def summarize_segment(data, start, end):
+    """
+    Summarizes the instructions starting in data[start:end] by what they do
+    from either state: ((total, state after) if mul is enabled on entry,
+    (total, state after) if it's disabled)
+    """
+    # no instruction can hold the start of another, so a segment owns exactly the
+    # matches starting in it, reading past its end for the last one if need be
+    stop = min(end + MAX_INSTRUCTION - 1, len(data))
+    matches = takewhile(lambda match: match.start() < end, INSTRUCTION.finditer(data, start, stop))
+
+    head = 0
+    for match in matches:
+        if match.group(3):
+            # from the first do()/don't() on, both entry states run the same way
+            rest, is_enabled = run_instructions(chain([match], matches))
+            return (head + rest, is_enabled), (rest, is_enabled)
+        head += int(match.group(1)) * int(match.group(2))
+    return (head, True), (0, False)
+
+def fold_summaries(summaries, is_enabled=True):
+    """Chains segment summaries, in order, into the total calculate_total would give"""
+    total = 0
+    for when_enabled, when_disabled in summaries:
+        result, is_enabled = when_enabled if is_enabled else when_disabled
+        total += result
     return total
 
+def summarize_file_segment(task):
+    """Worker side of calculate_total_parallel: the summary of one segment of a dump file"""
+    file_path, start, end = task
+    # each worker maps the file itself and only reads its own segment's pages
+    with InputBuffer.open(file_path) as buffer:
+        return summarize_segment(buffer.data, start, end)
+
+def calculate_total_parallel(file_path, workers=None):
+    """
+    Calculates the same total as calculate_total, summarizing segments of
+    the dump file on worker processes and folding the summaries in order
+    """
+    size = os.path.getsize(file_path)
+    segments = (workers or os.cpu_count() or 1) * SEGMENTS_PER_WORKER
+    step = max(1, -(-size // segments))
+    # the workers get where their segments are, not the bytes, so nothing is copied to them
+    tasks = [(str(file_path), start, min(start + step, size)) for start in range(0, size, step)]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return fold_summaries(executor.map(summarize_file_segment, tasks))
+
+def parse(input_data):
+    """Wraps the input (text or mapped input) as bytes to scan; the scan itself is the solve."""
+    return as_buffer(input_data)
+
+def part1(buffer, workers=1):
+    """Solves the puzzle for the given input."""
+    # the workers read a mapped dump from its file; text held in memory is scanned here
+    if workers > 1 and buffer.path is not None:
+        return calculate_total_parallel(buffer.path, workers)
+    return calculate_total(extract_instructions(buffer))
+
 def main():
     """Main function."""
-    input_data = read_file()
-    instructions = extract_instructions(input_data)
-    return calculate_total(instructions)
+    size = os.path.getsize("input.txt")
+    workers = os.cpu_count() or 1
+    # past a certain size the scan is worth spreading over every core, and
+    # with a single core it reads the dump in chunks instead of mapping it
+    if size > PARALLEL_BYTES and workers > 1:
+        return calculate_total_parallel("input.txt", workers)
+    if size > STREAMING_BYTES:
+        return calculate_total_streaming("input.txt")
+    with read_file() as input_data:
+        return calculate_total(extract_instructions(input_data))
 
 if __name__ == "__main__":
     print(main())
\ No newline at end of file
@@ -1,89 +1,91 @@
-def read_file():
+import sys
+from pathlib import Path
+
+# make the shared aoc package importable when run from this folder
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from aoc.grid import Grid
+from aoc.inputs import InputBuffer
+
+# the runner hands parse the memory-mapped file rather than a str
+BUFFER_INPUT = True
+
+def read_file(file_path="input.txt"):
     """Reads input text file"""
-    with open("input.txt") as f:
-        return f.read().strip().splitlines()
+    with InputBuffer.open(file_path) as buffer:
+        return parse_grid(buffer)
+
+def parse_grid(input_text):
+    """
+    Parses the word search (text or mapped input) into a grid, padded so a
+    whole word never runs off the edge
+    """
+    return Grid.parse(input_text, pad=3)
 
 def count_xmas_occurrences(grid):
     """Count occurrences of XMAS in the grid in all possible directions"""
-    word = "XMAS"
-    word_len = len(word)
+    word = b"XMAS"
+    cells = grid.cells
     total_count = 0
-    rows = len(grid)
-    cols = len(grid[0])
-
-    def check_direction(x, y, dx, dy):
-        """Check if 'XMAS' is in a specific direction starting from (x, y)"""
-        for i in range(word_len):
-            # calculate next position in the grid
-            next_x = x + i * dx
-            next_y = y + i * dy
-
-            # check if next position is out of bounds
-            if not (0 <= next_x < rows and 0 <= next_y < cols):
-                return False
 
-            # check if the character at the current position matches the expected character in in XMAS
-            if grid[next_x][next_y] != word[i]:
+    # offsets of the 8 directions (left to right, top to bottom, diagonals, and reversed)
+    directions = grid.offsets8
+
+    def check_direction(index, step):
+        """Check if 'XMAS' is in a specific direction starting from index"""
+        for i in range(1, len(word)):
+            # check if the character at the next position matches the expected character in XMAS
+            # (the padding holds no letters, so running off the grid just fails the match)
+            if cells[index + i * step] != word[i]:
                 return False
 
         # all chars match, true
         return True
 
-    for x in range(rows):
-        for y in range(cols):
-            # Check in all 8 directions
-            directions = [
-                (0, 1),  # left to right
-                (0, -1), # right to left
-                (1, 0),  # top to bottom
-                (-1, 0), # bottom to top
-                (1, 1),  # top-left to bottom-right
-                (-1, -1),# bottom-right to top-left
-                (1, -1), # top-right to bottom-left
-                (-1, 1), # bottom-left to top-right
-            ]
-            # check all 8 directions for XMAS
-            for dx, dy in directions:
-                if check_direction(x, y, dx, dy):
-                    total_count += 1
+    # only cells holding the X can start the word
+    for index in grid.find_all("X"):
+        # check all 8 directions for XMAS
+        for step in directions:
+            if check_direction(index, step):
+                total_count += 1
 
     return total_count
 
-def read_file():
-    """Reads input text file"""
-    with open("input.txt") as f:
-        return f.read().strip().splitlines()
-
 def count_mas_in_x(grid):
     """Count occurrences of X-MAS in the grid"""
-    rows = len(grid)
-    cols = len(grid[0])
+    cells = grid.cells
     total_count = 0
+    up_left, up_right = -grid.stride - 1, -grid.stride + 1
+    m_plus_s = ord('M') + ord('S')
 
-    def is_x_mas(x, y):
-        """Check if (x, y) is the center of an X-MAS pattern"""
-        try:
-            # ASCII checks for diagonals
-            diag1 = ord(grid[x - 1][y - 1]) + ord(grid[x + 1][y + 1])  # top-left to bottom-right
-            diag2 = ord(grid[x - 1][y + 1]) + ord(grid[x + 1][y - 1])  # top-right to bottom-left
-            
-            # ensure both diagonals sum to M + S (don't care about order)
-            return (
-                grid[x][y] == 'A'  # center must be A
-                and diag1 == ord('M') + ord('S')  # diagonal 1 correct
-                and diag2 == ord('M') + ord('S')  # diagonal 2 correct
-            )
-        except IndexError:
-            return False  # out of bounds, not possible
-
-    # traverse the grid and count valid patterns
-    for x in range(1, rows - 1):  # avoid edges
-        for y in range(1, cols - 1):  # avoid edges
-            if is_x_mas(x, y):
-                total_count += 1
+    def is_x_mas(index):
+        """Check if an A at index is the center of an X-MAS pattern"""
+        # ASCII checks for diagonals (padding cells are 0, so edges never match)
+        diag1 = cells[index + up_left] + cells[index - up_left]  # top-left to bottom-right
+        diag2 = cells[index + up_right] + cells[index - up_right]  # top-right to bottom-left
+
+        # ensure both diagonals sum to M + S (don't care about order)
+        return diag1 == m_plus_s and diag2 == m_plus_s
+
+    # traverse the centers (A) and count valid patterns
+    for index in grid.find_all("A"):
+        if is_x_mas(index):
+            total_count += 1
 
     return total_count
 
+def parse(input_text):
+    """Parses the input into the grid both parts search"""
+    return parse_grid(input_text)
+
+def part1(grid):
+    """Solves part 1: XMAS occurrences in every direction"""
+    return count_xmas_occurrences(grid)
+
+def part2(grid):
+    """Solves part 2: X-MAS patterns"""
+    return count_mas_in_x(grid)
+
 def main():
     """Main function"""
     grid = read_file()
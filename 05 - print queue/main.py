@@ -1,20 +1,23 @@
+import sys
 from collections import deque
+from pathlib import Path
 
-def read_file():
+# make the shared aoc package importable when run from this folder
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from aoc.ints import line_ints, records
+
+def read_file(file_path="input.txt"):
     """Reads input text file"""
-    with open("input.txt") as f:
-        return f.read().strip().splitlines()
+    with open(file_path) as f:
+        return f.read()
 
 def parse_input(data):
     """Parses input data"""
-    rules = []
-    updates = []
-    for line in data:
-        line = line.strip()  # strip any leading/trailing whitespace
-        if "|" in line:
-            rules.append(tuple(map(int, line.split("|"))))  # parse rule into a tuple of integers
-        elif line:  # check if line isn't empty
-            updates.append(list(map(int, line.split(","))))  # parse update into a list of integers
+    # rules come first, then a blank line, then the updates
+    rules_text, _, updates_text = data.replace("\r\n", "\n").strip().partition("\n\n")
+    rules = records(rules_text, 2, signed=False)  # (x, y) page pairs
+    updates = line_ints(updates_text, signed=False)  # one list of pages per update
 
     return rules, updates
 
@@ -63,11 +66,8 @@ def reorder_update(rules, update):
 
     return ordered
 
-def main():
-    """Main function"""
-    data = read_file()
-    rules, updates = parse_input(data)
-    
+def split_updates(rules, updates):
+    """Splits the updates into correctly and incorrectly ordered ones"""
     valid_updates = []
     invalid_updates = []
 
@@ -76,6 +76,29 @@ def main():
             valid_updates.append(update)
         else:
             invalid_updates.append(update)
+    return valid_updates, invalid_updates
+
+def parse(input_text):
+    """Parses the input text into the rules and updates both parts check"""
+    return parse_input(input_text)
+
+def part1(parsed):
+    """Solves part 1: sum of middle pages of the correctly ordered updates"""
+    rules, updates = parsed
+    valid_updates, _ = split_updates(rules, updates)
+    return sum(find_middle(update) for update in valid_updates)
+
+def part2(parsed):
+    """Solves part 2: sum of middle pages of the reordered updates"""
+    rules, updates = parsed
+    _, invalid_updates = split_updates(rules, updates)
+    return sum(find_middle(reorder_update(rules, update)) for update in invalid_updates)
+
+def main():
+    """Main function"""
+    data = read_file()
+    rules, updates = parse_input(data)
+    valid_updates, invalid_updates = split_updates(rules, updates)
     
     middle_sum = sum(find_middle(update) for update in valid_updates)
     print("Sum of middle page numbers:", middle_sum)
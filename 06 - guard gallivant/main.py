@@ -1,62 +1,73 @@
-def read_file():
+import sys
+from pathlib import Path
+
+# make the shared aoc package importable when run from this folder
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from aoc.bitset import BitArray
+from aoc.grid import Grid, OUTSIDE
+
+OBSTRUCTION = ord('#')
+
+def read_file(file_path="input.txt"):
     """Reads input text file"""
-    with open("input.txt") as f:
+    with open(file_path) as f:
         return f.read().strip()
 
 def parse_map(map_input):
-    """Parse the input map into a 2D grid and find initial guard position and direction"""
-    grid = [list(row) for row in map_input.strip().split('\n')]
-    
+    """Parse the input map into a grid and find initial guard position and direction"""
+    grid = Grid.parse(map_input)
+
     directions = ['^', '>', 'v', '<']
-    
+
     # find guard's initial pos & dir
-    for y, row in enumerate(grid):
-        for x, cell in enumerate(row):
-            if cell in directions:
-                return grid, x, y, directions.index(cell)
+    for index in grid.scan():
+        cell = grid[index]
+        if cell in directions:
+            return grid, index, directions.index(cell)
 
-def count_distinct_positions(map_input):
+def count_distinct_positions(grid, position, direction):
     """Count distinct positions visited by the guard before it leaves the grid"""
-    grid, x, y, direction = parse_map(map_input)
-    height, width = len(grid), len(grid[0])
-    
-    # tracking visited positions (no repeats)
-    visited = set([(x, y)])
-    
-    moves = [
-        (0, -1),
-        (1, 0),
-        (0, 1),
-        (-1, 0)
-    ]
-    
+    cells = grid.cells
+
+    # tracking visited positions (no repeats), one bit per cell
+    visited = BitArray(len(cells))
+    visited.add(position)
+
+    # up, right, down, left: same order as the guard's turns
+    moves = grid.offsets4
+
     while True:
         # check if next position is valid and not an obstruction
-        next_x = x + moves[direction][0]
-        next_y = y + moves[direction][1]
-        
-        # check if out of bounds or hit an obstruction
-        if (next_x < 0 or next_x >= width or 
-            next_y < 0 or next_y >= height or 
-            grid[next_y][next_x] == '#'):
+        next_position = position + moves[direction]
+
+        # check if out of bounds (the sentinel border) or hit an obstruction
+        if cells[next_position] == OBSTRUCTION or cells[next_position] == OUTSIDE:
             # turn right
             direction = (direction + 1) % 4
         else:
             # move forward
-            x, y = next_x, next_y
-            visited.add((x, y))
-            
+            position = next_position
+            visited.add(position)
+
             # check if guard is completely outside the mapped area (end it)
-            if (x <= 0 or x >= width - 1 or 
-                y <= 0 or y >= height - 1):
+            if grid.is_edge(position):
                 break
-    
+
     return len(visited)
 
+def parse(input_text):
+    """Parses the input text into the grid and the guard's starting position and direction"""
+    return parse_map(input_text.strip())
+
+def part1(parsed):
+    """Solves part 1: distinct positions visited by the guard"""
+    return count_distinct_positions(*parsed)
+
 def main():
     """Main function"""
-    grid = read_file()
-    print(count_distinct_positions(grid))
+    grid, position, direction = parse_map(read_file())
+    print(count_distinct_positions(grid, position, direction))
 
 if __name__ == '__main__':
-    main()
\ No newline at end of file
+    main()
@@ -1,3 +1,16 @@
+import sys
+from pathlib import Path
+
+# make the shared aoc package importable when run from this folder
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from aoc import cancel
+from aoc.ints import line_ints
+
+def parse_equations(input_text):
+    """Parse the input text into (test value, numbers) pairs, one per equation"""
+    return [(values[0], values[1:]) for values in line_ints(input_text, signed=False)]
+
 def evaluate_expression(numbers, operators):
     """Evaluate an expression with given numbers and operators
     following left-to-right evaluation"""
@@ -15,15 +28,11 @@ def evaluate_expression(numbers, operators):
     
     return result
 
-def can_solve_equation(line):
+def can_solve_equation(test_value, numbers):
     """Determine if an equation can be solved using operators"""
-    # parse line
-    test_value, number_str = line.split(': ')
-    test_value = int(test_value)
-    numbers = list(map(int, number_str.split()))
-    
     # try all possible operator combinations (just + and *)
     operators = ['+', '*', '||']
+    budget = cancel.current()
     
     # generate all possible operator configurations
     def generate_operator_configs(length):
@@ -32,6 +41,9 @@ def can_solve_equation(line):
         
         configs = []
         for first_ops in generate_operator_configs(length - 1):
+            # the configurations grow 3x per slot, so long equations can take a while
+            if budget is not None:
+                budget.tick()
             for op in operators:
                 configs.append(first_ops + [op])
         return configs
@@ -41,28 +53,44 @@ def can_solve_equation(line):
     
     # try each configuration
     for op_config in op_configs:
+        if budget is not None:
+            budget.tick()
         result = evaluate_expression(numbers, op_config)
         if result == test_value:
             return True
     
     return False
 
-def solve_calibration(filename):
-    """Solve the puzzle by finding valid equations and summing"""
+def calibration_total(equations):
+    """Sum the test values of the equations that can be solved"""
     solvable_total = 0
-    solvable_equations = []
+    budget = cancel.current()
     
-    # read the file and process each line
-    with open(filename, 'r') as file:
-        for line in file:
-            line = line.strip()
-            if can_solve_equation(line):
-                test_value = int(line.split(': ')[0])
-                solvable_total += test_value
-                solvable_equations.append(line)
+    # process each equation
+    for checked, (test_value, numbers) in enumerate(equations):
+        if budget is not None:
+            # a cancelled run reports the total of the equations it got through
+            budget.progress["equations_checked"] = checked
+            budget.progress["partial_total"] = solvable_total
+        if can_solve_equation(test_value, numbers):
+            solvable_total += test_value
     
     return solvable_total
 
+def solve_calibration(filename):
+    """Solve the puzzle by finding valid equations and summing"""
+    # read the file and process each equation
+    with open(filename, 'r') as file:
+        return calibration_total(parse_equations(file.read()))
+
+def parse(input_text):
+    """Parse the input text into its equations"""
+    return parse_equations(input_text)
+
+def part1(equations):
+    """Solve the puzzle for the parsed equations"""
+    return calibration_total(equations)
+
 def main():
     """Main function"""
     result = solve_calibration('input.txt')
@@ -1,30 +1,38 @@
+import sys
+from pathlib import Path
+
+# make the shared aoc package importable when run from this folder
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from aoc.grid import Grid
+
+EMPTY = ord('.')
+
 def read_file(file_path="input.txt"):
-    """Read the input file and return a list of lines"""
+    """Read the input file and return its text"""
     with open(file_path) as file:
-        return [line.strip() for line in file]
+        return file.read()
 
-def parse_input(map_data):
+def parse_input(map_text):
     """Parse the input map and organize data"""
-    
+    grid = Grid.parse(map_text)
+    cells = grid.cells
+
     # storage for parsed data
-    map_grid = {}
     frequency_groups = {}
     antenna_positions = []
-    
-    for y in range(len(map_data[0])):
-        for x in range(len(map_data)):
-            char = map_data[y][x]
-            map_grid[(x, y)] = char
-            
-            if char != '.':
-                # group antenna positions by their frequency
-                frequency_groups.setdefault(char, set()).add((x, y))
-                antenna_positions.append((x, y))
-    
+
+    for index in grid.scan():
+        if cells[index] != EMPTY:
+            y, x = grid.position(index)
+            # group antenna positions by their frequency
+            frequency_groups.setdefault(grid[index], set()).add((x, y))
+            antenna_positions.append((x, y))
+
     return {
-        "grid": map_grid,
-        "width": len(map_data[0]),
-        "height": len(map_data),
+        "grid": grid,
+        "width": grid.width,
+        "height": grid.height,
         "frequencies": frequency_groups,
         "antennas": antenna_positions,
     }
@@ -66,10 +74,8 @@ def find_antinodes(frequency_groups, width, height, include_self=True):
 
     return antinode_locations
 
-def calculate_signal_impact(map_data, include_self=True):
-    """Calculate the number of unique antinodes within the map"""
-    parsed_map = parse_input(map_data)
-    
+def calculate_signal_impact(parsed_map, include_self=True):
+    """Calculate the number of unique antinodes within the parsed map"""
     # get antinode locations
     antinode_set = find_antinodes(
         parsed_map["frequencies"],
@@ -80,8 +86,20 @@ def calculate_signal_impact(map_data, include_self=True):
     
     return len(antinode_set)
 
+def parse(input_text):
+    """Parses the input text into the antenna map both parts work from"""
+    return parse_input(input_text)
+
+def part1(parsed_map):
+    """Solves part 1: antinodes excluding the antennas themselves"""
+    return calculate_signal_impact(parsed_map, include_self=False)
+
+def part2(parsed_map):
+    """Solves part 2: antinodes including the antennas themselves"""
+    return calculate_signal_impact(parsed_map)
+
 def main():
-    map_data = read_file("input.txt")
+    map_data = parse_input(read_file("input.txt"))
     impact = calculate_signal_impact(map_data, include_self=False)
     print(f"Signal Impact: {impact}")
     print(f"Signal Impact w/ Self: {calculate_signal_impact(map_data)}")
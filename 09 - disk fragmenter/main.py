@@ -1,12 +1,26 @@
-def read_file():
-    """Read input"""
-    with open('input.txt', 'r') as file:
-        return file.read().strip()
+import heapq
+import sys
+from collections import defaultdict
+from pathlib import Path
+
+# make the shared aoc package importable when run from this folder
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from aoc.inputs import InputBuffer, as_buffer
+
+# the runner hands parse the memory-mapped file rather than a str
+BUFFER_INPUT = True
+ZERO = ord('0')
+
+def read_file(file_path='input.txt'):
+    """Map the input"""
+    return InputBuffer.open(file_path)
 
 def parse_disk_map(disk_map):
-    """Convert the disk map string into a list of blocks with file IDs"""
-    # separate into alternating file sizes and free space sizes
-    sizes = [int(x) for x in disk_map]
+    """Convert the disk map (text or mapped input) into a list of blocks with file IDs"""
+    # separate into alternating file sizes and free space sizes, reading the
+    # digits straight out of the input bytes
+    sizes = [digit - ZERO for digit in as_buffer(disk_map).stripped()]
     
     # convert to actual blocks representation
     blocks = []
@@ -25,9 +39,12 @@ def compact_disk(blocks):
     blocks = blocks.copy()
     n = len(blocks)
     
+    # both scans resume where they stopped: everything left of left_pos stays
+    # filled and everything right of right_pos stays free
+    left_pos = 0
+    right_pos = n - 1
     while True:
         # find rightmost file
-        right_pos = n - 1
         while right_pos >= 0 and blocks[right_pos] == '.':
             right_pos -= 1
         
@@ -35,7 +52,6 @@ def compact_disk(blocks):
             break
             
         # find leftmost free space
-        left_pos = 0
         while left_pos < n and blocks[left_pos] != '.':
             left_pos += 1
             
@@ -48,67 +64,53 @@ def compact_disk(blocks):
     
     return blocks
 
-def find_file_info(blocks, file_id):
-    """Find start position and size of a file"""
-    start = None
-    size = 0
-    for i, block in enumerate(blocks):
-        if block == file_id:
-            if start is None:
-                start = i
-            size += 1
-    return start, size
-
-def find_leftmost_space(blocks, start_pos, required_size):
-    """Find the leftmost contiguous free space that can fit the file"""
-    current_size = 0
-    start = None
-    
-    # linear search
-    for i in range(start_pos):
-        if blocks[i] == '.':
-            if start is None:
-                start = i
-            current_size += 1
-            if current_size == required_size:
-                return start
-        else:
-            start = None
-            current_size = 0
-            
-    return None
-
-def move_file(blocks, file_id):
-    """Move a single file to the leftmost possible position"""
-    # find the file's current position and size
-    start, size = find_file_info(blocks, file_id)
-    if start is None:
-        return blocks
-    
-    # find leftmost space that can fit the file
-    new_start = find_leftmost_space(blocks, start, size)
-    if new_start is None:
-        return blocks
-    
-    new_blocks = blocks.copy()
-    # clear old position
-    for i in range(start, start + size):
-        new_blocks[i] = '.'
-    # place in new position
-    for i in range(new_start, new_start + size):
-        new_blocks[i] = file_id
-        
-    return new_blocks
+def find_spans(blocks):
+    """Find the (start, size) of every file, keyed by file ID, and of every run of free space"""
+    files = {}
+    free = []
+    start = 0
+    for i in range(1, len(blocks) + 1):
+        # a span ends where the block changes, or at the end of the disk
+        if i == len(blocks) or blocks[i] != blocks[start]:
+            if blocks[start] == '.':
+                free.append((start, i - start))
+            else:
+                files[blocks[start]] = (start, i - start)
+            start = i
+    return files, free
 
 def compact_disk_whole_files(blocks):
     """Compact the disk by moving whole files from right to left"""
-    # find the highest file ID
-    max_file_id = max(block for block in blocks if block != '.')
-    
+    # make a copy so we dont change original
+    blocks = blocks.copy()
+    files, free = find_spans(blocks)
+
+    # the starts of the free spans in one heap per span length (listed left to
+    # right, so each list is already a heap); the space a file leaves behind is
+    # right of every file still to move, so it never needs adding
+    spans = defaultdict(list)
+    for start, size in free:
+        spans[size].append(start)
+
     # process files in decreasing order of file ID
-    for file_id in range(max_file_id, -1, -1):
-        blocks = move_file(blocks, file_id)
-    
+    for file_id in sorted(files, reverse=True):
+        start, size = files[file_id]
+
+        # the leftmost space that fits is the lowest head among the heaps of long enough spans
+        fit = None
+        for length, heap in spans.items():
+            if length >= size and heap and heap[0] < start and (fit is None or heap[0] < spans[fit][0]):
+                fit = length
+        if fit is None:
+            continue
+
+        # move the file, and put what's left of the span back under its new length
+        new_start = heapq.heappop(spans[fit])
+        blocks[new_start:new_start + size] = [file_id] * size
+        blocks[start:start + size] = ['.'] * size
+        if fit > size:
+            heapq.heappush(spans[fit - size], new_start + size)
+
     return blocks
 
 def calculate_checksum(blocks):
@@ -119,24 +121,34 @@ def calculate_checksum(blocks):
             checksum += pos * block
     return checksum
 
-def solve_disk_compaction_part1(disk_map):
+def solve_disk_compaction_part1(blocks):
     """Solve part 1 of the disk compaction problem"""
-    blocks = parse_disk_map(disk_map)
     compacted_blocks = compact_disk(blocks)
     return calculate_checksum(compacted_blocks)
 
-def solve_disk_compaction_part2(disk_map):
+def solve_disk_compaction_part2(blocks):
     """Solve part 2 of the disk compaction problem"""
-    blocks = parse_disk_map(disk_map)
     compacted_blocks = compact_disk_whole_files(blocks)
     return calculate_checksum(compacted_blocks)
 
+def parse(input_text):
+    """Parse the input into the block list both parts compact (each works on its own copy)"""
+    return parse_disk_map(input_text)
+
+def part1(blocks):
+    """Solve part 1 for the parsed disk"""
+    return solve_disk_compaction_part1(blocks)
+
+def part2(blocks):
+    """Solve part 2 for the parsed disk"""
+    return solve_disk_compaction_part2(blocks)
+
 def main():
     """Main function"""
-    disk_map = read_file()
+    blocks = parse_disk_map(read_file())
     
-    result1 = solve_disk_compaction_part1(disk_map)
-    result2 = solve_disk_compaction_part2(disk_map)
+    result1 = solve_disk_compaction_part1(blocks)
+    result2 = solve_disk_compaction_part2(blocks)
     
     print(f"Part 1 - The filesystem checksum after block-by-block compaction is: {result1}")
     print(f"Part 2 - The filesystem checksum after whole-file compaction is: {result2}")
@@ -1,72 +1,81 @@
-DIRECTIONS = [(-1, 0), (1, 0), (0, -1), (0, 1)]
+import sys
+from collections import Counter
+from pathlib import Path
 
-def read_file():
+# make the shared aoc package importable when run from this folder
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from aoc.bitset import Bitset
+from aoc.grid import Grid
+
+PEAK = ord('9')
+
+# peaks are numbered in row-major order and handled this many at a time: a trail
+# spans at most 9 rows, so each pass only visits cells near its peaks and the
+# per-position bitsets stay a few words wide
+PEAKS_PER_PASS = 256
+
+EMPTY = Bitset()
+
+def read_file(file_path="input.txt"):
     """Reads input"""
-    with open("input.txt", 'r') as file:
-        return [line.strip() for line in file.readlines()]
+    with open(file_path, 'r') as file:
+        return file.read()
 
 def parse_map(map_data):
-    """Parses the input map data into a 2D list of integers"""
-    return [[int(char) for char in line] for line in map_data]
+    """Parses the input map data into a grid of height digits"""
+    return Grid.parse(map_data)
 
 def find_trailheads(topographic_map):
     """Finds all trailheads (positions with height 0)"""
-    trailheads = []
-    # loop through the map to find all trailheads
-    for row in range(len(topographic_map)):
-        for col in range(len(topographic_map[row])):
-            # for each row, find trailhead
-            if topographic_map[row][col] == 0:
-                trailheads.append((row, col)) # location of trailhead
-    return trailheads
+    return topographic_map.find_all("0")
 
 def is_valid_move(topographic_map, current, next_pos):
     """Checks if moving to the next position is valid"""
-    rows, cols = len(topographic_map), len(topographic_map[0])
-    r, c = next_pos
-    # check if next position is within bounds and is 1 greater than current position
-    if 0 <= r < rows and 0 <= c < cols:
-        return topographic_map[next_pos[0]][next_pos[1]] == topographic_map[current[0]][current[1]] + 1
-    return False
-
-def bfs_trail_score(topographic_map, start):
-    """Performs BFS from a trailhead to calculate its score"""
-    queue = [start]
-    visited = set()
-    visited.add(start)
-    reachable_nines = set()
-
-    while queue:
-        current = queue.pop(0)
-        row, col = current
-
-        # check if current position is height 9
-        if topographic_map[row][col] == 9:
-            reachable_nines.add(current)
-
-        # explore neighbors (up, down, left, right)
-        for dr, dc in DIRECTIONS:
-            next_pos = (row + dr, col + dc)
-            # if next position is not visited and is a valid move
-            if next_pos not in visited and is_valid_move(topographic_map, current, next_pos):
-                visited.add(next_pos)
-                queue.append(next_pos)
-
-    return len(reachable_nines)
+    cells = topographic_map.cells
+    # the next position must be 1 greater than the current one (the border never is)
+    return cells[next_pos] == cells[current] + 1
+
+def trailhead_scores(topographic_map):
+    """Counts the distinct peaks (height 9) each trailhead reaches, by trailhead position"""
+    offsets = topographic_map.offsets4
+    peaks = topographic_map.find_all("9")
+    scores = Counter()
+
+    for first in range(0, len(peaks), PEAKS_PER_PASS):
+        # each peak of this pass gets its own bit
+        reach = {
+            peak: Bitset.from_indices([bit])
+            for bit, peak in enumerate(peaks[first:first + PEAKS_PER_PASS])
+        }
+
+        # going down one height at a time, a position reaches the union of what its
+        # uphill neighbors reach, so each trail is walked once instead of once per trailhead
+        for _ in range(9):
+            below = {}
+            for current, reached in reach.items():
+                for step in offsets:
+                    if is_valid_move(topographic_map, current + step, current):
+                        below[current + step] = below.get(current + step, EMPTY) | reached
+            reach = below
+
+        # what's left are the trailheads these peaks can be reached from
+        for trailhead, reached in reach.items():
+            scores[trailhead] += len(reached)
+
+    return scores
 
 def dfs_count_trails(topographic_map, current):
     """Performs DFS to count distinct hiking trails starting from a given position"""
-    row, col = current
-
     # base case: if we reach height 9, it's a distinct trail
-    if topographic_map[row][col] == 9:
+    if topographic_map.cells[current] == PEAK:
         return 1
 
     total_trails = 0
 
-    # explore neighbors (up, down, left, right)
-    for dr, dc in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
-        next_pos = (row + dr, col + dc)
+    # explore neighbors (up, right, down, left)
+    for step in topographic_map.offsets4:
+        next_pos = current + step
         if is_valid_move(topographic_map, current, next_pos):
             total_trails += dfs_count_trails(topographic_map, next_pos)
 
@@ -74,13 +83,7 @@ def dfs_count_trails(topographic_map, current):
 
 def calculate_total_score(topographic_map):
     """Calculates the total score of all trailheads in the map"""
-    trailheads = find_trailheads(topographic_map)
-    total_score = 0
-
-    for trailhead in trailheads:
-        total_score += bfs_trail_score(topographic_map, trailhead)
-
-    return total_score
+    return sum(trailhead_scores(topographic_map).values())
 
 def calculate_total_rating(topographic_map):
     """Calculates the total rating of all trailheads in the map"""
@@ -92,6 +95,18 @@ def calculate_total_rating(topographic_map):
 
     return total_rating
 
+def parse(input_text):
+    """Parses the input text into the map both parts walk"""
+    return parse_map(input_text)
+
+def part1(topographic_map):
+    """Solves part 1: total score of all trailheads"""
+    return calculate_total_score(topographic_map)
+
+def part2(topographic_map):
+    """Solves part 2: total rating of all trailheads"""
+    return calculate_total_rating(topographic_map)
+
 def main():
     map_data = read_file()
     topographic_map = parse_map(map_data)
@@ -1,9 +1,25 @@
+import sys
 from collections import Counter
+from dataclasses import dataclass
+from pathlib import Path
 
-def read_file():
+# make the shared aoc package importable when run from this folder
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from aoc import cache
+
+@dataclass(frozen=True)
+class Stones:
+    initial: tuple
+
+def read_file(file_path="input.txt"):
     """Reads input"""
-    with open("input.txt", 'r') as file:
-        return list(map(int, file.read().strip().split()))
+    with open(file_path, 'r') as file:
+        return parse_stones(file.read())
+
+def parse_stones(input_text):
+    """Parses the input text into the initial stones"""
+    return Stones(tuple(map(int, input_text.strip().split())))
 
 def process_stone(stone):
     """Processes a stone according to rules and returns the resulting stones"""
@@ -21,31 +37,90 @@ def process_stone(stone):
         # if the stone is odd, return the stone multiplied by 2024
         return [stone * 2024]
 
-def blink(stones):
+# stone -> the stones it turns into; this only depends on the stone, so one
+# table is shared by every input the process solves
+transitions = {}
+
+def build_transitions(initial_stones, blinks, table=transitions):
+    """Adds every stone value reachable within the given blinks to the transition table"""
+    frontier = set(initial_stones)
+    for _ in range(blinks):
+        next_frontier = set()
+        for stone in frontier:
+            result = table.get(stone)
+            if result is None:
+                result = table[stone] = tuple(process_stone(stone))
+            next_frontier.update(result)
+        frontier = next_frontier
+    return table
+
+def stone_transitions(initial_stones, blinks):
+    """build_transitions, reused from the artifact cache when the same stones were seen before"""
+    return cache.cached(
+        "stone-transitions",
+        (sorted(set(initial_stones)), blinks),
+        lambda: build_transitions(initial_stones, blinks),
+    )
+
+def warm():
+    """Fill the transition table from the single digits, which every stone ends up splitting into"""
+    build_transitions(range(10), 75)
+
+def blink(stones, transitions):
     """Processes all stones during a single blink, accounting for duplicate values"""
     new_stones = Counter()
-    # process each stone and add the resulting stones to the new_stones counter
+    # look up each stone's result and add it to the new_stones counter
     for stone, count in stones.items():
-        for new_stone in process_stone(stone):
+        for new_stone in transitions[stone]:
             new_stones[new_stone] += count
     return new_stones
 
-def count_stones_after_blinks(blinks):
-    """Reads the input, processes the stones for the given blinks, and returns the total number of stones"""
-    initial_stones = read_file()
-    stones = Counter(initial_stones)
-    for _ in range(blinks):
-        stones = blink(stones)
-    return sum(stones.values())
+# initial stones -> {blinks: Counter of the stones after that many blinks}, filled
+# in as they're asked for so a longer count carries on from a shorter one; the
+# parsed stones are shared read-only between parts, so the counts live here, and
+# only for the latest input, which is all one run's parts need
+blinked = {}
+
+def stones_after(stones, blinks):
+    """Counter of the stones after the given blinks, starting from the most blinks already done"""
+    after = blinked.get(stones.initial)
+    if after is None:
+        blinked.clear()
+        after = blinked[stones.initial] = {0: Counter(stones.initial)}
+    done = max(count for count in after if count <= blinks)
+    # only a few thousand distinct values ever appear, so each rule is applied once per value
+    transitions = stone_transitions(stones.initial, blinks)
+    counts = after[done]
+    for _ in range(done, blinks):
+        counts = blink(counts, transitions)
+    after[blinks] = counts
+    return counts
+
+def count_stones_after_blinks(blinks, stones):
+    """Processes the stones for the given blinks and returns the total number of stones"""
+    return sum(stones_after(stones, blinks).values())
+
+def parse(input_text):
+    """Parses the input text into the stones; the 75-blink count picks up from the 25-blink one"""
+    return parse_stones(input_text)
+
+def part1(stones):
+    """Solves part 1: number of stones after 25 blinks"""
+    return count_stones_after_blinks(25, stones)
+
+def part2(stones):
+    """Solves part 2: number of stones after 75 blinks"""
+    return count_stones_after_blinks(75, stones)
 
 def main():
+    initial_stones = read_file()
 
     blinks_25 = 25
-    result_25 = count_stones_after_blinks(blinks_25)
+    result_25 = count_stones_after_blinks(blinks_25, initial_stones)
     print(f"Number of stones after {blinks_25} blinks: {result_25}")
 
     blinks_75 = 75
-    result_75 = count_stones_after_blinks(blinks_75)
+    result_75 = count_stones_after_blinks(blinks_75, initial_stones)
     print(f"Number of stones after {blinks_75} blinks: {result_75}")
 
 if __name__ == "__main__":
@@ -1,112 +1,122 @@
-DIRS = [(0, 1), (0, -1), (1, 0), (-1, 0)]
+import sys
+from array import array
+from pathlib import Path
 
-def read_file():
+# make the shared aoc package importable when run from this folder
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from aoc import cache
+from aoc.bitset import bits_from_indices
+from aoc.grid import Grid
+from aoc.search import UNREACHED, bfs_grid
+
+def read_file(file_path="input.txt"):
     """Reads input"""
-    with open("input.txt", "r") as file:
-        return [line.strip() for line in file]
+    with open(file_path, "r") as file:
+        return file.read()
 
 def create_map(inputs):
-    """Parse input into a map with coordinates"""
-    map_dict = {}
-    width = len(inputs[0])
-    height = len(inputs)
-
-    # create a dictionary of coordinates to plant types
-    for y in range(height):
-        for x in range(width):
-            map_dict[(x, y)] = inputs[y][x]
+    """Parse input into a grid of plant types"""
+    grid = Grid.parse(inputs)
 
     # return the map and dimensions
-    return {"map": map_dict, "width": width, "height": height}
-
-def flood_fill(map_dict, x, y, plant_type):
-    """Flood fill to find a region of connected cells"""
-    region = set()
-    seen = set()
-    queue = [(x, y)]
-
-    # bfs to find connected cells
-    while queue:
-        curr_x, curr_y = queue.pop(0)
-
-        if (curr_x, curr_y) in seen:
-            continue
-
-        seen.add((curr_x, curr_y))
-
-        # check if the cell is the same type as the region
-        if map_dict.get((curr_x, curr_y)) == plant_type:
-            region.add((curr_x, curr_y))
-            for dx, dy in DIRS:
-                queue.append((curr_x + dx, curr_y + dy))
+    return {"map": grid, "width": grid.width, "height": grid.height}
 
-    return region
+def flood_fill(map_dict, start, plant_type, seen=None, distances=None):
+    """Flood fill to find a region of connected cells, as the list of their indices"""
+    # bfs to find connected cells of the same type; with buffers shared across
+    # regions, each fill only touches its own cells
+    return bfs_grid(
+        map_dict.cells, map_dict.offsets4, (plant_type,), [start], seen=seen, distances=distances
+    ).order
 
 def get_regions(map_dict, width, height):
-    """Find all regions in the map"""
+    """Find all regions in the map, reusing them from the artifact cache when possible"""
+    # with the cache on, the flood fill runs once per distinct map across runs
+    return cache.cached(
+        "garden-region-boxes",
+        (map_dict.cells, map_dict.stride),
+        lambda: find_regions(map_dict),
+    )
+
+def find_regions(map_dict):
+    """Flood fill every region in the map"""
     regions = []
-    seen = set()
+    # one pair of search buffers for the whole map, so every cell is filled once
+    seen = bytearray(len(map_dict.cells))
+    distances = array('q', [UNREACHED]) * len(map_dict.cells)
 
     # iterate through all cells in the map
-    for x in range(width):
-        for y in range(height):
-            if (x, y) in seen:
-                continue
-
-            # find the region of connected cells
-            region = flood_fill(map_dict, x, y, map_dict[(x, y)])
-            seen.update(region)
-
-            # add the region to the list of regions
-            regions.append({
-                "regionSet": region,
-                "regionList": list(region),
-                "regionType": map_dict[(x, y)],
-            })
+    for index in map_dict.scan():
+        if seen[index]:
+            continue
+
+        # find the region of connected cells (the fill marks them seen)
+        plant_type = map_dict.cells[index]
+        region = flood_fill(map_dict, index, plant_type, seen, distances)
+
+        # add the region to the list of regions, its cells as the bits of one int
+        mask, stride = region_mask(map_dict, region)
+        regions.append({
+            "regionMask": mask,
+            "regionStride": stride,
+            "regionSize": len(region),
+            "regionType": plant_type,
+        })
     return regions
 
+def region_mask(map_dict, region):
+    """The region's cells as bits numbered within its bounding box, and the box's row stride"""
+    rows, cols = zip(*(divmod(index, map_dict.stride) for index in region))
+
+    # the box starts one row above and one column left of the region, so every
+    # grid point around it is named by a cell in the box, and the empty first
+    # column stops a shift by one carrying a row's last cell into the next row
+    # (a mask over the whole map would be as wide as the map for every region)
+    top, left = min(rows) - 1, min(cols) - 1
+    stride = max(cols) - left + 1
+    return bits_from_indices((row - top) * stride + col - left for row, col in zip(rows, cols)), stride
+
 def get_perimeter(map_dict, region):
     """Calculate the perimeter of a region"""
-    perimeter = 0
-    for x, y in region["regionList"]:
-        for dx, dy in DIRS:
-            neighbor = (x + dx, y + dy)
-            # check if the neighbor is outside the region
-            if map_dict.get(neighbor) != region["regionType"]:
-                perimeter += 1
-    return perimeter
-
-def get_corners(width, height, region):
+    mask = region["regionMask"]
+
+    # every cell has 4 sides, minus the 2 hidden by each pair of neighboring cells;
+    # shifting the mask by one cell (or one row) lines each cell up with its neighbor
+    # (the box's first column is always empty, so no pair wraps around a row)
+    horizontal_pairs = (mask & mask >> 1).bit_count()
+    vertical_pairs = (mask & mask >> region["regionStride"]).bit_count()
+    return 4 * region["regionSize"] - 2 * (horizontal_pairs + vertical_pairs)
+
+def get_corners(map_dict, region):
     """Calculate the number of sides/corners for a region."""
-    num_corners = 0
+    stride = region["regionStride"]
 
-    for x in range(-1, width):
-        for y in range(-1, height):
-            # check the four corners around this point
-            corner_pts = []
-            for dx, dy in [(0, 0), (1, 0), (1, 1), (0, 1)]:
-                corner_key = (x + dx, y + dy)
-                corner_pts.append('1' if corner_key in region["regionSet"] else '0')
+    # a grid point is named by the cell to its top-left; bit p of each shifted mask
+    # says whether one of the four cells around point p is in the region
+    top_left = region["regionMask"]
+    top_right = top_left >> 1
+    bottom_left = top_left >> stride
+    bottom_right = top_left >> stride + 1
 
-            corner_str = ''.join(corner_pts)
+    # determine corners based on the pattern (taken from Tim Trinidad's solution):
+    # points with 1 or 3 cells filled are one corner, ...
+    num_corners = (top_left ^ top_right ^ bottom_left ^ bottom_right).bit_count()
 
-            # determine corners based on the pattern (taken from Tim Trinidad's solution)
-            if corner_str in ['1000', '0100', '0010', '0001', '0111', '1011', '1101', '1110']:
-                num_corners += 1
-            elif corner_str in ['1010', '0101']:
-                num_corners += 2
+    # ... and diagonal pairs are two corners meeting at one point
+    diagonal = top_left & bottom_right & ~top_right & ~bottom_left
+    anti_diagonal = top_right & bottom_left & ~top_left & ~bottom_right
+    num_corners += 2 * (diagonal | anti_diagonal).bit_count()
 
     return num_corners
 
 def calculate_with_perimeter(parsed):
     """Calculate total price using perimeter."""
-    # get all the regions in the map
-    regions = get_regions(parsed["map"], parsed["width"], parsed["height"])
     total_price = 0
 
     # calculate the price for each region based on its perimeter
-    for region in regions:
-        region_size = len(region["regionSet"])
+    for region in parsed["regions"]:
+        region_size = region["regionSize"]
         perimeter = get_perimeter(parsed["map"], region)
         total_price += region_size * perimeter
 
@@ -115,21 +125,33 @@ def calculate_with_perimeter(parsed):
 
 def calculate_with_corner(parsed):
     """Calculate total price using corner/side count."""
-    # get all the regions in the map
-    regions = get_regions(parsed["map"], parsed["width"], parsed["height"])
     total_price = 0
 
     # calculate the price for each region based on its corner count
-    for region in regions:
-        region_size = len(region["regionSet"])
-        corners = get_corners(parsed["width"], parsed["height"], region)
+    for region in parsed["regions"]:
+        region_size = region["regionSize"]
+        corners = get_corners(parsed["map"], region)
         total_price += region_size * corners
 
     return total_price
 
+def parse(input_text):
+    """Parses the input into the map and its regions, which both parts price"""
+    parsed = create_map(input_text)
+    parsed["regions"] = get_regions(parsed["map"], parsed["width"], parsed["height"])
+    return parsed
+
+def part1(parsed):
+    """Solves part 1: total price of fencing using perimeters"""
+    return calculate_with_perimeter(parsed)
+
+def part2(parsed):
+    """Solves part 2: total price of fencing using sides"""
+    return calculate_with_corner(parsed)
+
 def main():
     inputs = read_file()
-    parsed = create_map(inputs)
+    parsed = parse(inputs)
 
     part1_result = calculate_with_perimeter(parsed)
     print(f"Part 1 - Total price of fencing: {part1_result}")
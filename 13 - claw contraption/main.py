@@ -1,30 +1,23 @@
-import re
+import sys
+from pathlib import Path
 
-def read_file():
+# make the shared aoc package importable when run from this folder
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from aoc.ints import records
+
+def read_file(file_path='input.txt'):
     """Read input"""
-    with open('input.txt', 'r') as file:
+    with open(file_path, 'r') as file:
         return file.read()
 
-def parse_machine(lines):
-    """Parse a single machine's config from three lines of input"""
-    # get numbers using regex
-    a_moves = [int(x) for x in re.findall(r'\d+', lines[0])]
-    b_moves = [int(x) for x in re.findall(r'\d+', lines[1])]
-    prize_loc = [int(x) for x in re.findall(r'\d+', lines[2])]
-    
-    # returns a tuple of tuples
-    return ((a_moves[0], a_moves[1]), (b_moves[0], b_moves[1]), (prize_loc[0], prize_loc[1]))
-
 def parse_input(text):
     """Parse all machines from the input text"""
-    machines = []
-    lines = [line.strip() for line in text.split('\n') if line.strip()]
-    
-    for i in range(0, len(lines), 3):
-        if i + 2 < len(lines):
-            machines.append(parse_machine(lines[i:i+3]))
-    
-    return machines
+    # six numbers per machine: button A's moves, button B's moves, the prize location
+    return [
+        ((ax, ay), (bx, by), (px, py))
+        for ax, ay, bx, by, px, py in records(text, 6, signed=False)
+    ]
 
 def solve_machine(machine, max_presses=100):
     """
@@ -46,9 +39,8 @@ def calculate_tokens(a_presses, b_presses):
     """Calculate total tokens needed for given button presses."""
     return 3 * a_presses + b_presses
 
-def solve_puzzle(input_text):
+def solve_puzzle(machines):
     """Solve the entire puzzle, returning the minimum tokens needed."""
-    machines = parse_input(input_text)
     total_tokens = 0
 
     # solve each machine and calculate tokens
@@ -81,9 +73,8 @@ def solve_machine_algebraically(machine):
 
     return None
 
-def solve_puzzle_part2(input_text):
+def solve_puzzle_part2(machines):
     """Solve the entire puzzle for part 2, returning the minimum tokens needed"""
-    machines = parse_input(input_text)
     offset = 10**13
     total_tokens = 0
 
@@ -101,13 +92,25 @@ def solve_puzzle_part2(input_text):
 
     return total_tokens
 
+def parse(input_text):
+    """Parse the input text into the machines both parts solve"""
+    return parse_input(input_text)
+
+def part1(machines):
+    """Solve part 1 for the parsed machines"""
+    return solve_puzzle(machines)
+
+def part2(machines):
+    """Solve part 2 for the parsed machines"""
+    return solve_puzzle_part2(machines)
+
 def main():
     """Main function"""
-    input_text = read_file()
-    result = solve_puzzle(input_text)
+    machines = parse_input(read_file())
+    result = solve_puzzle(machines)
     print(f"Minimum tokens needed for part 1: {result}")
 
-    result = solve_puzzle_part2(input_text)
+    result = solve_puzzle_part2(machines)
     print(f"Minimum tokens needed for part 2: {result}")
 
 if __name__ == "__main__":
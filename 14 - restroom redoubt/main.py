@@ -1,19 +1,20 @@
-def read_file():
+import sys
+from pathlib import Path
+
+# make the shared aoc package importable when run from this folder
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from aoc.ints import records
+
+def read_file(file_path="input.txt"):
     """Read input"""
-    with open("input.txt", "r") as file:
-        return file.readlines()
-
-def parse_input(lines):
-    """Parse the input lines into a list of robots"""
-    robots = []
-    for line in lines:
-        line = line.strip()
-        # parse the position and velocity of each robot
-        pos_part, vel_part = line.split(" ")
-        px, py = map(int, pos_part[2:].split(","))
-        vx, vy = map(int, vel_part[2:].split(","))
-        robots.append(((px, py), (vx, vy)))
-    return robots
+    with open(file_path, "r") as file:
+        return file.read()
+
+def parse_input(text):
+    """Parse the input text into a list of robots"""
+    # four numbers per robot: position then velocity
+    return [((px, py), (vx, vy)) for px, py, vx, vy in records(text, 4)]
 
 def simulate_robots(robots, width, height, seconds):
     """Simulate the robots after the given seconds"""
@@ -54,13 +55,20 @@ def calculate_safety_factor(robots, width, height, seconds):
         safety_factor *= count
     return safety_factor
 
+def parse(input_text):
+    """Parse the input text into the robots"""
+    return parse_input(input_text)
+
+def part1(robots, width=101, height=103, seconds=100):
+    """Solve part 1: safety factor after the given seconds"""
+    return calculate_safety_factor(robots, width, height, seconds)
+
 def main():
     """Main function"""
     width, height = 101, 103
     seconds = 100
 
-    lines = read_file()
-    robots = parse_input(lines)
+    robots = parse_input(read_file())
 
     safety_factor = calculate_safety_factor(robots, width, height, seconds)
     print("Safety Factor:", safety_factor)
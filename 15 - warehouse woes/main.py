@@ -1,186 +1,150 @@
+import sys
 from collections import defaultdict
+from pathlib import Path
 
-def read_file():
+# make the shared aoc package importable when run from this folder
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from aoc.grid import Grid
+
+BOX, FREE = ord('O'), ord('.')
+BOX_LEFT, BOX_RIGHT = ord('['), ord(']')
+
+def read_file(file_path="input.txt"):
     """Read input"""
-    with open("input.txt") as f:
+    with open(file_path) as f:
         return f.read().strip()
 
-def initialize_grid_and_robot(puzzle_input):
-    """Initializes the grid and robot position from the puzzle input for part 1"""
-    grid, directions = puzzle_input.split('\n\n')
-    grid = [list(row) for row in grid.split('\n')]
-    
+def direction_steps(grid):
+    """Index step for each move character"""
+    up, right, down, left = grid.offsets4
+    return {'^': up, '>': right, 'v': down, '<': left}
+
+def parse(puzzle_input):
+    """Splits the puzzle input into the warehouse map and the robot's moves (line breaks dropped)"""
+    warehouse, directions = puzzle_input.strip().split('\n\n')
+    # each part pushes boxes around its own grid, so only the text is shared
+    return warehouse, ''.join(directions.split())
+
+def initialize_grid_and_robot(warehouse):
+    """Initializes the grid and robot position from the warehouse map for part 1"""
+    grid = Grid.parse(warehouse)
+
     # find the robot's initial position
-    for i in range(len(grid)):
-        for j in range(len(grid[i])):
-            if grid[i][j] == '@':
-                robot = (i, j)
-                grid[i][j] = '.'
-                return grid, robot, directions
-    return grid, None, directions
-
-def move_robot(grid, robot, direction):
-    """Moves the robot in the specified direction for part 1"""
-    i, j = robot
-    if direction == '<':
-        k = j - 1
-        while grid[i][k] == 'O':
-            k -= 1
-        if grid[i][k] == '.':
-            grid[i][k], grid[i][j - 1] = grid[i][j - 1], grid[i][k]
-            return i, j - 1
-    elif direction == '>':
-        k = j + 1
-        while grid[i][k] == 'O':
-            k += 1
-        if grid[i][k] == '.':
-            grid[i][k], grid[i][j + 1] = grid[i][j + 1], grid[i][k]
-            return i, j + 1
-    elif direction == '^':
-        k = i - 1
-        while grid[k][j] == 'O':
-            k -= 1
-        if grid[k][j] == '.':
-            grid[k][j], grid[i - 1][j] = grid[i - 1][j], grid[k][j]
-            return i - 1, j
-    elif direction == 'v':
-        k = i + 1
-        while grid[k][j] == 'O':
-            k += 1
-        if grid[k][j] == '.':
-            grid[k][j], grid[i + 1][j] = grid[i + 1][j], grid[k][j]
-            return i + 1, j
+    robot = grid.find('@')
+    if robot == -1:
+        return grid, None
+    grid[robot] = '.'
+    return grid, robot
+
+def move_robot(grid, robot, step):
+    """Moves the robot one step (an index offset) for part 1"""
+    cells = grid.cells
+    k = robot + step
+    while cells[k] == BOX:
+        k += step
+    if cells[k] == FREE:
+        # the first box (or free cell) in front of the robot swaps with the free cell
+        cells[k], cells[robot + step] = cells[robot + step], cells[k]
+        return robot + step
     return robot
 
-def part1(puzzle_input):
+def gps_total(grid, char):
+    """Sum of the GPS coordinates of every cell holding char"""
+    total = 0
+    for index in grid.find_all(char):
+        row, col = grid.position(index)
+        total += 100 * row + col
+    return total
+
+def part1(parsed):
     """Solves part 1 of the puzzle"""
-    grid, robot, directions = initialize_grid_and_robot(puzzle_input)
-    
+    warehouse, directions = parsed
+    grid, robot = initialize_grid_and_robot(warehouse)
+    steps = direction_steps(grid)
+
     for direction in directions:
-        robot = move_robot(grid, robot, direction)
+        if direction in steps:
+            robot = move_robot(grid, robot, steps[direction])
 
-    total = 0
-    for i in range(len(grid)):
-        for j in range(len(grid[i])):
-            if grid[i][j] == 'O':
-                total += 100 * i + j  
-    
-    return total
+    return gps_total(grid, 'O')
 
-def initialize_part2_grid_and_robot(puzzle_input):
+def initialize_part2_grid_and_robot(warehouse):
     """Initializes the grid and robot position for part 2"""
-    grid, directions = puzzle_input.split('\n\n')
-    grid = [list(row) for row in grid.split('\n')]
-    m, n = len(grid), len(grid[0])
-    
-    # initialize the grid and find the robot's position
-    for i in range(m):
-        for j in reversed(range(n)):
-            if grid[i][j] == '#':
-                grid[i].insert(j, '#')
-            if grid[i][j] == '.':
-                grid[i].insert(j, '.')
-            if grid[i][j] == '@':
-                robot = (i, j * 2)  # adjust for grid expansion
-                grid[i][j:j+1] = ['.', '.']
-            if grid[i][j] == 'O':
-                grid[i][j:j+1] = ['[', ']']
-    return grid, robot, directions, m, n
-
-def move_robot_part2(grid, robot, direction):
+    # everything is twice as wide, except the robot
+    widened = warehouse.translate(str.maketrans({'#': '##', 'O': '[]', '.': '..', '@': '@.'}))
+    grid = Grid.parse(widened)
+    robot = grid.find('@')
+    grid[robot] = '.'
+    return grid, robot
+
+def move_robot_part2(grid, robot, direction, steps):
     """Moves the robot in the specified direction for part 2"""
-    i, j = robot
+    cells = grid.cells
+    step = steps.get(direction)
     if direction == '<':
-        k = j - 1
-        while grid[i][k] == ']':
+        k = robot - 1
+        while cells[k] == BOX_RIGHT:
             k -= 2
-        if grid[i][k] == '.':
-            for l in range(k, j):
-                grid[i][l] = grid[i][l + 1]
-            return i, j - 1
+        if cells[k] == FREE:
+            cells[k:robot] = cells[k + 1:robot + 1]
+            return robot - 1
     elif direction == '>':
-        k = j + 1
-        while grid[i][k] == '[':
+        k = robot + 1
+        while cells[k] == BOX_LEFT:
             k += 2
-        if grid[i][k] == '.':
-            for l in reversed(range(j + 1, k + 1)):
-                grid[i][l] = grid[i][l - 1]
-            return i, j + 1
-    elif direction == '^':
-        return move_robot_up(grid, i, j)
-    elif direction == 'v':
-        return move_robot_down(grid, i, j)
+        if cells[k] == FREE:
+            cells[robot + 1:k + 1] = cells[robot:k]
+            return robot + 1
+    elif direction in ('^', 'v'):
+        return move_robot_vertical(grid, robot, step)
     return robot
 
-def move_robot_up(grid, i, j):
-    """Moves the robot up in part 2"""
-    queue = {(i - 1, j)}
-    rows = defaultdict(set)
-    while queue:
-        x, y = queue.pop()
-        match grid[x][y]:
-            case '#':
-                break
-            case ']':
-                rows[x] |= {y - 1, y}
-                queue |= {(x - 1, y), (x - 1, y - 1)}
-            case '[':
-                rows[x] |= {y, y + 1}
-                queue |= {(x - 1, y), (x - 1, y + 1)}
-            case '.':
-                rows[x].add(y)
-    else:
-        for x in sorted(rows):
-            for y in rows[x]:
-                grid[x][y] = grid[x + 1][y] if y in rows[x + 1] else '.'
-        return i - 1, j
-    return i, j
-
-def move_robot_down(grid, i, j):
-    """Moves the robot down in part 2"""
-    queue = {(i + 1, j)}
+def move_robot_vertical(grid, robot, step):
+    """Moves the robot up or down (step is the index offset) in part 2, pushing every box it touches"""
+    cells = grid.cells
+    stride = grid.stride
+    queue = {robot + step}
     rows = defaultdict(set)
     while queue:
-        x, y = queue.pop()
-        match grid[x][y]:
+        current = queue.pop()
+        match grid[current]:
             case '#':
                 break
             case ']':
-                rows[x] |= {y - 1, y}
-                queue |= {(x + 1, y), (x + 1, y - 1)}
+                rows[current // stride] |= {current - 1, current}
+                queue |= {current + step, current + step - 1}
             case '[':
-                rows[x] |= {y, y + 1}
-                queue |= {(x + 1, y), (x + 1, y + 1)}
+                rows[current // stride] |= {current, current + 1}
+                queue |= {current + step, current + step + 1}
             case '.':
-                rows[x].add(y)
+                rows[current // stride].add(current)
     else:
-        for x in sorted(rows, reverse=True):
-            for y in rows[x]:
-                grid[x][y] = grid[x - 1][y] if y in rows[x - 1] else '.'
-        return i + 1, j
-    return i, j
+        # shift the rows furthest from the robot first
+        for row in sorted(rows, reverse=step > 0):
+            behind = rows[row - step // stride]
+            for index in rows[row]:
+                cells[index] = cells[index - step] if index - step in behind else FREE
+        return robot + step
+    return robot
 
-def part2(puzzle_input):
+def part2(parsed):
     """Solves part 2 of the puzzle"""
-    grid, robot, directions, m, n = initialize_part2_grid_and_robot(puzzle_input)
-    
-    for direction in directions:
-        robot = move_robot_part2(grid, robot, direction)
+    warehouse, directions = parsed
+    grid, robot = initialize_part2_grid_and_robot(warehouse)
+    steps = direction_steps(grid)
 
-    total = 0
-    for i in range(m):
-        for j in range(n * 2):  # account for grid expansion
-            if grid[i][j] == '[':
-                total += 100 * i + j
+    for direction in directions:
+        robot = move_robot_part2(grid, robot, direction, steps)
 
-    return total
+    return gps_total(grid, '[')
 
 def main():
     """Main function."""
-    puzzle_input = read_file()
-    result_part1 = part1(puzzle_input)
+    parsed = parse(read_file())
+    result_part1 = part1(parsed)
     print(f"Part 1 result: {result_part1}")
-    result_part2 = part2(puzzle_input)
+    result_part2 = part2(parsed)
     print(f"Part 2 result: {result_part2}")
 
 if __name__ == "__main__":
@@ -1,80 +1,85 @@
-import heapq
+import sys
+from pathlib import Path
 
-# directions and their movements (dx, dy)
+# make the shared aoc package importable when run from this folder
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from aoc import instrument
+from aoc.grid import Grid, OUTSIDE
+from aoc.search import dijkstra
+
+# directions in clockwise order, starting facing east
 DIRECTIONS = ['E', 'S', 'W', 'N']
-DIR_MOVES = {
-    'E': (0, 1),
-    'S': (1, 0),
-    'W': (0, -1),
-    'N': (-1, 0)
-}
-
-def read_input():
+WALL = ord('#')
+
+def read_input(file_path="input.txt"):
+    """Read the maze input file"""
+    with open(file_path, 'r') as f:
+        return parse_maze(f.read())
+
+def parse_maze(input_text):
     """Go through maze input and locate start (S) and end (E) positions"""
-    with open("input.txt", 'r') as f:
-        grid = [list(line.strip()) for line in f.readlines()]
-    
-    start = end = None
-    for i, row in enumerate(grid):
-        for j, cell in enumerate(row):
-            if cell == 'S':
-                start = (i, j)
-            elif cell == 'E':
-                end = (i, j)
-    return grid, start, end
+    grid = Grid.parse(input_text)
+    return grid, grid.find('S'), grid.find('E')
+
+def direction_steps(grid):
+    """Index step for each direction, in DIRECTIONS order"""
+    up, right, down, left = grid.offsets4
+    return (right, down, left, up)
 
 def turn(direction, turn_type):
-    """Turn 90 degrees"""
-    idx = DIRECTIONS.index(direction)
+    """Turn 90 degrees (directions are indices into DIRECTIONS)"""
     if turn_type == 'clockwise':
-        return DIRECTIONS[(idx + 1) % 4]
+        return (direction + 1) % 4
     elif turn_type == 'counterclockwise':
-        return DIRECTIONS[(idx - 1) % 4]
+        return (direction - 1) % 4
 
-def is_valid(grid, x, y):
+def is_valid(grid, position):
     """Check if a position is within bounds and not a wall"""
-    return 0 <= x < len(grid) and 0 <= y < len(grid[0]) and grid[x][y] != '#'
+    cell = grid.cells[position]
+    return cell != WALL and cell != OUTSIDE
 
-def find_lowest_score():
+def find_lowest_score(grid, start, end):
     """Find the lowest score to navigate the maze"""
-    grid, start, end = read_input()
-    start_x, start_y = start
-    end_x, end_y = end
-    
-    # priority queue for A* search: (cost, x, y, direction)
-    heap = [(0, start_x, start_y, 'E')]
-    visited = set()  # keep track of visited states (x, y, direction)
-    
-    while heap:
-        cost, x, y, direction = heapq.heappop(heap)
-        
-        # if we reach the end position, return cost
-        if (x, y) == (end_x, end_y):
-            return cost
-        
-        # skip if already visited
-        if (x, y, direction) in visited:
-            continue
-        visited.add((x, y, direction))
-        
+    steps = direction_steps(grid)
+
+    # search states are position * 4 + direction
+    def moves(state):
+        position, direction = divmod(state, 4)
         # move forward in the current direction
-        dx, dy = DIR_MOVES[direction]
-        new_x, new_y = x + dx, y + dy
-        if is_valid(grid, new_x, new_y):
-            heapq.heappush(heap, (cost + 1, new_x, new_y, direction))
-        
+        new_position = position + steps[direction]
+        if is_valid(grid, new_position):
+            yield new_position * 4 + direction, 1
         # rotate clockwise and counterclockwise
-        clockwise_dir = turn(direction, 'clockwise')
-        counterclockwise_dir = turn(direction, 'counterclockwise')
-        
-        heapq.heappush(heap, (cost + 1000, x, y, clockwise_dir))
-        heapq.heappush(heap, (cost + 1000, x, y, counterclockwise_dir))
-    
+        yield position * 4 + turn(direction, 'clockwise'), 1000
+        yield position * 4 + turn(direction, 'counterclockwise'), 1000
+
+    start_state = start * 4 + DIRECTIONS.index('E')
+    end_states = {end * 4 + direction for direction in range(4)}
+    with instrument.section("dijkstra"):
+        result = dijkstra(moves, [start_state], len(grid.cells) * 4, end_states, max_weight=1000)
+
+    # the search keeps its own counts, so recording them costs nothing in the loop
+    recorder = instrument.current()
+    if recorder is not None:
+        recorder.count_all("dijkstra", result.stats.as_dict())
+
+    # if we reach the end position, return cost
+    if result.target is not None:
+        return result.distances[result.target]
     return -1  # no path (shouldn't happen)
 
+def parse(input_text):
+    """Parse the input text into the maze and its start and end"""
+    return parse_maze(input_text)
+
+def part1(maze):
+    """Solve part 1: lowest score through the maze"""
+    return find_lowest_score(*maze)
+
 def main():
     """Main function"""
-    result = find_lowest_score()
+    result = find_lowest_score(*read_input())
     print(f"Lowest Score: {result}")
 
 if __name__ == "__main__":
@@ -1,15 +1,20 @@
-def read_input():
-    """Reads the input file"""
-    with open("input.txt", 'r') as file:
-        lines = file.readlines()
+import sys
+from pathlib import Path
+
+# make the shared aoc package importable when run from this folder
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from aoc.ints import int_list
 
-    # extract registers
-    register_a = int(lines[0].split(":")[1].strip())
-    register_b = int(lines[1].split(":")[1].strip())
-    register_c = int(lines[2].split(":")[1].strip())
+def read_input(file_path="input.txt"):
+    """Reads the input file"""
+    with open(file_path, 'r') as file:
+        return parse_input(file.read())
 
-    # extract program
-    program = list(map(int, lines[4].split(":")[1].strip().split(',')))
+def parse_input(input_text):
+    """Parses the registers and program from the input text"""
+    # the three registers come first, then every number of the program
+    register_a, register_b, register_c, *program = int_list(input_text, signed=False)
 
     return register_a, register_b, register_c, program
 
@@ -78,6 +83,15 @@ def combo_operand_value(operand, registers):
     elif operand == 6:
         return registers['C']
 
+def parse(input_text):
+    """Parse the input text into the registers and program"""
+    return parse_input(input_text)
+
+def part1(computer):
+    """Solve part 1: comma-joined program output"""
+    output = execute_program(*computer)
+    return ",".join(map(str, output))
+
 def main():
     """Main function"""
     # read input
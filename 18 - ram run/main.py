@@ -1,69 +1,107 @@
-from collections import deque
+import sys
+from pathlib import Path
 
-DIRS = [(0, 1), (0, -1), (1, 0), (-1, 0)]
+# make the shared aoc package importable when run from this folder
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 
-def read_file():
+from aoc import cancel
+from aoc.bitset import BitArray
+from aoc.grid import Grid
+from aoc.ints import records
+from aoc.search import bfs_grid
+
+def read_file(file_path="input.txt"):
     """Read input"""
-    with open("input.txt", "r") as file:
-        return [tuple(map(int, line.strip().split(','))) for line in file]
+    with open(file_path, "r") as file:
+        return parse_input(file.read())
+
+def parse_input(input_text):
+    """Parse the input text into a list of byte positions"""
+    return records(input_text, 2, signed=False)
 
-def simulate_memory_space(byte_positions):
+def simulate_memory_space(byte_positions, grid_size=71):
     """
     Simulates the memory space after bytes fall.
     """
-    corrupted = set()
+    memory = Grid(grid_size, grid_size)
     for x, y in byte_positions:
-        corrupted.add((x, y))
-    return corrupted
+        memory[memory.index(y, x)] = '#'
+    return memory
 
-def bfs_shortest_path(corrupted, grid_size=71):
+def bfs_shortest_path(memory):
     """
-    Finds the shortest path from (0,0) to (grid_size-1,grid_size-1) using BFS.
+    Finds the shortest path from the top-left to the bottom-right corner using BFS.
     """
-    start = (0, 0)
-    end = (grid_size - 1, grid_size - 1)
-    queue = deque([(start, 0)])  # (current_position, steps)
-    visited = set()
-    visited.add(start)
-
-    while queue:
-        (x, y), steps = queue.popleft()
-
-        # if we've reached the end, return the steps taken
-        if (x, y) == end:
-            return steps
-
-        # explore neighbors
-        for dx, dy in DIRS:
-            nx, ny = x + dx, y + dy
-            if 0 <= nx < grid_size and 0 <= ny < grid_size:  # stay within bounds
-                # if the neighbor is not corrupted and not visited
-                if (nx, ny) not in corrupted and (nx, ny) not in visited:
-                    visited.add((nx, ny))
-                    queue.append(((nx, ny), steps + 1))
+    start = memory.index(0, 0)
+    end = memory.index(memory.height - 1, memory.width - 1)
+    # safe means not corrupted and not off the grid
+    result = bfs_grid(memory.cells, memory.offsets4, b'.', [start], targets={end})
+
+    # if we've reached the end, return the steps taken
+    if result.target is not None:
+        return result.distances[end]
 
     # if no path exists (shouldn't happen w/ input)
     return -1
 
+def shortest_path_cells(memory):
+    """
+    Finds the cells of one shortest path to the bottom-right corner, one bit
+    per cell, or None if the exit can't be reached.
+    """
+    start = memory.index(0, 0)
+    end = memory.index(memory.height - 1, memory.width - 1)
+    result = bfs_grid(memory.cells, memory.offsets4, b'.', [start], targets={end}, track_parents=True)
+    if result.target is None:
+        return None
+
+    path = BitArray(len(memory.cells))
+    for index in result.path(end):
+        path.add(index)
+    return path
+
 def find_blocking_byte(byte_positions, grid_size=71):
     """Finds the first byte that blocks the path to the exit"""
-    corrupted = set()
+    memory = Grid(grid_size, grid_size)
+    path = shortest_path_cells(memory)
+    budget = cancel.current()
+
+    for fallen, (x, y) in enumerate(byte_positions):
+        index = memory.index(y, x)
+        memory[index] = '#'
+
+        # a byte landing off the current path leaves that path open, so the
+        # search only runs again when the path itself gets cut
+        if index in path:
+            if budget is not None:
+                # a cancelled run reports how many bytes fell without blocking the exit
+                budget.progress["bytes_fallen"] = fallen
+                budget.check()
+            path = shortest_path_cells(memory)
+            if path is None:
+                return (x, y)
 
-    for x, y in byte_positions:
-        corrupted.add((x, y))
+    return None  # this shouldn't happen with our input, just in case
 
-        # check if there's still a path to the exit
-        if bfs_shortest_path(corrupted, grid_size) == -1:
-            return (x, y)
+def parse(input_text):
+    """Parse the input text into the byte positions both parts drop"""
+    return parse_input(input_text)
 
-    return None  # this shouldn't happen with our input, just in case
+def part1(byte_positions, grid_size=71, fallen=1024):
+    """Solve part 1: minimum steps after the first bytes have fallen"""
+    return bfs_shortest_path(simulate_memory_space(byte_positions[:fallen], grid_size))
+
+def part2(byte_positions, grid_size=71):
+    """Solve part 2: coordinates of the first byte that blocks the exit"""
+    blocking_byte = find_blocking_byte(byte_positions, grid_size)
+    return f"{blocking_byte[0]},{blocking_byte[1]}"
 
 def main():
     byte_positions = read_file()
 
     # memory space with corrupted positions and find the shortest path
-    corrupted = simulate_memory_space(byte_positions[:1024])
-    shortest_path = bfs_shortest_path(corrupted)
+    memory = simulate_memory_space(byte_positions[:1024])
+    shortest_path = bfs_shortest_path(memory)
     print(f"Minimum Steps: {shortest_path}")
 
     # find the first blocking byte
@@ -1,11 +1,11 @@
-def read_file():
+def read_file(file_path="input.txt"):
     """Reads input"""
-    with open("input.txt", "r") as file:
+    with open(file_path, "r") as file:
         return file.read()
 
 def parse_input(input_data):
     """Parses the input data into towel patterns and designs"""
-    towel_patterns_section, designs_section = input_data.split('\n\n')
+    towel_patterns_section, designs_section = input_data.strip().split('\n\n')
     towel_patterns = towel_patterns_section.split(', ')
     designs = designs_section.split('\n')
     return towel_patterns, designs
@@ -69,6 +69,20 @@ def count_all_possible_ways(designs, towel_patterns):
         total_ways += count_ways_to_form_design(design, towel_patterns)
     return total_ways
 
+def parse(input_text):
+    """Parses the input text into the towel patterns and designs both parts check"""
+    return parse_input(input_text)
+
+def part1(parsed):
+    """Solves part 1: number of designs that can be formed"""
+    towel_patterns, designs = parsed
+    return count_possible_designs(designs, towel_patterns)
+
+def part2(parsed):
+    """Solves part 2: total number of ways to form all designs"""
+    towel_patterns, designs = parsed
+    return count_all_possible_ways(designs, towel_patterns)
+
 def main():
     """Main function"""
     input_data = read_file()
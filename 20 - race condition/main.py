@@ -1,127 +1,172 @@
-from collections import deque, defaultdict
+import os
+import sys
+from array import array
+from collections import defaultdict
+from dataclasses import dataclass
+from pathlib import Path
 
-DIRECTIONS = [(0, 1), (0, -1), (1, 0), (-1, 0)]
+# make the shared aoc package importable when run from this folder
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 
-def read_grid():
+from aoc import cache
+from aoc.grid import Grid
+from aoc.search import bfs_grid
+from aoc.shared import map_shared
+
+# longest cheat in the puzzle; the grid is padded this wide so cheats never leave it
+MAX_CHEAT = 20
+TRACK = b'.SE'
+
+# track slices per worker when cheats are counted in parallel, so a slow slice doesn't hold up the rest
+CHUNKS_PER_WORKER = 4
+
+@dataclass
+class Race:
+    grid: Grid
+    start: int
+    end: int
+    # distances along the track from the start and to the end (-1 off the track)
+    start_distances: list
+    end_distances: list
+
+def read_input(file_path="input.txt"):
     """Read input"""
-    grid = []
-    with open("input.txt") as f:
-        for line in f:
-            grid.append(list(line.strip()))
-    return grid
+    with open(file_path) as f:
+        return f.read()
+
+def parse_grid(input_text, pad=MAX_CHEAT):
+    """Parse the input text into a grid"""
+    return Grid.parse(input_text, pad=pad)
 
 def find_start_end(grid):
     """Find start and end positions"""
-    for i in range(len(grid)):
-        for j in range(len(grid[0])):
-            if grid[i][j] == 'S':
-                start = (i, j)
-            elif grid[i][j] == 'E':
-                end = (i, j)
-    return start, end
+    return grid.find('S'), grid.find('E')
 
 def bfs_distances(grid, start):
-    """Calculate distances from start to all points using bfs"""
-    rows, cols = len(grid), len(grid[0])
-    distances = {}
-    queue = deque([(start, 0)])
-    distances[start] = 0
+    """Calculate distances from start to all points using bfs (-1 where unreachable)"""
+    # only track cells can be entered (not walls or off the grid)
+    return bfs_grid(grid.cells, grid.offsets4, TRACK, [start]).distances
+
+def cached_distances(grid, start):
+    """bfs_distances, reused from the artifact cache when the same track was seen before"""
+    return cache.cached(
+        "race-distances",
+        (grid.cells, grid.stride, start),
+        lambda: bfs_distances(grid, start),
+    )
+
+def cheat_offsets(grid, max_steps):
+    """Index offsets of every cell within max_steps of a cheat start, with their distance"""
+    offsets = []
+    for dr in range(-max_steps, max_steps + 1):
+        reach = max_steps - abs(dr)
+        for dc in range(-reach, reach + 1):
+            if dr or dc:
+                offsets.append((grid.offset(dr, dc), abs(dr) + abs(dc)))
+    return offsets
+
+def parse_race(input_text):
+    """Parse the input text into the race, with the distances both parts measure cheats by"""
+    grid = parse_grid(input_text)
+    start, end = find_start_end(grid)
+    return Race(grid, start, end, cached_distances(grid, start), cached_distances(grid, end))
+
+def track_positions(race):
+    """Index of every track cell, the cells a cheat can start from"""
+    start_distances = race.start_distances
+    return array('q', (index for index in race.grid.scan() if start_distances[index] >= 0))
+
+def count_savings(start_distances, end_distances, positions, offsets, base_time):
+    """Count the cheats starting at the given track positions by the time they save"""
+    savings = defaultdict(int)
     
-    # bfs
-    while queue:
-        pos, dist = queue.popleft() # (position, distance)
-        r, c = pos
+    for pos1 in positions:
+        time_to_cheat = start_distances[pos1]
         
-        # check all 4 directions
-        for dr, dc in DIRECTIONS:
-            new_r, new_c = r + dr, c + dc
-            new_pos = (new_r, new_c)
-            
-            # valid position, not a wall, and not visited yet
-            if (0 <= new_r < rows and 0 <= new_c < cols and 
-                grid[new_r][new_c] in '.SE' and 
-                new_pos not in distances):
-                distances[new_pos] = dist + 1
-                queue.append((new_pos, dist + 1))
+        for delta, steps in offsets:
+            # the cheat must end back on the track
+            time_from_cheat = end_distances[pos1 + delta]
+            if time_from_cheat >= 0:
+                total_time = time_to_cheat + steps + time_from_cheat
+                if total_time < base_time:
+                    savings[base_time - total_time] += 1
     
-    return distances
+    return savings
 
-def find_cheats(grid, start, end, max_steps):
-    """Find all cheats that save time"""
-    rows, cols = len(grid), len(grid[0])
-    
-    start_distances = bfs_distances(grid, start)
-    end_distances = bfs_distances(grid, end)
+def count_savings_shared(views, task):
+    """Worker side of find_cheats: count_savings over one slice of the shared track"""
+    start, stop, base_time = task
+    offsets = list(zip(views["deltas"], views["steps"]))
+    return count_savings(views["start"], views["end"], views["track"][start:stop], offsets, base_time)
+
+def find_cheats(race, max_steps, workers=1):
+    """Find all cheats that save time, splitting the track over worker processes if asked"""
+    grid = race.grid
+    if max_steps > grid.pad:
+        raise ValueError(f"grid padding ({grid.pad}) must cover the cheat length ({max_steps})")
     
-    base_time = start_distances[end]
-    savings = defaultdict(int)
+    base_time = race.start_distances[race.end]
     
-    # track unique cheats by start/end positions
-    seen_cheats = set()
+    # with no walls in the way a cheat takes manhattan-distance steps, so the cells a cheat
+    # can end on are a fixed diamond of offsets; each start/end pair is visited exactly once
+    offsets = cheat_offsets(grid, max_steps)
+    positions = track_positions(race)
     
-    for r1 in range(rows):
-        for c1 in range(cols):
-            if grid[r1][c1] not in '.SE':
-                continue
-                
-            pos1 = (r1, c1)
-            if pos1 not in start_distances:
-                continue
-                
-            time_to_cheat = start_distances[pos1]
-            
-            seen = {pos1}
-            queue = deque([(r1, c1, 0)])
-            
-            while queue:
-                r2, c2, steps = queue.popleft()  # bfs for part 2
-                pos2 = (r2, c2)
-                
-                if steps > max_steps:
-                    continue
-                
-                if steps > 0 and grid[r2][c2] in '.SE' and pos2 in end_distances:
-                    # only count each unique cheat (start/end position pair) once
-                    cheat_key = (pos1, pos2)
-                    # check if we haven't seen this cheat before
-                    if cheat_key not in seen_cheats:
-                        total_time = time_to_cheat + steps + end_distances[pos2]
-                        if total_time < base_time:
-                            savings[base_time - total_time] += 1
-                            seen_cheats.add(cheat_key)
-                
-                if steps < max_steps:
-                    for dr, dc in DIRECTIONS:
-                        new_r, new_c = r2 + dr, c2 + dc
-                        new_pos = (new_r, new_c)
-                        
-                        # valid position, not a wall, and not visited yet
-                        if (0 <= new_r < rows and 0 <= new_c < cols and 
-                            new_pos not in seen):
-                            seen.add(new_pos)
-                            queue.append((new_r, new_c, steps + 1))
+    if workers <= 1:
+        return count_savings(race.start_distances, race.end_distances, positions, offsets, base_time)
     
+    # the distance fields go to the workers once, through shared memory; each task
+    # is just a slice of the track, however big the grid
+    arrays = {
+        "start": race.start_distances,
+        "end": race.end_distances,
+        "track": positions,
+        "deltas": array('q', (delta for delta, _ in offsets)),
+        "steps": array('q', (steps for _, steps in offsets)),
+    }
+    chunk = max(1, -(-len(positions) // (workers * CHUNKS_PER_WORKER)))
+    tasks = [
+        (start, min(start + chunk, len(positions)), base_time)
+        for start in range(0, len(positions), chunk)
+    ]
+    savings = defaultdict(int)
+    for partial_savings in map_shared(count_savings_shared, arrays, tasks, workers):
+        for saved, count in partial_savings.items():
+            savings[saved] += count
     return savings
 
-def solve_part1(grid, start, end):
+def solve_part1(race, workers=1):
     """Solve part 1: cheats up to 2 steps"""
-    savings = find_cheats(grid, start, end, max_steps=2)
+    savings = find_cheats(race, max_steps=2, workers=workers)
     return sum(count for saved, count in savings.items() if saved >= 100)
 
-def solve_part2(grid, start, end):
+def solve_part2(race, workers=1):
     """Solve part 2: cheats up to 20 steps"""
-    savings = find_cheats(grid, start, end, max_steps=20)
+    savings = find_cheats(race, max_steps=20, workers=workers)
     return sum(count for saved, count in savings.items() if saved >= 100)
 
+def parse(input_text):
+    """Parse the input text into the race"""
+    return parse_race(input_text)
+
+def part1(race, workers=1):
+    """Solve part 1 for the parsed race"""
+    return solve_part1(race, workers)
+
+def part2(race, workers=1):
+    """Solve part 2 for the parsed race"""
+    return solve_part2(race, workers)
+
 def main():
     """Main function"""
-    grid = read_grid()
-    start, end = find_start_end(grid)
+    race = parse_race(read_input())
+    workers = os.cpu_count() or 1
     
-    part1_result = solve_part1(grid, start, end)
+    part1_result = solve_part1(race)
     print(f"Part 1 - >= 100 picoseconds: {part1_result}")
     
-    part2_result = solve_part2(grid, start, end)
+    # part 2's cheat diamond is 200 times bigger, worth spreading over every core
+    part2_result = solve_part2(race, workers)
     print(f"Part 2 - >= 100 picoseconds: {part2_result}")
 
 if __name__ == "__main__":
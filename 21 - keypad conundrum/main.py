@@ -93,15 +93,36 @@ def num_solve(key_start, key_end):
     memo_num[key_start, key_end] = min_score
     return min_inputs
 
+def num_cost(key_start, key_end):
+    """Length of the shortest input for a numpad move, solved once per pair"""
+    if (key_start, key_end) not in memo_num:
+        num_solve(key_start, key_end)
+    return memo_num[key_start, key_end]
+
+def warm():
+    """Fill the numpad cost table for every key pair, so later codes are pure lookups"""
+    keys = [key for key in numpad_lookup if key != ' ']
+    for key_start in keys:
+        for key_end in keys:
+            num_cost(key_start, key_end)
+
 def calculate_score(codes):
     """Calculate the score of the codes"""
     out = 0
     for code in codes:
         m = int(code[:-1])
-        s = ''.join(num_solve(a, b) for a, b in pairwise("A" + code))
-        out += len(s) * m
+        length = sum(num_cost(a, b) for a, b in pairwise("A" + code))
+        out += length * m
     return out
 
+def parse(input_text):
+    """Parse the input text into the door codes"""
+    return input_text.strip().splitlines()
+
+def part1(codes):
+    """Solve part 1 for the parsed codes"""
+    return calculate_score(codes)
+
 def main():
     with open("input.txt") as file:
         codes = file.read().splitlines()
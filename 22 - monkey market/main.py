@@ -1,7 +1,19 @@
-def read_file():
+import sys
+from pathlib import Path
+
+# make the shared aoc package importable when run from this folder
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from aoc.ints import ints
+
+def read_file(file_path="input.txt"):
     """Read input"""
-    with open("input.txt", "r") as file:
-        return [int(line.strip()) for line in file.readlines()]
+    with open(file_path, "r") as file:
+        return parse_input(file.read())
+
+def parse_input(input_text):
+    """Parse the input text into the initial secret numbers"""
+    return ints(input_text, signed=False)
 
 def next_secret_number(secret_number):
     """
@@ -30,6 +42,14 @@ def simulate_buyer(secret_number, steps):
         secret_number = next_secret_number(secret_number)
     return secret_number
 
+def parse(input_text):
+    """Parse the input text into the buyers' initial secret numbers"""
+    return parse_input(input_text)
+
+def part1(buyers, steps=2000):
+    """Solve part 1: sum of each buyer's 2000th secret number"""
+    return sum(simulate_buyer(buyer, steps) for buyer in buyers)
+
 def main():
     """Main function"""
     buyers = read_file()
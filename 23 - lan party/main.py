@@ -1,34 +1,55 @@
-from collections import defaultdict
+import sys
+from dataclasses import dataclass
+from pathlib import Path
 
-def read_file():
+# make the shared aoc package importable when run from this folder
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from aoc import cancel, instrument
+from aoc.bitset import Bitset, Index
+
+def read_file(file_path="input.txt"):
     """Read input"""
-    with open("input.txt", "r") as file:
-        return [line.strip() for line in file.readlines()]
+    with open(file_path, "r") as file:
+        return parse_input(file.read())
+
+def parse_input(input_text):
+    """Parse the input text into a list of connections"""
+    return [line.strip() for line in input_text.splitlines() if line.strip()]
     
+@dataclass
+class Network:
+    computers: Index
+    # each computer's neighbours as a Bitset of their Index positions
+    neighbors: list
+
 def build_adjacency_list(connections):
-    """Builds an adjacency list from the connections"""
-    graph = defaultdict(set)
-    for connection in connections:
-        a, b = connection.split("-")
-        graph[a].add(b)
-        graph[b].add(a)
-    return graph
-
-def find_interconnected_sets(connections):
+    """Builds the network's adjacency bitsets from the connections"""
+    pairs = [connection.split("-") for connection in connections]
+    # numbering the computers in name order makes bit order name order too
+    computers = Index(sorted({name for pair in pairs for name in pair}))
+    adjacent = {name: [] for name in computers.keys}
+    for a, b in pairs:
+        adjacent[a].append(b)
+        adjacent[b].append(a)
+    neighbors = [computers.bitset(adjacent[name]) for name in computers.keys]
+    return Network(computers, neighbors)
+
+def find_interconnected_sets(network):
     """Finds all sets of three interconnected computers"""
-    graph = build_adjacency_list(connections)
+    names = network.computers.keys
+    neighbors = network.neighbors
 
-    # find sets of three interconnected computers (triangles)
+    # find sets of three interconnected computers (triangles), each from its
+    # first computer in name order, so the trio comes out sorted
     sets_of_three = set()
-    for node in graph:
-        for neighbor in graph[node]:
-            # ensure each edge processed only once
-            if node < neighbor:
-                # find common neighbors (intersection of two sets)
-                common_neighbors = graph[node] & graph[neighbor]
-                for common in common_neighbors:
-                    trio = tuple(sorted([node, neighbor, common]))
-                    sets_of_three.add(trio)
+    for node, node_neighbors in enumerate(neighbors):
+        later = node_neighbors.above(node)
+        for neighbor in later:
+            # common neighbours after both (intersection of two bitsets)
+            common_neighbors = (later & neighbors[neighbor]).above(neighbor)
+            for common in common_neighbors:
+                sets_of_three.add((names[node], names[neighbor], names[common]))
 
     return sets_of_three
 
@@ -36,38 +57,75 @@ def filter_by_t(sets_of_three):
     """Filters sets to include only those with at least one computer starting with t"""
     return [trio for trio in sets_of_three if any(computer.startswith('t') for computer in trio)]
 
-def find_largest_clique(connections):
+def find_largest_clique(network):
     """Finds the largest set of computers where each is connected to every other (a clique)."""
-    graph = build_adjacency_list(connections)
+    neighbors = network.neighbors
+    recorder = instrument.current()
+    budget = cancel.current()
     
-    # bron-kerbosch algorithm for finding all maximal cliques
+    # bron-kerbosch algorithm for finding all maximal cliques, with r, p and x
+    # as bitsets so each step is a couple of int operations
     def bron_kerbosch(r, p, x):
+        if recorder is not None:
+            # r grows by one node per level, so its size is the recursion depth
+            recorder.count("bron_kerbosch.calls")
+            recorder.maximum("bron_kerbosch.depth", len(r))
+        if budget is not None:
+            budget.tick()
         if not p and not x:
             cliques.append(r)
+            if budget is not None:
+                # a cancelled search reports the biggest clique it had found
+                budget.progress["cliques"] = len(cliques)
+                budget.progress["largest_clique"] = max(
+                    budget.progress.get("largest_clique", 0), len(r)
+                )
             return
-        for node in list(p):
-            bron_kerbosch(r | {node}, p & graph[node], x & graph[node])
-            p.remove(node)
-            x.add(node)
+        # any maximal clique holds the pivot or one of its non-neighbours, so only
+        # those branch; the pivot with the most candidate neighbours prunes the most
+        pivot = max(p | x, key=lambda node: len(p & neighbors[node]))
+        for node in p - neighbors[pivot]:
+            member = Bitset.from_indices([node])
+            bron_kerbosch(r | member, p & neighbors[node], x & neighbors[node])
+            p -= member
+            x |= member
 
     cliques = []
-    bron_kerbosch(set(), set(graph.keys()), set())
+    with instrument.section("bron_kerbosch"):
+        bron_kerbosch(Bitset(), Bitset.from_indices(range(len(neighbors))), Bitset())
+    if recorder is not None:
+        recorder.count("bron_kerbosch.cliques", len(cliques))
 
     # find the largest clique
     largest_clique = max(cliques, key=len)
-    return largest_clique
+    return network.computers.keys_of(largest_clique)
+
+def parse(input_text):
+    """Parse the input text into the network both parts search"""
+    with instrument.section("build_adjacency_list"):
+        return build_adjacency_list(parse_input(input_text))
+
+def part1(network):
+    """Solve part 1: sets of three containing a computer starting with t"""
+    sets_of_three = find_interconnected_sets(network)
+    return len(filter_by_t(sets_of_three))
+
+def part2(network):
+    """Solve part 2: password to the LAN party"""
+    largest_clique = find_largest_clique(network)
+    return ",".join(sorted(largest_clique))
 
 def main():
     """Main function"""
-    connections = read_file()
+    network = build_adjacency_list(read_file())
 
     # sets of three interconnected computers
-    sets_of_three = find_interconnected_sets(connections)
+    sets_of_three = find_interconnected_sets(network)
     sets_with_t = filter_by_t(sets_of_three)
     print(f"Total sets with at least one 't': {len(sets_with_t)}")
 
     # largest clique
-    largest_clique = find_largest_clique(connections)
+    largest_clique = find_largest_clique(network)
     password = ",".join(sorted(largest_clique))
     print(f"Password to the LAN party: {password}")
 
@@ -1,3 +1,4 @@
+from collections import defaultdict, deque
 from dataclasses import dataclass
 
 @dataclass
@@ -8,16 +9,37 @@ class Operation:
     result: str
 
 class CircuitProcessor:
-    def __init__(self, input_file):
+    def __init__(self, input_file=None):
         self.wires = {}
         self.operations = []
         self.wrong_wires = set()
         self.highest_z_wire = "z00"
-        self.load_circuit(input_file)
+        if input_file is not None:
+            self.load_circuit(input_file)
+
+    @classmethod
+    def from_text(cls, input_text):
+        """Create a processor from circuit data already in memory"""
+        processor = cls()
+        processor.load_circuit_text(input_text)
+        return processor
+
+    def copy(self):
+        """A processor with its own wire values and findings, sharing the (read-only) operations"""
+        processor = CircuitProcessor()
+        processor.wires = dict(self.wires)
+        processor.operations = self.operations
+        processor.highest_z_wire = self.highest_z_wire
+        return processor
 
     def load_circuit(self, input_file):
         """Load and parse circuit data from input file"""
-        data = open(input_file).read().split("\n")
+        with open(input_file) as file:
+            self.load_circuit_text(file.read())
+
+    def load_circuit_text(self, input_text):
+        """Parse circuit data from input text"""
+        data = input_text.split("\n")
         for line in self.parse_circuit_data(data):
             if ":" in line:
                 self.process_wire_assignment(line)
@@ -92,16 +114,30 @@ class CircuitProcessor:
 
     def process_circuit(self):
         """Process all circuit operations until all wires have values"""
-        while self.operations:
-            op = self.operations.pop(0)
-            if op.input1 in self.wires and op.input2 in self.wires:
-                self.wires[op.result] = self.execute_operation(
-                    op.operator,
-                    self.wires[op.input1],
-                    self.wires[op.input2]
-                )
-            else:
-                self.operations.append(op)
+        # count the unset inputs of each operation and index them by wire, so an
+        # operation runs exactly once, as soon as its last input gets a value
+        waiting_on = defaultdict(list)
+        missing_inputs = []
+        ready = deque()
+        for index, op in enumerate(self.operations):
+            missing = {wire for wire in (op.input1, op.input2) if wire not in self.wires}
+            missing_inputs.append(len(missing))
+            for wire in missing:
+                waiting_on[wire].append(index)
+            if not missing:
+                ready.append(index)
+
+        while ready:
+            op = self.operations[ready.popleft()]
+            self.wires[op.result] = self.execute_operation(
+                op.operator,
+                self.wires[op.input1],
+                self.wires[op.input2]
+            )
+            for index in waiting_on.pop(op.result, ()):
+                missing_inputs[index] -= 1
+                if missing_inputs[index] == 0:
+                    ready.append(index)
 
     def get_z_wire_value(self):
         """Get final binary value from z-wires"""
@@ -116,6 +152,22 @@ class CircuitProcessor:
         """Get comma-separated string of wrong wires"""
         return ",".join(sorted(self.wrong_wires))
 
+def parse(input_text):
+    """Parse the input text into a loaded circuit, which each part copies before running"""
+    return CircuitProcessor.from_text(input_text)
+
+def part1(circuit):
+    """Solve part 1: decimal value output on the z wires"""
+    processor = circuit.copy()
+    processor.process_circuit()
+    return processor.get_z_wire_value()
+
+def part2(circuit):
+    """Solve part 2: sorted names of the swapped wires"""
+    processor = circuit.copy()
+    processor.identify_wrong_wires()
+    return processor.get_wrong_wires()
+
 def main():
     processor = CircuitProcessor("input.txt")
     processor.identify_wrong_wires()
@@ -1,31 +1,32 @@
-def read_file():
-    """Read input"""
-    with open('input.txt', 'r') as file:
-        return file.read().strip()
+import sys
+from pathlib import Path
+
+# make the shared aoc package importable when run from this folder
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from aoc.inputs import InputBuffer, as_buffer
+
+# the runner hands parse the memory-mapped file rather than a str
+BUFFER_INPUT = True
+FILLED = ord('#')
+
+def read_file(file_path='input.txt'):
+    """Map the input"""
+    return InputBuffer.open(file_path)
 
 def parse_schematics(data):
-    """Parse the input data into locks and keys"""
+    """Parse the input data (text or mapped input) into lock and key column heights"""
     locks = []
     keys = []
-    current_schematic = []
-    
-    for line in data.split('\n'):
-        if line.strip():  # if line is not empty
-            current_schematic.append(line)
-        elif current_schematic:  # empty line and we have a schematic to process
-            # check if it's a lock (filled top row) or key (empty top row)
-            if current_schematic[0].startswith('#'):
-                locks.append(current_schematic)
-            else:
-                keys.append(current_schematic)
-            current_schematic = []
     
-    # don't forget the last schematic if there's no trailing newline
-    if current_schematic:
-        if current_schematic[0].startswith('#'):
-            locks.append(current_schematic)
+    # each blank-line separated section is one schematic, as memoryview rows;
+    # only its heights are kept, so the rows can go as soon as it's measured
+    for schematic in as_buffer(data).sections():
+        # check if it's a lock (filled top row) or key (empty top row)
+        if schematic[0][0] == FILLED:
+            locks.append(get_heights(schematic, True))
         else:
-            keys.append(current_schematic)
+            keys.append(get_heights(schematic, False))
     
     return locks, keys
 
@@ -40,7 +41,7 @@ def get_heights(schematic, is_lock=True):
         if is_lock:
             # for locks, count from top until we find a '.'
             for row in range(height):
-                if schematic[row][col] == '#':
+                if schematic[row][col] == FILLED:
                     column_height += 1
                 else:
                     break
@@ -48,7 +49,7 @@ def get_heights(schematic, is_lock=True):
         else:
             # for keys, count from bottom until we find a '.'
             for row in range(height - 1, -1, -1):
-                if schematic[row][col] == '#':
+                if schematic[row][col] == FILLED:
                     column_height += 1
                 else:
                     break
@@ -67,15 +68,8 @@ def can_fit(lock_heights, key_heights):
             return False
     return True
 
-def count_fitting_pairs(data):
+def count_fitting_pairs(lock_heights, key_heights):
     """Count the number of unique lock/key pairs that fit together"""
-    # parse the input into locks and keys
-    locks, keys = parse_schematics(data)
-    
-    # convert schematics to heights
-    lock_heights = [get_heights(lock, True) for lock in locks]
-    key_heights = [get_heights(key, False) for key in keys]
-    
     # count fitting pairs
     fitting_pairs = 0
     for lock in lock_heights:
@@ -85,10 +79,17 @@ def count_fitting_pairs(data):
     
     return fitting_pairs
 
+def parse(input_text):
+    """Parse the input (text or mapped input) into lock and key heights"""
+    return parse_schematics(input_text)
+
+def part1(heights):
+    """Solve the puzzle for the parsed locks and keys"""
+    return count_fitting_pairs(*heights)
+
 def main():
     """Main function"""
-    data = read_file()
-    result = count_fitting_pairs(data)
+    result = count_fitting_pairs(*parse_schematics(read_file()))
     print(f"Number of unique lock/key pairs that fit: {result}")
 
 if __name__ == "__main__":
@@ -0,0 +1 @@
+"""Shared tooling for running, timing and profiling the Advent of Code 2024 solutions"""
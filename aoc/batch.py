@@ -0,0 +1,81 @@
+"""
+Solve many input files for one day on a process pool.
+
+Inputs are given as files, directories (every file directly inside) or
+glob patterns. Every worker warms the day once when it starts (see
+pool.warm_worker), so precomputed tables such as day 21's keypad costs and
+day 11's stone transitions are shared by all the inputs that worker
+solves. Result rows are written as JSON lines as soon as each input is
+done, so a long batch can be followed (or cut short) while it runs.
+"""
+import glob
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+from aoc import pool
+from aoc.days import get_day
+from aoc.runner import run_day
+
+
+def expand_inputs(sources):
+    """Input files named by a list of files, directories and glob patterns, without repeats"""
+    paths = []
+    for source in sources:
+        if os.path.isdir(source):
+            paths.extend(sorted(str(path) for path in Path(source).iterdir() if path.is_file()))
+        elif glob.has_magic(source):
+            paths.extend(sorted(path for path in glob.glob(source, recursive=True) if os.path.isfile(path)))
+        else:
+            # kept even if missing, so it gets an error row instead of vanishing
+            paths.append(source)
+    return list(dict.fromkeys(paths))
+
+
+def solve_input(day_number, input_path, parts=None, track_memory=False):
+    """Worker entry point: run a day on one input file and return its report row"""
+    try:
+        row = run_day(get_day(day_number), input_path, parts=parts, track_memory=track_memory)
+    except OSError as error:
+        # an unreadable file shouldn't cost the rest of the batch
+        return {"day": day_number, "input": input_path, "error": f"{type(error).__name__}: {error}"}
+    row["worker"] = os.getpid()
+    return row
+
+
+def run_batch(day, sources, parts=None, workers=None, track_memory=False, write=None):
+    """
+    Solve every input for a day, calling write(row) for each one as it
+    finishes, and return the number of inputs that had an error
+    """
+    paths = expand_inputs(sources)
+    failures = 0
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=pool.warm_worker, initargs=([day.number],)
+    ) as executor:
+        futures = {
+            executor.submit(solve_input, day.number, path, parts, track_memory): path
+            for path in paths
+        }
+        for future in as_completed(futures):
+            try:
+                row = future.result()
+            except Exception as error:
+                row = {"day": day.number, "input": futures[future],
+                       "error": f"{type(error).__name__}: {error}"}
+            if "error" in row or any("error" in part for part in row["parts"].values()):
+                failures += 1
+            if write is not None:
+                write(row)
+    return failures
+
+
+def json_line_writer(file):
+    """A write(row) callback emitting one flushed JSON line per row"""
+
+    def write(row):
+        file.write(json.dumps(row) + "\n")
+        file.flush()
+
+    return write
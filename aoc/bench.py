@@ -0,0 +1,76 @@
+"""Benchmark each day's solvers over a ladder of synthetic input sizes"""
+import inspect
+import time
+
+from aoc.days import get_parts, prepare_input
+from aoc.generators import GENERATORS, generate
+from aoc.runner import format_answer, measure
+
+
+def size_ladder(day, steps=4, factor=2, base=None):
+    """Sizes to benchmark: base, base*factor, base*factor**2, ..."""
+    if base is None:
+        base = GENERATORS[day].base
+    return [int(base * factor ** step) for step in range(steps)]
+
+
+def accepted_options(func, options):
+    """Keep only the generator options the solver function accepts"""
+    parameters = inspect.signature(func).parameters
+    return {name: value for name, value in options.items() if name in parameters}
+
+
+def bench_size(day, size, seed=0, parts=None, track_memory=True):
+    """Generate one input and run the requested parts of a day on it"""
+    generated = generate(day.number, size, seed)
+    row = {"size": size, "input_bytes": len(generated.text), "parts": {}}
+
+    module = day.load()
+    for number, func in get_parts(module):
+        if parts and number not in parts:
+            continue
+        options = accepted_options(func, generated.options)
+        # each part is timed with the parse included, as a standalone solve would be
+        answer, stats = measure(
+            lambda: func(prepare_input(module, generated.text), **options),
+            track_memory=track_memory,
+        )
+        row["parts"][str(number)] = {"answer": format_answer(answer), **stats}
+
+    return row
+
+
+def bench_day(day, sizes, seed=0, parts=None, track_memory=True, max_seconds=None):
+    """
+    Run a day over a size ladder. Climbing stops once a size takes longer than
+    max_seconds, since the next rung would typically take several times longer.
+    """
+    result = {
+        "day": day.number,
+        "name": day.name,
+        "unit": GENERATORS[day.number].unit,
+        "seed": seed,
+        "runs": [],
+    }
+    for size in sizes:
+        started = time.perf_counter()
+        result["runs"].append(bench_size(day, size, seed, parts, track_memory))
+        if max_seconds is not None and time.perf_counter() - started > max_seconds:
+            result["stopped_at"] = size
+            break
+    return result
+
+
+def bench_days(days, steps=4, factor=2, seed=0, parts=None, track_memory=True, max_seconds=None):
+    """Benchmark several days, each over its own size ladder"""
+    return [
+        bench_day(
+            day,
+            size_ladder(day.number, steps, factor),
+            seed,
+            parts,
+            track_memory,
+            max_seconds,
+        )
+        for day in days
+    ]
@@ -0,0 +1,164 @@
+"""
+Sets of small non-negative ints as bits: cells, graph nodes, columns.
+
+Bitset holds a whole set in the bits of one Python int, so union,
+intersection and difference are single big-int operations running in C
+over 30-bit digits, and the size is int.bit_count(). A set of cells on a
+140x140 grid takes about 2.5 KB however full it is, where a set of ints
+takes dozens of bytes per member. Shifting a Bitset moves every member at
+once, which turns neighbour tests over a whole region into a few
+operations. Bitsets are values: every operation returns a new one.
+
+Building a Bitset one member at a time would copy the int on every add,
+so BitArray is the mutable counterpart for that: a fixed-size bitmap in a
+bytearray with O(1) add and membership, converted to a Bitset (or counted)
+in one call when it's done.
+
+Index numbers arbitrary keys (names, coordinates) with consecutive bit
+positions and maps Bitsets back to keys.
+"""
+
+# positions of the set bits of a machine word are found 64 at a time
+WORD_BITS = 64
+
+
+def iter_bits(bits):
+    """Positions of the set bits of a non-negative int, lowest first"""
+    words = (bits.bit_length() + WORD_BITS - 1) // WORD_BITS
+    # walking 64-bit words keeps each step on small ints, whatever the set's size
+    for index, word in enumerate(memoryview(bits.to_bytes(words * 8, "little")).cast("Q")):
+        base = index * WORD_BITS
+        while word:
+            low = word & -word
+            yield base + low.bit_length() - 1
+            word ^= low
+
+
+def bits_from_indices(indices):
+    """The int with exactly the given bit positions set"""
+    indices = list(indices)
+    if not indices:
+        return 0
+    marks = bytearray(max(indices) // 8 + 1)
+    for index in indices:
+        marks[index >> 3] |= 1 << (index & 7)
+    return int.from_bytes(marks, "little")
+
+
+class Bitset:
+    __slots__ = ("bits",)
+
+    def __init__(self, bits=0):
+        self.bits = bits
+
+    @classmethod
+    def from_indices(cls, indices):
+        """The set of the given non-negative ints"""
+        return cls(bits_from_indices(indices))
+
+    def __or__(self, other):
+        return Bitset(self.bits | other.bits)
+
+    def __and__(self, other):
+        return Bitset(self.bits & other.bits)
+
+    def __sub__(self, other):
+        return Bitset(self.bits & ~other.bits)
+
+    def __xor__(self, other):
+        return Bitset(self.bits ^ other.bits)
+
+    def __len__(self):
+        return self.bits.bit_count()
+
+    def __bool__(self):
+        return self.bits != 0
+
+    def __iter__(self):
+        return iter_bits(self.bits)
+
+    def __contains__(self, index):
+        # a shift of the whole int; BitArray is the one for many single lookups
+        return self.bits >> index & 1 == 1
+
+    def __eq__(self, other):
+        return isinstance(other, Bitset) and self.bits == other.bits
+
+    def __hash__(self):
+        return hash(self.bits)
+
+    def __repr__(self):
+        return f"Bitset({list(self)})"
+
+    def above(self, index):
+        """The members greater than index"""
+        return Bitset(self.bits >> (index + 1) << (index + 1))
+
+    def shifted(self, offset):
+        """Every member moved by offset (members that would go negative are dropped)"""
+        return Bitset(self.bits << offset if offset >= 0 else self.bits >> -offset)
+
+
+class BitArray:
+    __slots__ = ("size", "data")
+
+    def __init__(self, size):
+        self.size = size
+        self.data = bytearray((size + 7) // 8)
+
+    def add(self, index):
+        """Set the bit of index"""
+        self.data[index >> 3] |= 1 << (index & 7)
+
+    def discard(self, index):
+        """Clear the bit of index"""
+        self.data[index >> 3] &= ~(1 << (index & 7)) & 0xFF
+
+    def __contains__(self, index):
+        return self.data[index >> 3] >> (index & 7) & 1 == 1
+
+    def __len__(self):
+        return self.to_int().bit_count()
+
+    def __iter__(self):
+        return iter_bits(self.to_int())
+
+    def to_int(self):
+        """The bitmap as an int, bit i for index i"""
+        return int.from_bytes(self.data, "little")
+
+    def to_bitset(self):
+        """An immutable Bitset of the indices set so far"""
+        return Bitset(self.to_int())
+
+
+class Index:
+    __slots__ = ("keys", "positions")
+
+    def __init__(self, keys=()):
+        self.keys = []
+        self.positions = {}
+        for key in keys:
+            self.add(key)
+
+    def add(self, key):
+        """Bit position of key, numbering it next if it's new"""
+        position = self.positions.get(key)
+        if position is None:
+            position = self.positions[key] = len(self.keys)
+            self.keys.append(key)
+        return position
+
+    def __getitem__(self, key):
+        return self.positions[key]
+
+    def __len__(self):
+        return len(self.keys)
+
+    def bitset(self, keys):
+        """The Bitset of some already numbered keys"""
+        return Bitset.from_indices(self.positions[key] for key in keys)
+
+    def keys_of(self, bitset):
+        """The keys of a Bitset's members, in bit order"""
+        return [self.keys[position] for position in bitset]
@@ -0,0 +1,226 @@
+"""
+Persistent cache for parsed inputs and expensive intermediates.
+
+Entries are keyed by a hash of the content they were computed from (input
+bytes, grid cells, parameters), so a changed input can never be served a
+stale artifact. Values are written as NumPy .npz files when they are a dict
+of NumPy arrays and NumPy is installed, and pickled otherwise (array.array
+and bytes pickle as compact binary). The directory is size-bounded: once it
+grows past max_bytes the least recently used entries are evicted.
+
+Caching is off unless a directory is configured, either with configure()
+or the AOC_CACHE_DIR environment variable, in which case cached() simply
+calls compute().
+"""
+import hashlib
+import os
+import pickle
+import tempfile
+from array import array
+from collections import OrderedDict
+from pathlib import Path
+
+from aoc import instrument
+
+try:
+    import numpy
+except ImportError:  # numpy is optional, everything is pickled without it
+    numpy = None
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+# entries kept in memory as well, so a run doesn't reload what it just stored
+MEMORY_ENTRIES = 32
+
+SUFFIXES = (".npz", ".pkl")
+
+
+def content_key(namespace, *parts):
+    """Cache key for a namespace and the content an artifact depends on"""
+    digest = hashlib.sha256()
+    for part in (namespace,) + parts:
+        if isinstance(part, array):
+            data = part.typecode.encode() + part.tobytes()
+        elif isinstance(part, (bytes, bytearray, memoryview)):
+            data = bytes(part)
+        elif isinstance(part, str):
+            data = part.encode()
+        else:
+            data = repr(part).encode()
+        # length-prefix each part so ("ab", "c") and ("a", "bc") differ
+        digest.update(len(data).to_bytes(8, "little"))
+        digest.update(data)
+    return f"{namespace}-{digest.hexdigest()[:40]}"
+
+
+def is_array_dict(value):
+    """Whether a value can be stored as an .npz file"""
+    return (
+        numpy is not None
+        and isinstance(value, dict)
+        and value
+        and all(isinstance(item, numpy.ndarray) for item in value.values())
+    )
+
+
+class ArtifactCache:
+    def __init__(self, directory, max_bytes=DEFAULT_MAX_BYTES):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.memory = OrderedDict()
+
+    def path_for(self, key):
+        """The file an entry lives in, if it exists"""
+        for suffix in SUFFIXES:
+            path = self.directory / (key + suffix)
+            if path.exists():
+                return path
+        return None
+
+    def get(self, key, default=None):
+        """Load an entry, or return default on a miss"""
+        if key in self.memory:
+            self.memory.move_to_end(key)
+            self.hits += 1
+            return self.memory[key]
+
+        path = self.path_for(key)
+        if path is None:
+            self.misses += 1
+            return default
+        try:
+            value = self.load(path)
+        except Exception:
+            # a truncated or unreadable entry is just a miss
+            path.unlink(missing_ok=True)
+            self.misses += 1
+            return default
+
+        # touching the file marks it as recently used for eviction
+        os.utime(path)
+        self.hits += 1
+        self.remember(key, value)
+        return value
+
+    def put(self, key, value):
+        """Store an entry, then evict old entries if the cache is over its size"""
+        suffix = ".npz" if is_array_dict(value) else ".pkl"
+        handle, temp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(handle, "wb") as file:
+                if suffix == ".npz":
+                    numpy.savez(file, **value)
+                else:
+                    pickle.dump(value, file, protocol=pickle.HIGHEST_PROTOCOL)
+            # write-then-rename so readers never see half an entry
+            os.replace(temp_path, self.directory / (key + suffix))
+        except BaseException:
+            Path(temp_path).unlink(missing_ok=True)
+            raise
+        self.remember(key, value)
+        self.evict()
+
+    @staticmethod
+    def load(path):
+        """Read an entry file"""
+        if path.suffix == ".npz":
+            with numpy.load(path) as data:
+                return {name: data[name] for name in data.files}
+        with open(path, "rb") as file:
+            return pickle.load(file)
+
+    def remember(self, key, value):
+        """Keep an entry in the in-memory layer"""
+        self.memory[key] = value
+        self.memory.move_to_end(key)
+        while len(self.memory) > MEMORY_ENTRIES:
+            self.memory.popitem(last=False)
+
+    def entries(self):
+        """(path, size, last used) for every entry, least recently used first"""
+        entries = []
+        for path in self.directory.iterdir():
+            if path.suffix in SUFFIXES:
+                stat = path.stat()
+                entries.append((path, stat.st_size, stat.st_mtime))
+        return sorted(entries, key=lambda entry: entry[2])
+
+    def size(self):
+        """Total bytes on disk"""
+        return sum(size for _, size, _ in self.entries())
+
+    def evict(self):
+        """Delete least recently used entries until the cache fits in max_bytes"""
+        entries = self.entries()
+        total = sum(size for _, size, _ in entries)
+        for path, size, _ in entries:
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+
+    def clear(self):
+        """Delete every entry"""
+        for path, _, _ in self.entries():
+            path.unlink(missing_ok=True)
+        self.memory.clear()
+
+    def stats(self):
+        """Summary of the cache's contents and hit rate"""
+        entries = self.entries()
+        return {
+            "directory": str(self.directory),
+            "entries": len(entries),
+            "bytes": sum(size for _, size, _ in entries),
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+_active = None
+
+
+def configure(directory, max_bytes=DEFAULT_MAX_BYTES):
+    """Turn caching on (or off, with directory=None) for this process"""
+    global _active
+    _active = ArtifactCache(directory, max_bytes) if directory else None
+    return _active
+
+
+def active():
+    """The configured cache, or None when caching is off"""
+    global _active
+    if _active is None and os.environ.get("AOC_CACHE_DIR"):
+        max_bytes = int(os.environ.get("AOC_CACHE_MAX_BYTES", DEFAULT_MAX_BYTES))
+        _active = ArtifactCache(os.environ["AOC_CACHE_DIR"], max_bytes)
+    return _active
+
+
+def cached(namespace, key_parts, compute):
+    """
+    Return the artifact stored for (namespace, key_parts), computing and
+    storing it on a miss. Callers must treat the result as read-only, since
+    it may be shared with later lookups.
+    """
+    cache = active()
+    if cache is None:
+        return compute()
+
+    key = content_key(namespace, *key_parts)
+    value = cache.get(key, _MISSING)
+    hit = value is not _MISSING
+    if not hit:
+        value = compute()
+        cache.put(key, value)
+
+    recorder = instrument.current()
+    if recorder is not None:
+        recorder.count(f"cache.{namespace}.{'hits' if hit else 'misses'}")
+    return value
+
+
+_MISSING = object()
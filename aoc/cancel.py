@@ -0,0 +1,109 @@
+"""
+Time budgets for solver runs, with cooperative cancellation.
+
+A budget is off unless the runner imposes one (`run --time-budget`, or a
+daemon request's "time_budget"). Long solver loops fetch it once with
+current() and poll it, guarded by `if budget is not None`, so an unbudgeted
+run only pays for that check. tick() is cheap enough for the innermost loop
+(it reads the clock every TICKS_PER_CHECK calls); check() reads it every
+time, for loops whose iterations are already expensive. Past the deadline
+either one raises Cancelled, carrying whatever progress counters the solver
+kept in budget.progress, and the runner turns that into a timed-out row.
+
+Solvers that never poll are stopped by a SIGALRM backstop shortly after the
+deadline, where the platform has one and the run is on the main thread.
+"""
+import signal
+import threading
+import time
+from contextlib import contextmanager
+
+# tick() reads the clock once every this many calls
+TICKS_PER_CHECK = 1024
+
+# how long past the deadline the alarm backstop waits for a solver to poll
+BACKSTOP_GRACE = 1.0
+
+
+class Cancelled(Exception):
+    def __init__(self, budget):
+        self.seconds = budget.seconds
+        self.elapsed = budget.elapsed()
+        self.progress = dict(budget.progress)
+        super().__init__(f"time budget of {self.seconds:g}s ran out after {self.elapsed:.2f}s")
+
+
+class Budget:
+    def __init__(self, seconds):
+        self.seconds = seconds
+        self.start = time.perf_counter()
+        self.deadline = self.start + seconds
+        self.ticks = TICKS_PER_CHECK
+        # counters the solver keeps up to date, reported if it's cancelled
+        self.progress = {}
+
+    def elapsed(self):
+        """Seconds since the budget started"""
+        return time.perf_counter() - self.start
+
+    def check(self):
+        """Raise Cancelled once the deadline has passed"""
+        if time.perf_counter() >= self.deadline:
+            raise Cancelled(self)
+
+    def tick(self):
+        """check(), but only reading the clock every TICKS_PER_CHECK calls"""
+        self.ticks -= 1
+        if self.ticks <= 0:
+            self.ticks = TICKS_PER_CHECK
+            self.check()
+
+
+_budget = None
+
+
+def current():
+    """The active Budget, or None when the run has no time limit"""
+    return _budget
+
+
+def can_interrupt():
+    """Whether the alarm backstop can be used here (a Unix main thread)"""
+    return hasattr(signal, "setitimer") and threading.current_thread() is threading.main_thread()
+
+
+@contextmanager
+def limit(seconds):
+    """Impose a time budget on the block; seconds=None leaves it unlimited"""
+    global _budget
+    if seconds is None:
+        yield None
+        return
+
+    budget = _budget = Budget(seconds)
+    backstop = can_interrupt()
+    if backstop:
+
+        def interrupt(signum, frame):
+            raise Cancelled(budget)
+
+        previous = signal.signal(signal.SIGALRM, interrupt)
+        signal.setitimer(signal.ITIMER_REAL, seconds + BACKSTOP_GRACE)
+    try:
+        yield budget
+    finally:
+        if backstop:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            signal.signal(signal.SIGALRM, previous)
+        _budget = None
+
+
+def timed_out_row(cancelled):
+    """The result row of a part stopped by its budget"""
+    return {
+        "answer": None,
+        "error": f"Cancelled: {cancelled}",
+        "timed_out": True,
+        "wall_time": cancelled.elapsed,
+        "progress": cancelled.progress,
+    }
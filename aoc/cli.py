@@ -0,0 +1,331 @@
+"""Command line entry point: python -m aoc <command> ..."""
+import argparse
+import json
+import sys
+from contextlib import nullcontext
+
+from aoc import batch, bench, cache, complexity, daemon, days, generators, instrument, memory, pool, regress, runner
+
+
+def write_json(data, output=None, indent=2):
+    """Write a report as JSON to a file or stdout"""
+    text = json.dumps(data, indent=indent)
+    if output:
+        with open(output, "w") as file:
+            file.write(text + "\n")
+    else:
+        print(text)
+
+
+def write_flame(reports, output):
+    """Write every part's instrumented sections as folded stacks, one root frame per part"""
+    lines = []
+    for report in reports:
+        for part, row in report["parts"].items():
+            if "instrument" in row:
+                root = f"day{report['day']:02d};part{part}"
+                lines.extend(instrument.folded(row["instrument"], root))
+    with open(output, "w") as file:
+        file.writelines(line + "\n" for line in lines)
+
+
+def cmd_run(args):
+    """Run days in this interpreter and emit a JSON report"""
+    days = runner.select_days(args.days)
+    if args.input and len(days) != 1:
+        raise SystemExit("--input can only be used when running a single day")
+    if args.cache_dir:
+        cache.configure(args.cache_dir, args.cache_size * 1024 * 1024)
+
+    if args.flame:
+        args.instrument = True
+    memory_top = args.top if args.profile_memory else 0
+    if memory_top and args.no_memory:
+        raise SystemExit("--profile-memory can't be combined with --no-memory")
+
+    if args.jobs:
+        if args.input == "-":
+            raise SystemExit("--input - (stdin) can't be shared with --jobs workers")
+        report = pool.run_pool(
+            days,
+            input_path=args.input,
+            parts=args.parts,
+            track_memory=not args.no_memory,
+            workers=args.jobs,
+            instrumented=args.instrument,
+            memory_top=memory_top,
+            time_budget=args.time_budget,
+        )
+        reports = report["days"]
+    else:
+        report = reports = runner.run_days(
+            days,
+            input_path=args.input,
+            parts=args.parts,
+            track_memory=not args.no_memory,
+            instrumented=args.instrument,
+            memory_top=memory_top,
+            time_budget=args.time_budget,
+        )
+
+    budgets = memory.load_budgets(args.budgets)
+    if args.memory_budget is not None:
+        budgets["default"] = args.memory_budget
+    violations = memory.check_budgets(reports, budgets)
+
+    write_json(report, args.output)
+    if args.flame:
+        write_flame(reports, args.flame)
+
+    for day, part, peak, budget in violations:
+        step = "parse" if part == "parse" else f"part {part}"
+        print(
+            f"day {day} {step}: peak memory {peak / memory.MIB:.1f} MiB "
+            f"exceeds budget {budget / memory.MIB:.1f} MiB",
+            file=sys.stderr,
+        )
+
+    failed = any("error" in part for report in reports for part in report["parts"].values())
+    return 1 if failed or violations else 0
+
+
+def cmd_cache(args):
+    """Show or clear the artifact cache"""
+    store = cache.configure(args.cache_dir) if args.cache_dir else cache.active()
+    if store is None:
+        raise SystemExit("no cache directory: pass --cache-dir or set AOC_CACHE_DIR")
+    if args.action == "clear":
+        store.clear()
+    write_json(store.stats())
+    return 0
+
+
+def cmd_batch(args):
+    """Solve a directory or glob of inputs for one day, one JSON line per input"""
+    day = runner.select_days([args.day])[0]
+    with open(args.output, "w") if args.output else nullcontext(sys.stdout) as file:
+        failures = batch.run_batch(
+            day, args.inputs, args.parts, args.workers, args.memory, batch.json_line_writer(file)
+        )
+    return 1 if failures else 0
+
+
+def cmd_serve(args):
+    """Run the solver daemon"""
+    daemon.serve(args.socket, args.workers, track_memory=args.memory, time_budget=args.time_budget)
+    return 0
+
+
+def cmd_stream(args):
+    """Feed input lines to a day's streaming solver, writing its running answers as JSON lines"""
+    day = runner.select_days([args.day])[0]
+    stream = getattr(day.load(), days.STREAM_NAME, None)
+    if not callable(stream):
+        raise SystemExit(f"day {day.number} has no streaming solver")
+
+    def write(count, answers):
+        parts = {str(part): runner.format_answer(answer) for part, answer in answers.items()}
+        print(json.dumps({"lines": count, "answers": parts}), flush=True)
+
+    count, answers = 0, None
+    with open(args.input) if args.input else nullcontext(sys.stdin) as file:
+        for count, answers in enumerate(stream(file), start=1):
+            if count % args.every == 0:
+                write(count, answers)
+    # the final answers, unless they were the last ones written
+    if answers is not None and count % args.every:
+        write(count, answers)
+    return 0
+
+
+def cmd_generate(args):
+    """Write a synthetic input for a day to stdout or a file"""
+    generated = generators.generate(args.day, args.size, args.seed)
+    if args.output:
+        with open(args.output, "w") as file:
+            file.write(generated.text)
+    else:
+        sys.stdout.write(generated.text)
+    if generated.options:
+        print(f"solver options: {json.dumps(generated.options)}", file=sys.stderr)
+    return 0
+
+
+def cmd_bench(args):
+    """Benchmark days over a ladder of generated input sizes"""
+    days = runner.select_days(args.days)
+    results = bench.bench_days(
+        days,
+        steps=args.steps,
+        factor=args.factor,
+        seed=args.seed,
+        parts=args.parts,
+        track_memory=not args.no_memory,
+        max_seconds=args.max_seconds,
+    )
+    write_json(results, args.output)
+    return 0
+
+
+def cmd_complexity(args):
+    """Fit growth exponents and compare them with (or store them as) the baseline"""
+    days = runner.select_days(args.days)
+    measured = complexity.measure_days(
+        days,
+        steps=args.steps,
+        factor=args.factor,
+        seed=args.seed,
+        repeats=args.repeats,
+        max_seconds=args.max_seconds,
+    )
+    if args.update:
+        complexity.save_baseline(measured, args.baseline)
+        write_json(measured, args.output)
+        return 0
+
+    rows = complexity.compare(measured, complexity.load_baseline(args.baseline), args.tolerance)
+    write_json(rows, args.output)
+    regressions = [row for row in rows if row["regressed"]]
+    for row in regressions:
+        print(
+            f"day {row['day']} part {row['part']}: exponent {row['exponent']} "
+            f"exceeds baseline {row['baseline']}",
+            file=sys.stderr,
+        )
+    return 1 if regressions else 0
+
+
+def cmd_regress(args):
+    """Check answers, timings and memory against the golden file (or record them)"""
+    days = runner.select_days(args.days)
+    cases = regress.list_cases(days, synthetic=not args.no_synthetic, seed=args.seed)
+    results = regress.run_cases(
+        cases,
+        repeats=args.repeats,
+        track_memory=not args.no_memory,
+        memory_max_seconds=args.memory_max_seconds,
+    )
+    if args.update:
+        regress.save_golden(results, args.golden)
+
+    rows = regress.compare(results, regress.load_golden(args.golden), args.margin, args.memory_margin)
+    regress.append_history(rows, args.history)
+    write_json(rows, args.output)
+
+    failures = regress.failed(rows)
+    for row in failures:
+        print(f"{row['case']} part {row['part']}: {row['status']}", file=sys.stderr)
+    return 1 if failures else 0
+
+
+def build_parser():
+    """Build the argument parser with all subcommands"""
+    parser = argparse.ArgumentParser(prog="python -m aoc", description=__doc__)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="run solvers and report answers, timings and memory")
+    run.add_argument("days", nargs="*", type=int, help="day numbers to run (default: all)")
+    run.add_argument("--input", help="input file to use instead of the bundled input.txt ('-' for stdin)")
+    run.add_argument("--parts", nargs="+", type=int, choices=(1, 2), help="parts to run (default: both)")
+    run.add_argument("--no-memory", action="store_true", help="skip tracemalloc peak-memory tracking")
+    run.add_argument("--output", help="write the JSON report to this file instead of stdout")
+    run.add_argument("--profile-memory", action="store_true", help="report the top allocating lines near each part's and parse's peak")
+    run.add_argument("--top", type=int, default=10, help="allocating lines to report with --profile-memory")
+    run.add_argument("--budgets", default=memory.BUDGETS_PATH, help="per-day memory budgets file (MiB)")
+    run.add_argument("--memory-budget", type=float, help="default memory budget in MiB, overriding the file's")
+    run.add_argument("--instrument", action="store_true", help="record solver counters and timed sections in the report")
+    run.add_argument("--flame", help="also write the timed sections as folded stacks to this file (implies --instrument)")
+    run.add_argument("--jobs", type=int, help="run parts on this many worker processes, slowest first")
+    run.add_argument("--time-budget", type=float, help="cancel parts still running after this many seconds")
+    run.add_argument("--cache-dir", help="reuse parsed inputs and intermediates stored in this directory")
+    run.add_argument("--cache-size", type=int, default=cache.DEFAULT_MAX_BYTES // (1024 * 1024),
+                     help="evict least recently used cache entries above this many MiB")
+    run.set_defaults(func=cmd_run)
+
+    store = commands.add_parser("cache", help="show or clear the artifact cache")
+    store.add_argument("action", nargs="?", choices=("stats", "clear"), default="stats")
+    store.add_argument("--cache-dir", help="cache directory (default: $AOC_CACHE_DIR)")
+    store.set_defaults(func=cmd_cache)
+
+    batch_parser = commands.add_parser("batch", help="solve many inputs for one day on worker processes")
+    batch_parser.add_argument("day", type=int)
+    batch_parser.add_argument("inputs", nargs="+", help="input files, directories or glob patterns")
+    batch_parser.add_argument("--parts", nargs="+", type=int, choices=(1, 2))
+    batch_parser.add_argument("--workers", type=int, help="worker processes (default: one per CPU)")
+    batch_parser.add_argument("--memory", action="store_true", help="track peak memory per input")
+    batch_parser.add_argument("--output", help="write the JSON lines to this file instead of stdout")
+    batch_parser.set_defaults(func=cmd_batch)
+
+    serve = commands.add_parser("serve", help="keep solvers warm and answer JSON-line requests")
+    serve.add_argument("--socket", help="listen on this Unix socket instead of stdin/stdout")
+    serve.add_argument("--workers", type=int, help="worker processes (default: one per CPU)")
+    serve.add_argument("--memory", action="store_true", help="track peak memory per request")
+    serve.add_argument("--time-budget", type=float, help="default seconds a part may run before it's cancelled")
+    serve.set_defaults(func=cmd_serve)
+
+    feed = commands.add_parser("stream", help="keep a day's answers current as input lines arrive")
+    feed.add_argument("day", type=int)
+    feed.add_argument("--input", help="read lines from this file instead of stdin")
+    feed.add_argument("--every", type=int, default=1, help="write the answers after every this many lines")
+    feed.set_defaults(func=cmd_stream)
+
+    gen = commands.add_parser("generate", help="generate a synthetic input for a day")
+    gen.add_argument("day", type=int)
+    gen.add_argument("size", type=int, help="input size, in the day's generator unit")
+    gen.add_argument("--seed", type=int, default=0)
+    gen.add_argument("--output", help="write the input to this file instead of stdout")
+    gen.set_defaults(func=cmd_generate)
+
+    bench_parser = commands.add_parser("bench", help="benchmark solvers over a ladder of generated inputs")
+    bench_parser.add_argument("days", nargs="*", type=int, help="day numbers to benchmark (default: all)")
+    bench_parser.add_argument("--steps", type=int, default=4, help="rungs on the size ladder")
+    bench_parser.add_argument("--factor", type=float, default=2, help="growth factor between rungs")
+    bench_parser.add_argument("--seed", type=int, default=0)
+    bench_parser.add_argument("--parts", nargs="+", type=int, choices=(1, 2))
+    bench_parser.add_argument("--no-memory", action="store_true", help="skip tracemalloc peak-memory tracking")
+    bench_parser.add_argument("--max-seconds", type=float, help="stop climbing a day's ladder after a slower rung")
+    bench_parser.add_argument("--output", help="write the JSON results to this file instead of stdout")
+    bench_parser.set_defaults(func=cmd_bench)
+
+    curve = commands.add_parser("complexity", help="fit growth exponents and check them against the baseline")
+    curve.add_argument("days", nargs="*", type=int, help="day numbers to check (default: all)")
+    curve.add_argument("--steps", type=int, default=5, help="rungs on the size ladder")
+    curve.add_argument("--factor", type=float, default=2, help="growth factor between rungs")
+    curve.add_argument("--seed", type=int, default=0)
+    curve.add_argument("--repeats", type=int, default=3, help="timings per rung; the fastest is used")
+    curve.add_argument("--max-seconds", type=float, default=30, help="stop climbing a day's ladder after a slower rung")
+    curve.add_argument("--tolerance", type=float, default=complexity.DEFAULT_TOLERANCE)
+    curve.add_argument("--baseline", default=complexity.BASELINE_PATH, help="baseline file to compare against")
+    curve.add_argument("--update", action="store_true", help="store the measured exponents as the new baseline")
+    curve.add_argument("--output", help="write the JSON results to this file instead of stdout")
+    curve.set_defaults(func=cmd_complexity)
+
+    gate = commands.add_parser("regress", help="check answers, time and memory against the golden file")
+    gate.add_argument("days", nargs="*", type=int, help="day numbers to check (default: all)")
+    gate.add_argument("--seed", type=int, default=0, help="seed of the synthetic inputs")
+    gate.add_argument("--repeats", type=int, default=1, help="timings per part; the fastest is used")
+    gate.add_argument("--margin", type=float, default=regress.DEFAULT_TIME_MARGIN,
+                      help="allowed relative slowdown over the stored time")
+    gate.add_argument("--memory-margin", type=float, default=regress.DEFAULT_MEMORY_MARGIN,
+                      help="allowed relative growth over the stored peak memory")
+    gate.add_argument("--no-synthetic", action="store_true", help="only check the bundled inputs")
+    gate.add_argument("--no-memory", action="store_true", help="skip the traced run for peak memory")
+    gate.add_argument("--memory-max-seconds", type=float, default=regress.MEMORY_MAX_SECONDS,
+                      help="skip the traced run for parts slower than this")
+    gate.add_argument("--golden", default=regress.GOLDEN_PATH, help="golden answers and budgets file")
+    gate.add_argument("--history", default=regress.HISTORY_PATH, help="JSON-lines history to append to")
+    gate.add_argument("--update", action="store_true", help="store this run as the new golden file")
+    gate.add_argument("--output", help="write the JSON rows to this file instead of stdout")
+    gate.set_defaults(func=cmd_regress)
+
+    return parser
+
+
+def main(argv=None):
+    """Parse arguments and dispatch to the chosen command"""
+    args = build_parser().parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,135 @@
+"""
+Empirical growth exponents for each day's solvers.
+
+Each part is timed over a ladder of generated inputs and the slope of
+log(time) against log(input size) is fitted by least squares. A slope of
+~1 means linear, ~2 quadratic and so on. Slopes are far more stable than
+absolute timings on shared machines, so they are compared against a stored
+baseline and a run fails when a solver's exponent rises above it.
+"""
+import json
+import math
+import time
+from pathlib import Path
+
+from aoc.bench import accepted_options, size_ladder
+from aoc.days import ROOT, get_parts, prepare_input
+from aoc.generators import generate
+from aoc.runner import measure
+
+BASELINE_PATH = ROOT / "complexity_baseline.json"
+
+# how far an exponent may rise above its baseline before it counts as a regression
+DEFAULT_TOLERANCE = 0.35
+
+# timings below this are dominated by noise and left out of the fit
+MIN_SECONDS = 0.002
+
+
+def fit_exponent(points):
+    """Least-squares slope of log(seconds) against log(n) for (n, seconds) points"""
+    xs = [math.log(n) for n, _ in points]
+    ys = [math.log(seconds) for _, seconds in points]
+    mean_x = sum(xs) / len(xs)
+    mean_y = sum(ys) / len(ys)
+    spread = sum((x - mean_x) ** 2 for x in xs)
+    if spread == 0:
+        raise ValueError("need at least two distinct sizes to fit an exponent")
+    return sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys)) / spread
+
+
+def time_part(module, func, text, options, repeats):
+    """Best-of-n wall time of one part on one input, parse included"""
+    best = math.inf
+    for _ in range(repeats):
+        _, stats = measure(lambda: func(prepare_input(module, text), **options), track_memory=False)
+        best = min(best, stats["wall_time"])
+    return best
+
+
+def measure_day(day, sizes, seed=0, repeats=3, max_seconds=None):
+    """Time every part of a day over the given sizes and fit their exponents"""
+    module = day.load()
+    parts = get_parts(module)
+    points = {number: [] for number, _ in parts}
+
+    for size in sizes:
+        generated = generate(day.number, size, seed)
+        n = len(generated.text)
+        started = time.perf_counter()
+        for number, func in parts:
+            options = accepted_options(func, generated.options)
+            points[number].append((n, time_part(module, func, generated.text, options, repeats)))
+        if max_seconds is not None and time.perf_counter() - started > max_seconds:
+            break
+
+    result = {}
+    for number, part_points in points.items():
+        usable = [(n, seconds) for n, seconds in part_points if seconds >= MIN_SECONDS]
+        entry = {"points": part_points, "exponent": None}
+        if len({n for n, _ in usable}) >= 2:
+            entry["exponent"] = round(fit_exponent(usable), 3)
+        result[str(number)] = entry
+    return result
+
+
+def measure_days(days, steps=5, factor=2, seed=0, repeats=3, max_seconds=None):
+    """Fit exponents for several days, keyed by day number"""
+    return {
+        str(day.number): measure_day(
+            day,
+            size_ladder(day.number, steps, factor),
+            seed,
+            repeats,
+            max_seconds,
+        )
+        for day in days
+    }
+
+
+def load_baseline(path=BASELINE_PATH):
+    """Load the stored exponents, {day: {part: exponent}}"""
+    path = Path(path)
+    if not path.exists():
+        return {}
+    with open(path) as file:
+        return json.load(file)
+
+
+def save_baseline(measured, path=BASELINE_PATH, merge=True):
+    """Store measured exponents as the new baseline"""
+    baseline = load_baseline(path) if merge else {}
+    for day, parts in measured.items():
+        baseline[day] = {
+            part: entry["exponent"]
+            for part, entry in parts.items()
+            if entry["exponent"] is not None
+        }
+    with open(path, "w") as file:
+        json.dump(dict(sorted(baseline.items(), key=lambda item: int(item[0]))), file, indent=2)
+        file.write("\n")
+    return baseline
+
+
+def compare(measured, baseline, tolerance=DEFAULT_TOLERANCE):
+    """
+    Compare measured exponents with the baseline. Returns one row per part;
+    rows whose exponent rose by more than the tolerance are regressions.
+    """
+    rows = []
+    for day, parts in measured.items():
+        for part, entry in parts.items():
+            expected = baseline.get(day, {}).get(part)
+            exponent = entry["exponent"]
+            rows.append({
+                "day": int(day),
+                "part": int(part),
+                "exponent": exponent,
+                "baseline": expected,
+                "regressed": (
+                    exponent is not None
+                    and expected is not None
+                    and exponent > expected + tolerance
+                ),
+            })
+    return rows
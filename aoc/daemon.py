@@ -0,0 +1,201 @@
+"""
+Long-running solver daemon speaking JSON lines over a Unix socket or stdio.
+
+Each request is one JSON object per line:
+
+    {"id": 7, "day": 11, "part": 2, "input": "125 17\\n"}
+
+"input" may be replaced by "input_path", or left out to use the bundled
+input, and "part" may be left out to run every part (one response each).
+"time_budget" caps the seconds each part may run (overriding the daemon's
+--time-budget); a part that runs out answers with "timed_out": true and the
+progress counters it had reached, and its worker moves on to the next job.
+Responses are streamed back as JSON lines in the order jobs finish, each
+echoing the request's id:
+
+    {"id": 7, "day": 11, "part": 2, "answer": "...", "wall_time": ..., "cpu_time": ...}
+
+{"op": "ping"} is answered with {"ok": true}, and {"op": "shutdown"} stops
+the daemon once running jobs are done.
+
+Solving happens on a process pool whose workers import every day module
+when they start and stay up between requests, so requests skip interpreter
+start-up and imports and each worker's module-level memo tables stay warm.
+The event loop only parses requests and writes responses. A worker that
+dies takes the pool down with it, so the daemon swaps in a fresh pool and
+retries the jobs that were on it once before answering them with an error.
+"""
+import asyncio
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
+
+from aoc import pool
+from aoc.days import discover_days, get_parts
+
+# longest request line accepted, inputs included
+LINE_LIMIT = 64 * 1024 * 1024
+
+
+class Daemon:
+    def __init__(self, workers=None, track_memory=False, time_budget=None):
+        self.days = {day.number: day for day in discover_days()}
+        # importing in the parent first means forked workers start with every day loaded
+        pool.warm_worker()
+        self.workers = workers
+        self.executor = self.start_pool()
+        self.track_memory = track_memory
+        self.time_budget = time_budget
+        self.stopping = asyncio.Event()
+
+    def start_pool(self):
+        """A new worker pool whose workers start with every day loaded"""
+        return ProcessPoolExecutor(max_workers=self.workers, initializer=pool.warm_worker)
+
+    def restart_pool(self, broken):
+        """Replace a pool a dead worker broke, unless another job already did"""
+        if self.executor is broken:
+            broken.shutdown(wait=False, cancel_futures=True)
+            self.executor = self.start_pool()
+
+    def close(self):
+        """Shut the worker pool down"""
+        self.executor.shutdown(cancel_futures=True)
+
+    async def run_on_pool(self, job):
+        """Run a job on the pool, retrying it once on a new pool if a worker dies"""
+        loop = asyncio.get_running_loop()
+        for attempt in range(2):
+            executor = self.executor
+            try:
+                return await loop.run_in_executor(executor, job)
+            except BrokenProcessPool:
+                # every job on the pool fails with it, not just the one whose worker died
+                self.restart_pool(executor)
+                if attempt:
+                    raise
+
+    def jobs_for(self, request):
+        """(day, part) pairs a solve request asks for, validating them"""
+        number = int(request["day"])
+        if number not in self.days:
+            raise KeyError(f"no solution folder for day {number}")
+        time_budget = request.get("time_budget")
+        if time_budget is not None and not isinstance(time_budget, (int, float)):
+            raise TypeError("time_budget must be a number of seconds")
+        parts = [part for part, _ in get_parts(self.days[number].load())]
+        if request.get("part") is None:
+            return [(number, part) for part in parts]
+        part = int(request["part"])
+        if part not in parts:
+            raise KeyError(f"day {number} has no part {part}")
+        return [(number, part)]
+
+    async def solve(self, request, number, part, send):
+        """Run one part on the pool and send its result"""
+        try:
+            job = partial(
+                pool.run_job,
+                number,
+                part,
+                input_path=request.get("input_path"),
+                input_text=request.get("input"),
+                track_memory=self.track_memory,
+                time_budget=request.get("time_budget", self.time_budget),
+            )
+            row = await self.run_on_pool(job)
+        except Exception as error:
+            # the worker itself failed (the solver's own errors come back in the row)
+            row = {"answer": None, "error": f"{type(error).__name__}: {error}"}
+        await send({"id": request.get("id"), "day": number, "part": part, **row})
+
+    async def handle(self, line, send, tasks):
+        """Handle one request line, queueing its jobs as tasks"""
+        request = None
+        try:
+            request = json.loads(line)
+            if request.get("op") == "ping":
+                await send({"id": request.get("id"), "ok": True})
+                return
+            if request.get("op") == "shutdown":
+                await send({"id": request.get("id"), "ok": True})
+                self.stopping.set()
+                return
+            jobs = self.jobs_for(request)
+        except (ValueError, KeyError, TypeError, AttributeError) as error:
+            request_id = request.get("id") if isinstance(request, dict) else None
+            await send({"id": request_id, "error": f"bad request: {error}"})
+            return
+
+        for number, part in jobs:
+            task = asyncio.create_task(self.solve(request, number, part, send))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+
+    async def serve_stream(self, reader, send):
+        """Read request lines until EOF or shutdown, then wait for their jobs"""
+        tasks = set()
+        while not self.stopping.is_set():
+            line = await reader.readline()
+            if not line:
+                break
+            if line.strip():
+                await self.handle(line, send, tasks)
+        if tasks:
+            await asyncio.wait(tasks)
+
+    async def serve_stdio(self):
+        """Serve requests from stdin, answering on stdout"""
+        loop = asyncio.get_running_loop()
+        reader = asyncio.StreamReader(limit=LINE_LIMIT, loop=loop)
+        await loop.connect_read_pipe(
+            lambda: asyncio.StreamReaderProtocol(reader, loop=loop), sys.stdin
+        )
+
+        async def send(response):
+            sys.stdout.write(json.dumps(response) + "\n")
+            sys.stdout.flush()
+
+        await self.serve_stream(reader, send)
+
+    async def serve_unix(self, path):
+        """Serve requests from clients of a Unix socket until a shutdown request"""
+
+        async def client(reader, writer):
+            async def send(response):
+                writer.write(json.dumps(response).encode() + b"\n")
+                await writer.drain()
+
+            try:
+                await self.serve_stream(reader, send)
+            finally:
+                writer.close()
+
+        # a socket file left behind by a daemon that died would block the bind
+        if os.path.exists(path):
+            os.unlink(path)
+        server = await asyncio.start_unix_server(client, path, limit=LINE_LIMIT)
+        try:
+            async with server:
+                await self.stopping.wait()
+        finally:
+            os.unlink(path)
+
+
+def serve(socket_path=None, workers=None, track_memory=False, time_budget=None):
+    """Run the daemon until stdin closes or, with a socket, until it's told to shut down"""
+
+    async def main():
+        daemon = Daemon(workers, track_memory, time_budget)
+        try:
+            if socket_path:
+                await daemon.serve_unix(socket_path)
+            else:
+                await daemon.serve_stdio()
+        finally:
+            daemon.close()
+
+    asyncio.run(main())
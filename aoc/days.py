@@ -0,0 +1,96 @@
+"""Discovery and loading of the per-day solution modules"""
+import importlib.util
+import re
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# day folders look like "01 - historian hysteria"
+DAY_DIR_PATTERN = re.compile(r"^(\d{2}) - (.+)$")
+
+# solver functions a day module may expose, in order
+PART_NAMES = ("part1", "part2")
+
+# optional function turning the input text into what the parts take
+PARSE_NAME = "parse"
+
+# optional generator taking input lines as they arrive and yielding the
+# answers so far ({part: answer}) after each one
+STREAM_NAME = "stream"
+
+
+@dataclass(frozen=True)
+class Day:
+    number: int
+    name: str
+    path: Path
+
+    @property
+    def module_name(self):
+        """Name the day's main.py is registered under in sys.modules"""
+        return f"day{self.number:02d}"
+
+    @property
+    def input_path(self):
+        """Path to the bundled puzzle input"""
+        return self.path / "input.txt"
+
+    def load(self):
+        """Import the day's main.py (once) and return the module"""
+        return load_module(self)
+
+
+def discover_days(root=ROOT):
+    """Find all day folders under the root, sorted by day number"""
+    days = []
+    for path in Path(root).iterdir():
+        match = DAY_DIR_PATTERN.match(path.name)
+        if match and (path / "main.py").is_file():
+            days.append(Day(int(match.group(1)), match.group(2), path))
+    return sorted(days, key=lambda day: day.number)
+
+
+def get_day(number, root=ROOT):
+    """Look up a single day by its number"""
+    for day in discover_days(root):
+        if day.number == int(number):
+            return day
+    raise KeyError(f"no solution folder for day {number}")
+
+
+def load_module(day):
+    """Import a day's main.py by path, since the folder names aren't importable"""
+    if day.module_name in sys.modules:
+        return sys.modules[day.module_name]
+
+    spec = importlib.util.spec_from_file_location(day.module_name, day.path / "main.py")
+    module = importlib.util.module_from_spec(spec)
+    # register before executing so dataclasses and pickling can find the module
+    sys.modules[day.module_name] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        del sys.modules[day.module_name]
+        raise
+    return module
+
+
+def get_parts(module):
+    """Return the (part number, solver) pairs a day module exposes"""
+    return [
+        (number, getattr(module, name))
+        for number, name in enumerate(PART_NAMES, start=1)
+        if callable(getattr(module, name, None))
+    ]
+
+
+def prepare_input(module, input_text):
+    """
+    What a day's parts take: parse(input_text) when the module defines it,
+    otherwise the input text itself. Parts must treat the parsed value as
+    read-only, since every part of a run is handed the same one.
+    """
+    parse = getattr(module, PARSE_NAME, None)
+    return parse(input_text) if callable(parse) else input_text
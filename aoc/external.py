@@ -0,0 +1,129 @@
+"""
+Out-of-core sorting of int64 streams too large to hold in memory.
+
+An ExternalSorter takes values in any order and buffers them in an
+array('q'). Whenever run_length values have arrived, it sorts them and
+spills them to a temporary file as raw int64s (8 bytes each, where a
+Python int in a list costs about 40). Iterating the sorter k-way merges
+the runs with heapq.merge, reading each run back block_length values at a
+time. Every run being merged holds an open file, so while there are more
+than merge_width runs, groups of merge_width are first merged into longer
+runs, pass after pass. Memory stays bounded by one run while sorting and
+by merge_width blocks while merging, and open files by merge_width,
+however many values there are.
+
+A sorter can be iterated more than once (each pass merges the runs again),
+and its files are removed when it's closed or its with block ends.
+"""
+import heapq
+import os
+import tempfile
+from array import array
+from itertools import islice
+
+# values sorted in memory per run; sorting goes through a list, ~40 bytes a value
+RUN_LENGTH = 1 << 20
+
+# values read back from each run at a time while merging
+BLOCK_LENGTH = 1 << 13
+
+# most runs merged at once, each with its file open
+MERGE_WIDTH = 64
+
+
+def read_run(path, block_length=BLOCK_LENGTH):
+    """The values of a run file, in order, read a block at a time"""
+    with open(path, "rb") as file:
+        while True:
+            block = array('q')
+            try:
+                block.fromfile(file, block_length)
+            except EOFError:
+                # the last, short block was still read in
+                yield from block
+                return
+            yield from block
+
+
+def write_run(path, values, block_length=BLOCK_LENGTH):
+    """Write values that are already in order as a run file, a block at a time"""
+    values = iter(values)
+    with open(path, "wb") as file:
+        while True:
+            block = array('q', islice(values, block_length))
+            if not block:
+                return
+            block.tofile(file)
+
+
+class ExternalSorter:
+    def __init__(self, directory=None, run_length=RUN_LENGTH, block_length=BLOCK_LENGTH,
+                 merge_width=MERGE_WIDTH):
+        if merge_width < 2:
+            raise ValueError("merge_width must be at least 2")
+        self.workdir = tempfile.TemporaryDirectory(prefix="aoc-sort-", dir=directory)
+        self.run_length = run_length
+        self.block_length = block_length
+        self.merge_width = merge_width
+        self.pending = array('q')
+        self.runs = []
+        self.files = 0
+        self.count = 0
+
+    def extend(self, values):
+        """Add values (any iterable of ints), spilling a sorted run whenever the buffer fills"""
+        self.pending.extend(values)
+        while len(self.pending) >= self.run_length:
+            self.spill(self.pending[:self.run_length])
+            del self.pending[:self.run_length]
+
+    def new_path(self):
+        """A fresh run file name in the work directory"""
+        self.files += 1
+        return os.path.join(self.workdir.name, f"run{self.files:06d}.bin")
+
+    def spill(self, values):
+        """Sort values and write them out as the next run"""
+        path = self.new_path()
+        with open(path, "wb") as file:
+            array('q', sorted(values)).tofile(file)
+        self.runs.append(path)
+        self.count += len(values)
+
+    def merge_runs(self):
+        """Merge groups of runs into longer ones until there are at most merge_width"""
+        while len(self.runs) > self.merge_width:
+            merged = []
+            for start in range(0, len(self.runs), self.merge_width):
+                group = self.runs[start:start + self.merge_width]
+                if len(group) == 1:
+                    merged.extend(group)
+                    continue
+                path = self.new_path()
+                write_run(path, heapq.merge(*(read_run(run, self.block_length) for run in group)),
+                          self.block_length)
+                for run in group:
+                    os.remove(run)
+                merged.append(path)
+            self.runs = merged
+
+    def __len__(self):
+        return self.count + len(self.pending)
+
+    def __iter__(self):
+        """Every value added so far, in ascending order"""
+        if self.pending:
+            self.spill(self.pending)
+            self.pending = array('q')
+        self.merge_runs()
+        return heapq.merge(*(read_run(path, self.block_length) for path in self.runs))
+
+    def close(self):
+        """Remove the run files"""
+        self.workdir.cleanup()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
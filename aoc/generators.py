@@ -0,0 +1,515 @@
+"""
+Seeded synthetic input generators, one per day.
+
+Every generator takes a size (what it scales is given by its unit) and a
+random.Random instance and returns puzzle text in the same format as that
+day's input.txt, so the solvers can be run on inputs much bigger than the
+bundled ones. Days whose solvers take extra options (grid size, number of
+fallen bytes) also return those options.
+"""
+import random
+import string
+from dataclasses import dataclass, field
+
+
+@dataclass
+class Generated:
+    text: str
+    options: dict = field(default_factory=dict)
+
+
+@dataclass(frozen=True)
+class Generator:
+    day: int
+    unit: str
+    base: int
+    func: object
+
+    def __call__(self, size, seed=0):
+        """Generate an input of the given size, reproducible for a given seed"""
+        rng = random.Random(f"{self.day}:{size}:{seed}")
+        result = self.func(size, rng)
+        return result if isinstance(result, Generated) else Generated(result)
+
+
+GENERATORS = {}
+
+
+def generator(day, unit, base):
+    """Register a generator for a day; base is the smallest size on the bench ladder"""
+    def register(func):
+        GENERATORS[day] = Generator(day, unit, base, func)
+        return func
+    return register
+
+
+def generate(day, size, seed=0):
+    """Generate a synthetic input for a day"""
+    if day not in GENERATORS:
+        raise KeyError(f"no input generator for day {day}")
+    return GENERATORS[day](size, seed)
+
+
+def grid_text(rows):
+    """Join grid rows (lists of chars or strings) into puzzle text"""
+    return "\n".join("".join(row) for row in rows) + "\n"
+
+
+def wrap(text, width=70):
+    """Split a long string into fixed-width lines"""
+    return "\n".join(text[i:i + width] for i in range(0, len(text), width))
+
+
+@generator(1, "lines", 1000)
+def historian_lists(size, rng):
+    """Two columns of location ids; the right one reuses ids so similarity is non-zero"""
+    pool = [rng.randint(10000, 99999) for _ in range(max(size // 4, 1))]
+    lines = []
+    for _ in range(size):
+        left = rng.choice(pool) if rng.random() < 0.5 else rng.randint(10000, 99999)
+        right = rng.choice(pool)
+        lines.append(f"{left}   {right}")
+    return "\n".join(lines) + "\n"
+
+
+@generator(2, "reports", 1000)
+def red_nosed_reports(size, rng):
+    """Mostly-monotone level reports with the occasional bad step"""
+    lines = []
+    for _ in range(size):
+        levels = [rng.randint(1, 90)]
+        sign = rng.choice((-1, 1))
+        for _ in range(rng.randint(4, 7)):
+            step = sign * rng.randint(1, 3)
+            if rng.random() < 0.1:
+                step = rng.choice((0, -step, step * 3))
+            levels.append(max(levels[-1] + step, 0))
+        lines.append(" ".join(map(str, levels)))
+    return "\n".join(lines) + "\n"
+
+
+@generator(3, "instructions", 1000)
+def corrupted_memory(size, rng):
+    """mul(X,Y) instructions mixed with do()/don't() and corrupted noise"""
+    noise = "!@#$%^&*()[]{}<>,;: mulwhatfromselect'"
+    chunks = []
+    for _ in range(size):
+        roll = rng.random()
+        if roll < 0.1:
+            chunks.append(rng.choice(("do()", "don't()")))
+        elif roll < 0.2:
+            chunks.append(rng.choice(("mul(4*", "mul[3,7]", "mul ( 2 , 4 )", "mul(32,64]")))
+        else:
+            chunks.append(f"mul({rng.randint(1, 999)},{rng.randint(1, 999)})")
+        chunks.append("".join(rng.choice(noise) for _ in range(rng.randint(0, 8))))
+    return wrap("".join(chunks), 3000) + "\n"
+
+
+@generator(4, "grid side", 50)
+def word_search(size, rng):
+    """Square grid of X, M, A and S"""
+    return grid_text(rng.choices("XMAS", k=size) for _ in range(size))
+
+
+@generator(5, "updates", 200)
+def print_queue(size, rng):
+    """Ordering rules over 49 pages plus updates, some of them out of order"""
+    pages = rng.sample(range(10, 100), 49)
+    rules = [(pages[i], pages[j]) for i in range(len(pages)) for j in range(i + 1, len(pages))]
+    rng.shuffle(rules)
+
+    updates = []
+    for _ in range(size):
+        update = rng.sample(pages, rng.choice(range(5, 24, 2)))
+        if rng.random() < 0.5:
+            update.sort(key=pages.index)
+        updates.append(",".join(map(str, update)))
+
+    return "\n".join(f"{x}|{y}" for x, y in rules) + "\n\n" + "\n".join(updates) + "\n"
+
+
+def find_guard_loop(grid, x, y):
+    """Walk the guard and return the last obstruction it turned at if the walk loops"""
+    height, width = len(grid), len(grid[0])
+    moves = [(0, -1), (1, 0), (0, 1), (-1, 0)]
+    direction = 0
+    seen = set()
+    last_obstruction = None
+    while 0 <= x < width and 0 <= y < height:
+        if (x, y, direction) in seen:
+            return last_obstruction
+        seen.add((x, y, direction))
+        next_x, next_y = x + moves[direction][0], y + moves[direction][1]
+        if 0 <= next_x < width and 0 <= next_y < height and grid[next_y][next_x] == '#':
+            last_obstruction = (next_x, next_y)
+            direction = (direction + 1) % 4
+        else:
+            x, y = next_x, next_y
+    return None
+
+
+@generator(6, "grid side", 50)
+def guard_map(size, rng):
+    """Lab map with scattered obstructions; obstructions causing loops are removed"""
+    grid = [['#' if rng.random() < 0.04 else '.' for _ in range(size)] for _ in range(size)]
+    x, y = size // 2, size // 2
+    grid[y][x] = '.'
+
+    # the solver never terminates on a looping walk, so break loops until the guard escapes
+    while (obstruction := find_guard_loop(grid, x, y)) is not None:
+        obstruction_x, obstruction_y = obstruction
+        grid[obstruction_y][obstruction_x] = '.'
+
+    grid[y][x] = '^'
+    return grid_text(grid)
+
+
+@generator(7, "equations", 50)
+def calibrations(size, rng):
+    """Equations whose test value is reachable about half of the time"""
+    lines = []
+    for _ in range(size):
+        numbers = [rng.randint(1, 99) for _ in range(rng.randint(3, 8))]
+        value = numbers[0]
+        for number in numbers[1:]:
+            op = rng.choice(("+", "*", "||"))
+            if op == "+":
+                value += number
+            elif op == "*":
+                value *= number
+            else:
+                value = int(f"{value}{number}")
+        if rng.random() < 0.5:
+            value += rng.randint(1, 9)
+        lines.append(f"{value}: " + " ".join(map(str, numbers)))
+    return "\n".join(lines) + "\n"
+
+
+@generator(8, "grid side", 50)
+def antenna_map(size, rng):
+    """Square map with a sprinkling of antennas across 62 frequencies"""
+    frequencies = string.digits + string.ascii_letters
+    grid = [
+        [rng.choice(frequencies) if rng.random() < 0.025 else '.' for _ in range(size)]
+        for _ in range(size)
+    ]
+    return grid_text(grid)
+
+
+@generator(9, "disk map digits", 500)
+def disk_map(size, rng):
+    """Dense disk map alternating file and free-space lengths, ending on a file"""
+    if size % 2 == 0:
+        size += 1
+    digits = [
+        str(rng.randint(1, 9)) if i % 2 == 0 else str(rng.randint(0, 9))
+        for i in range(size)
+    ]
+    return "".join(digits) + "\n"
+
+
+@generator(10, "grid side", 50)
+def topographic_map(size, rng):
+    """Height map with gentle slopes so trails actually exist"""
+    grid = []
+    for y in range(size):
+        row = []
+        for x in range(size):
+            bump = 5 if rng.random() < 0.05 else 0
+            row.append(str((x + y + bump) % 10))
+        grid.append(row)
+    return grid_text(grid)
+
+
+@generator(11, "stones", 8)
+def stones(size, rng):
+    """A line of engraved stones"""
+    return " ".join(str(rng.randint(0, 10 ** rng.randint(1, 7))) for _ in range(size)) + "\n"
+
+
+@generator(12, "grid side", 30)
+def garden_plots(size, rng):
+    """Garden of blocky plant regions with ragged edges"""
+    block = 4
+    letters = string.ascii_uppercase
+    blocks = [[rng.choice(letters) for _ in range(size // block + 1)] for _ in range(size // block + 1)]
+    grid = []
+    for y in range(size):
+        row = []
+        for x in range(size):
+            plant = blocks[y // block][x // block]
+            row.append(rng.choice(letters) if rng.random() < 0.05 else plant)
+        grid.append(row)
+    return grid_text(grid)
+
+
+@generator(13, "machines", 50)
+def claw_machines(size, rng):
+    """Claw machines, most of them winnable within 100 presses and some only past the part 2 offset"""
+    offset = 10**13
+    machines = []
+    for _ in range(size):
+        far = rng.random() < 0.25
+        while True:
+            ax, ay, bx, by = (rng.randint(10, 99) for _ in range(4))
+            # the part 2 solver divides by this determinant, and a far prize on
+            # the diagonal needs one button leaning each way to be reachable
+            determinant = ax * by - bx * ay
+            if determinant and (not far or (ax - ay) * (bx - by) < 0):
+                break
+        if far:
+            # aim near (offset, offset) and round down to presses that land exactly,
+            # so the part 1 prize is the small remainder past the offset
+            x, y = offset + rng.randint(1000, 20000), offset + rng.randint(1000, 20000)
+            a, b = (x * by - y * bx) // determinant, (ax * y - ay * x) // determinant
+            px, py = a * ax + b * bx - offset, a * ay + b * by - offset
+        else:
+            a, b = rng.randint(0, 100), rng.randint(0, 100)
+            px, py = a * ax + b * bx, a * ay + b * by
+            if rng.random() < 0.3:
+                px += rng.randint(1, 50)
+        machines.append(
+            f"Button A: X+{ax}, Y+{ay}\n"
+            f"Button B: X+{bx}, Y+{by}\n"
+            f"Prize: X={px}, Y={py}\n"
+        )
+    return "\n".join(machines)
+
+
+@generator(14, "robots", 500)
+def robots(size, rng):
+    """Robots positioned on the 101x103 floor"""
+    lines = []
+    for _ in range(size):
+        lines.append(
+            f"p={rng.randrange(101)},{rng.randrange(103)} "
+            f"v={rng.randint(-99, 99)},{rng.randint(-99, 99)}"
+        )
+    return "\n".join(lines) + "\n"
+
+
+@generator(15, "grid side", 20)
+def warehouse(size, rng):
+    """Walled warehouse with boxes and a robot, followed by side*side moves"""
+    grid = [['#'] * size]
+    for _ in range(size - 2):
+        row = ['#']
+        for _ in range(size - 2):
+            roll = rng.random()
+            row.append('#' if roll < 0.05 else 'O' if roll < 0.3 else '.')
+        grid.append(row + ['#'])
+    grid.append(['#'] * size)
+    grid[size // 2][size // 2] = '@'
+
+    moves = "".join(rng.choices("<>^v", k=size * size))
+    return grid_text(grid) + "\n" + wrap(moves) + "\n"
+
+
+@generator(16, "grid side", 21)
+def reindeer_maze(size, rng):
+    """Walled maze with random inner walls and a guaranteed open path from S to E"""
+    grid = [['#'] * size for _ in range(size)]
+    for y in range(1, size - 1):
+        for x in range(1, size - 1):
+            grid[y][x] = '#' if rng.random() < 0.25 else '.'
+
+    # open the bottom row and right column so S can always reach E
+    for x in range(1, size - 1):
+        grid[size - 2][x] = '.'
+    for y in range(1, size - 1):
+        grid[y][size - 2] = '.'
+
+    grid[size - 2][1] = 'S'
+    grid[1][size - 2] = 'E'
+    return grid_text(grid)
+
+
+@generator(17, "output values", 16)
+def chronospatial_program(size, rng):
+    """The usual 3-bit program with register A sized to print the requested number of values"""
+    register_a = rng.getrandbits(3 * size) | (1 << (3 * size - 1))
+    program = "2,4,1,1,7,5,1,5,4,0,0,3,5,5,3,0"
+    return (
+        f"Register A: {register_a}\n"
+        "Register B: 0\n"
+        "Register C: 0\n"
+        "\n"
+        f"Program: {program}\n"
+    )
+
+
+@generator(18, "grid side", 15)
+def falling_bytes(size, rng):
+    """Every cell but the corners falls in random order, so the exit eventually gets blocked"""
+    cells = [(x, y) for y in range(size) for x in range(size)]
+    cells.remove((0, 0))
+    cells.remove((size - 1, size - 1))
+    rng.shuffle(cells)
+    text = "\n".join(f"{x},{y}" for x, y in cells) + "\n"
+    return Generated(text, {"grid_size": size, "fallen": len(cells) // 5})
+
+
+@generator(19, "designs", 50)
+def towel_designs(size, rng):
+    """Towel patterns and designs, most of them buildable from the patterns"""
+    colors = "wubrg"
+    patterns = sorted({
+        "".join(rng.choices(colors, k=rng.randint(1, 8)))
+        for _ in range(400)
+    })
+    designs = []
+    for _ in range(size):
+        if rng.random() < 0.7:
+            design, length = "", rng.randint(20, 60)
+            while len(design) < length:
+                design += rng.choice(patterns)
+        else:
+            design = "".join(rng.choices(colors, k=rng.randint(20, 60)))
+        designs.append(design)
+    return ", ".join(patterns) + "\n\n" + "\n".join(designs) + "\n"
+
+
+@generator(20, "grid side", 41)
+def race_track(size, rng):
+    """A single track spiralling inwards from S to E through a walled grid"""
+    size |= 1
+    grid = [['#'] * size for _ in range(size)]
+
+    def open_ahead(y, x, dy, dx):
+        # the next cell is free, and so is the one past it, keeping a wall between rings
+        ny, nx = y + dy, x + dx
+        return (
+            0 < ny < size - 1 and 0 < nx < size - 1
+            and grid[ny][nx] == '#' and grid[ny + dy][nx + dx] == '#'
+        )
+
+    # each ring runs just inside the last, so a cheat through the wall between
+    # two rings skips a whole lap, long enough to clear 100 picoseconds
+    y, x, dy, dx = 1, 1, 0, 1
+    grid[y][x] = 'S'
+    while True:
+        if not open_ahead(y, x, dy, dx):
+            dy, dx = dx, -dy
+            if not open_ahead(y, x, dy, dx):
+                break
+        y, x = y + dy, x + dx
+        grid[y][x] = '.'
+
+    grid[y][x] = 'E'
+    return grid_text(grid)
+
+
+@generator(21, "codes", 50)
+def door_codes(size, rng):
+    """Numeric door codes"""
+    return "\n".join(f"{rng.randrange(1000):03d}A" for _ in range(size)) + "\n"
+
+
+@generator(22, "buyers", 100)
+def buyer_secrets(size, rng):
+    """Initial secret numbers, one per buyer"""
+    return "\n".join(str(rng.randrange(1, 16777216)) for _ in range(size)) + "\n"
+
+
+def computer_names(count, rng):
+    """Distinct random lowercase names, two letters long like the real input when possible"""
+    width = 2
+    while 26 ** width < count:
+        width += 1
+    names = []
+    for i in rng.sample(range(26 ** width), count):
+        name = ""
+        for _ in range(width):
+            i, letter = divmod(i, 26)
+            name += string.ascii_lowercase[letter]
+        names.append(name[::-1])
+    return names
+
+
+@generator(23, "computers", 100)
+def lan_connections(size, rng):
+    """Sparse random network with one planted clique of 13 computers"""
+    names = computer_names(size, rng)
+    edges = set()
+
+    clique = names[:min(13, size)]
+    for i, a in enumerate(clique):
+        for b in clique[i + 1:]:
+            edges.add((a, b))
+
+    for a in names:
+        for b in rng.sample(names, min(6, size)):
+            if a != b and (b, a) not in edges:
+                edges.add((a, b))
+
+    edges = list(edges)
+    rng.shuffle(edges)
+    return "\n".join(f"{a}-{b}" for a, b in edges) + "\n"
+
+
+@generator(24, "adder bits", 16)
+def adder_circuit(size, rng):
+    """A ripple-carry adder over size-bit x and y inputs with four pairs of gate outputs swapped, gates in random order"""
+    used = set()
+
+    def wire():
+        while True:
+            name = "".join(rng.choices(string.ascii_lowercase, k=3))
+            if name not in used and name[0] not in "xyz":
+                used.add(name)
+                return name
+
+    lines = [f"x{i:02d}: {rng.randint(0, 1)}" for i in range(size)]
+    lines += [f"y{i:02d}: {rng.randint(0, 1)}" for i in range(size)]
+
+    # each swap stays inside one bit (so no loops form) and breaks a rule part 2 checks:
+    # a sum bit traded with that bit's carry, carry-through or half carry, or the
+    # half sum traded with the half carry
+    swapped = {}
+    for i in rng.sample(range(1, size - 1), min(4, size - 2)):
+        first, second = rng.choice([
+            ("z", "carry_through"), ("z", "next_carry"), ("z", "half_carry"), ("half_sum", "half_carry"),
+        ])
+        swapped[i] = {first: second, second: first}
+
+    gates = ["x00 XOR y00 -> z00"]
+    carry = wire()
+    gates.append(f"x00 AND y00 -> {carry}")
+    for i in range(1, size):
+        names = {
+            "z": f"z{i:02d}",
+            "half_sum": wire(),
+            "half_carry": wire(),
+            "carry_through": wire(),
+            "next_carry": f"z{size:02d}" if i == size - 1 else wire(),
+        }
+        # a swapped gate writes the other gate's output wire; readers keep their inputs
+        out = {role: names[swapped.get(i, {}).get(role, role)] for role in names}
+        gates += [
+            f"x{i:02d} XOR y{i:02d} -> {out['half_sum']}",
+            f"x{i:02d} AND y{i:02d} -> {out['half_carry']}",
+            f"{names['half_sum']} XOR {carry} -> {out['z']}",
+            f"{names['half_sum']} AND {carry} -> {out['carry_through']}",
+            f"{names['half_carry']} OR {names['carry_through']} -> {out['next_carry']}",
+        ]
+        carry = names["next_carry"]
+    rng.shuffle(gates)
+
+    return "\n".join(lines) + "\n\n" + "\n".join(gates) + "\n"
+
+
+@generator(25, "schematics", 100)
+def lock_and_key_schematics(size, rng):
+    """Five-pin lock and key schematics, 7 rows tall"""
+    schematics = []
+    for _ in range(size):
+        heights = [rng.randint(0, 5) for _ in range(5)]
+        is_lock = rng.random() < 0.5
+        rows = []
+        for row in range(7):
+            if is_lock:
+                rows.append("".join('#' if row <= h else '.' for h in heights))
+            else:
+                rows.append("".join('#' if 6 - row <= h else '.' for h in heights))
+        schematics.append("\n".join(rows))
+    return "\n\n".join(schematics) + "\n"
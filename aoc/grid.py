@@ -0,0 +1,132 @@
+"""
+Compact character grid shared by the grid puzzles.
+
+Cells live row-major in one flat bytearray (one byte per cell) and are
+addressed by integer index rather than (x, y) tuples. The grid is wrapped
+in a border of sentinel cells, so walking one step (or `pad` steps) off
+the map lands on a cell holding OUTSIDE instead of needing a bounds check.
+Moving is plain index arithmetic with the precomputed offsets.
+"""
+from aoc.inputs import as_buffer
+
+# byte value of the sentinel cells around the grid
+OUTSIDE = 0
+
+
+class Grid:
+    __slots__ = ("width", "height", "pad", "stride", "cells", "offsets4", "offsets8")
+
+    def __init__(self, width, height, fill=".", pad=1, border=OUTSIDE):
+        self.width = width
+        self.height = height
+        self.pad = pad
+        self.stride = width + 2 * pad
+        self.cells = bytearray([border]) * (self.stride * (height + 2 * pad))
+
+        row = fill.encode() * width
+        for r in range(height):
+            start = self.index(r, 0)
+            self.cells[start:start + width] = row
+
+        # up, right, down, left (clockwise starting north)
+        self.offsets4 = (-self.stride, 1, self.stride, -1)
+        # the four above plus the diagonals, clockwise starting north
+        self.offsets8 = (
+            -self.stride, -self.stride + 1, 1, self.stride + 1,
+            self.stride, self.stride - 1, -1, -self.stride - 1,
+        )
+
+    @classmethod
+    def parse(cls, text, pad=1, border=OUTSIDE):
+        """Build a grid from puzzle text or a mapped input, one row per line"""
+        # rows are copied straight from the input bytes into the cells
+        lines = as_buffer(text).lines()
+        if not lines:
+            # nothing but whitespace: a grid with no cells inside its border
+            return cls(0, 0, pad=pad, border=border)
+
+        # a shorter or longer row would resize the cells and shift every row after it
+        width = len(lines[0])
+        for r, line in enumerate(lines):
+            if len(line) != width:
+                raise ValueError(f"grid row {r + 1} is {len(line)} wide, expected {width}")
+
+        grid = cls(width, len(lines), pad=pad, border=border)
+        for r, line in enumerate(lines):
+            start = grid.index(r, 0)
+            grid.cells[start:start + grid.width] = line
+        return grid
+
+    def index(self, row, col):
+        """Cell index of (row, col)"""
+        return (row + self.pad) * self.stride + col + self.pad
+
+    def position(self, index):
+        """(row, col) of a cell index"""
+        row, col = divmod(index, self.stride)
+        return row - self.pad, col - self.pad
+
+    def offset(self, d_row, d_col):
+        """Index delta for a step of (d_row, d_col)"""
+        return d_row * self.stride + d_col
+
+    def contains(self, index):
+        """Whether an index lies inside the grid (not on the border)"""
+        row, col = self.position(index)
+        return 0 <= row < self.height and 0 <= col < self.width
+
+    def is_edge(self, index):
+        """Whether an index lies on the outermost row or column of the grid"""
+        row, col = self.position(index)
+        return row in (0, self.height - 1) or col in (0, self.width - 1)
+
+    def __len__(self):
+        return self.width * self.height
+
+    def __getitem__(self, index):
+        return chr(self.cells[index])
+
+    def __setitem__(self, index, char):
+        self.cells[index] = ord(char)
+
+    def get(self, row, col):
+        """Character at (row, col)"""
+        return chr(self.cells[self.index(row, col)])
+
+    def find(self, char):
+        """Index of the first cell holding char, or -1"""
+        return self.cells.find(char.encode())
+
+    def find_all(self, char):
+        """Indices of every cell holding char, in row-major order"""
+        value = char.encode()
+        indices = []
+        index = self.cells.find(value)
+        while index != -1:
+            indices.append(index)
+            index = self.cells.find(value, index + 1)
+        return indices
+
+    def scan(self):
+        """Indices of every cell inside the grid, in row-major order"""
+        for r in range(self.height):
+            start = self.index(r, 0)
+            yield from range(start, start + self.width)
+
+    def copy(self):
+        """Independent copy of the grid"""
+        grid = object.__new__(Grid)
+        for name in self.__slots__:
+            setattr(grid, name, getattr(self, name))
+        grid.cells = bytearray(self.cells)
+        return grid
+
+    def rows(self):
+        """The grid's rows as strings, without the border"""
+        return [
+            self.cells[self.index(r, 0):self.index(r, 0) + self.width].decode()
+            for r in range(self.height)
+        ]
+
+    def __str__(self):
+        return "\n".join(self.rows())
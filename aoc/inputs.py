@@ -0,0 +1,172 @@
+"""
+Zero-copy access to puzzle inputs.
+
+InputBuffer memory-maps an input file read-only and hands out memoryview
+slices of it: the input without surrounding whitespace, its line offsets,
+its lines and its blank-line separated sections. Nothing is copied or
+decoded until a solver asks for it, so a large input costs page-cache
+reads rather than several str copies on the heap. Text that is already
+in memory (tests, stdin, generated inputs) is wrapped the same way, with
+one encode.
+
+Inputs too big to parse in one go stream through chunks(), slices of
+whole lines about CHUNK_BYTES long.
+
+Solvers that scan bytes accept either a str or an InputBuffer and pass it
+through as_buffer(). A day module that sets BUFFER_INPUT = True is handed
+the mapped file directly by the runner.
+"""
+import mmap
+import os
+from array import array
+
+NEWLINE = b"\n"
+CARRIAGE_RETURN = ord("\r")
+WHITESPACE = b" \t\r\n"
+
+# default size of the slices chunks() hands out
+CHUNK_BYTES = 1 << 20
+
+
+class InputBuffer:
+    def __init__(self, data, source="<memory>", closer=None):
+        self.data = data  # bytes, or an mmap of the file
+        self.view = memoryview(data)
+        self.source = source
+        self._closer = closer
+        self._offsets = None
+
+    @classmethod
+    def open(cls, path):
+        """Map a file read-only (the mapping stays valid after the file is closed)"""
+        with open(path, "rb") as file:
+            # mmap refuses empty files, and there's nothing to save on them anyway
+            if os.fstat(file.fileno()).st_size == 0:
+                return cls(b"", str(path))
+            mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        return cls(mapped, str(path), mapped.close)
+
+    @classmethod
+    def from_text(cls, text, source="<memory>"):
+        """Wrap text that's already in memory"""
+        return cls(text.encode(), source)
+
+    def close(self):
+        """Unmap the file; slices still held elsewhere keep it mapped until they're freed"""
+        self.view.release()
+        if self._closer is not None:
+            try:
+                self._closer()
+            except BufferError:
+                pass
+            self._closer = None
+
+    @property
+    def path(self):
+        """The file the input is mapped from, or None for text held in memory"""
+        return self.source if isinstance(self.data, mmap.mmap) else None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __len__(self):
+        return len(self.data)
+
+    def span(self):
+        """(start, end) offsets of the input without surrounding whitespace"""
+        data = self.data
+        start, end = 0, len(data)
+        while start < end and data[start] in WHITESPACE:
+            start += 1
+        while end > start and data[end - 1] in WHITESPACE:
+            end -= 1
+        return start, end
+
+    def stripped(self):
+        """The input without surrounding whitespace, as a memoryview"""
+        start, end = self.span()
+        return self.view[start:end]
+
+    def line_offsets(self):
+        """
+        Start offset of every line of the stripped input, followed by one past
+        its end, so line i spans offsets[i] to offsets[i + 1] - 1
+        """
+        if self._offsets is None:
+            data = self.data
+            start, end = self.span()
+            offsets = array('q', [start])
+            if start < end:
+                newline = data.find(NEWLINE, start, end)
+                while newline != -1:
+                    offsets.append(newline + 1)
+                    newline = data.find(NEWLINE, newline + 1, end)
+                offsets.append(end + 1)
+            self._offsets = offsets
+        return self._offsets
+
+    def iter_lines(self):
+        """Yield every line of the stripped input as a memoryview, without its line ending"""
+        data, view = self.data, self.view
+        offsets = self.line_offsets()
+        for i in range(len(offsets) - 1):
+            start, end = offsets[i], offsets[i + 1] - 1
+            if end > start and data[end - 1] == CARRIAGE_RETURN:
+                end -= 1
+            yield view[start:end]
+
+    def lines(self):
+        """Every line of the stripped input as a list of memoryviews"""
+        return list(self.iter_lines())
+
+    def sections(self):
+        """
+        Yield the lines grouped into blank-line separated sections, one list of
+        line views at a time, so only the current section's views are alive
+        """
+        current = []
+        for line in self.iter_lines():
+            if len(line):
+                current.append(line)
+            elif current:
+                yield current
+                current = []
+        if current:
+            yield current
+
+    def chunks(self, size=CHUNK_BYTES):
+        """
+        Yield the stripped input as memoryview slices of about size bytes, each
+        ending at a line break, so it can be parsed a block of lines at a time
+        """
+        data = self.data
+        start, end = self.span()
+        while start < end:
+            stop = start + size
+            if stop >= end:
+                stop = end
+            else:
+                # cut after the last line break in range, or after the line running past it
+                newline = data.rfind(NEWLINE, start, stop)
+                if newline == -1:
+                    newline = data.find(NEWLINE, stop, end)
+                stop = end if newline == -1 else newline + 1
+            yield self.view[start:stop]
+            start = stop
+
+    def text(self):
+        """The stripped input decoded to a str (this one does copy)"""
+        return self.stripped().tobytes().decode()
+
+
+def as_buffer(source):
+    """An InputBuffer for text, bytes or an existing buffer"""
+    if isinstance(source, InputBuffer):
+        return source
+    if isinstance(source, str):
+        return InputBuffer.from_text(source)
+    return InputBuffer(source)
+
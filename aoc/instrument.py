@@ -0,0 +1,117 @@
+"""
+Opt-in counters and timed sections for solver hot paths.
+
+Instrumentation is off unless a Recorder is enabled (the runner does this
+for `run --instrument`). Solvers fetch it once with current() and guard
+their bookkeeping with `if recorder is not None`, so when it's off the only
+cost is that check; section() hands back a shared no-op context manager.
+Counters can be fed from aggregates the code already keeps (like a
+search's SearchStats) instead of being bumped inside the loop.
+
+A recording dumps as JSON (Recorder.as_dict) or as folded stacks
+(folded), the "outer;inner microseconds" lines flame graph tools read.
+"""
+import time
+from collections import Counter
+from contextlib import contextmanager, nullcontext
+
+_NO_SECTION = nullcontext()
+
+
+class Recorder:
+    def __init__(self):
+        self.counters = Counter()
+        self.maxima = {}
+        # section path ("outer;inner") -> [calls, total seconds]
+        self.sections = {}
+        self.stack = []
+
+    def count(self, name, amount=1):
+        """Add to a named counter"""
+        self.counters[name] += amount
+
+    def count_all(self, prefix, values):
+        """Add every entry of a mapping (e.g. SearchStats.as_dict()) as prefix.name counters"""
+        for name, amount in values.items():
+            self.counters[f"{prefix}.{name}"] += amount
+
+    def maximum(self, name, value):
+        """Track the largest value seen, e.g. a recursion depth"""
+        if value > self.maxima.get(name, value - 1):
+            self.maxima[name] = value
+
+    @contextmanager
+    def section(self, name):
+        """Time a block; sections nest, and each path is timed separately"""
+        self.stack.append(name)
+        path = ";".join(self.stack)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            self.stack.pop()
+            totals = self.sections.setdefault(path, [0, 0.0])
+            totals[0] += 1
+            totals[1] += elapsed
+
+    def as_dict(self):
+        """The recording as plain JSON-serializable data"""
+        return {
+            "counters": dict(self.counters),
+            "maxima": dict(self.maxima),
+            "sections": {
+                path: {"calls": calls, "seconds": seconds}
+                for path, (calls, seconds) in self.sections.items()
+            },
+        }
+
+
+_recorder = None
+
+
+def enable():
+    """Start a fresh recording and return it"""
+    global _recorder
+    _recorder = Recorder()
+    return _recorder
+
+
+def disable():
+    """Stop recording and return what was recorded (None if nothing was)"""
+    global _recorder
+    recorder, _recorder = _recorder, None
+    return recorder
+
+
+def current():
+    """The active Recorder, or None when instrumentation is off"""
+    return _recorder
+
+
+def folded(recording, root=None):
+    """
+    Folded-stack lines for a recording (as returned by as_dict), weighted by
+    each section's self time in microseconds and optionally placed under a
+    common root frame such as "day16;part1"
+    """
+    sections = recording["sections"]
+    # a section's self time is its total minus the time spent in its children
+    self_time = {path: totals["seconds"] for path, totals in sections.items()}
+    for path, totals in sections.items():
+        parent = path.rpartition(";")[0]
+        if parent in self_time:
+            self_time[parent] -= totals["seconds"]
+
+    lines = []
+    for path, seconds in self_time.items():
+        stack = f"{root};{path}" if root else path
+        lines.append(f"{stack} {max(round(seconds * 1e6), 0)}")
+    return lines
+
+
+def section(name):
+    """Time a block when instrumentation is on; a no-op otherwise"""
+    if _recorder is None:
+        return _NO_SECTION
+    return _recorder.section(name)
@@ -0,0 +1,113 @@
+"""
+Bulk integer extraction for the numeric puzzle inputs.
+
+Every byte that can't be part of a number is translated to a space in one
+pass, and the result is split and converted with int() in C, straight into
+an array('q'). That is about twice as fast as re.findall() over the same
+bytes and much faster than splitting str lines one at a time. A mapped
+InputBuffer is translated one chunk of whole lines at a time, so only a
+chunk of the file is ever copied onto the heap. Anything
+between the numbers ("p=", "Button A: X+", "|", ",") is just a separator,
+so the same call serves every input format. A "-" directly in front of
+digits makes the number negative; inputs where a "-" is used otherwise
+(between two numbers, say) fall back to a regex scan.
+
+Fixed-size records (two numbers per line in day 01, six per machine in day
+13) come out of records() and columns(), and lines holding a varying count
+of numbers out of line_ints(). int_list() and line_ints() give plain Python
+ints, so they also take values too wide for an array('q'). as_numpy() views
+an array as a NumPy array without copying, when NumPy is installed.
+"""
+import re
+from array import array
+
+from aoc.inputs import CHUNK_BYTES, InputBuffer
+
+try:
+    import numpy
+except ImportError:  # numpy is optional, everything here works on array('q')
+    numpy = None
+
+DIGITS = b"0123456789"
+
+# byte translation tables keeping digits (and signs, and newlines) and blanking the rest
+SIGNED = bytes(byte if byte in DIGITS + b"-" else ord(" ") for byte in range(256))
+UNSIGNED = bytes(byte if byte in DIGITS else ord(" ") for byte in range(256))
+SIGNED_LINES = bytes(byte if byte in DIGITS + b"-\n" else ord(" ") for byte in range(256))
+UNSIGNED_LINES = bytes(byte if byte in DIGITS + b"\n" else ord(" ") for byte in range(256))
+
+SIGNED_NUMBER = re.compile(rb"-?\d+")
+UNSIGNED_NUMBER = re.compile(rb"\d+")
+
+
+def byte_chunks(source):
+    """Yield the bytes of a str, bytes-like object or InputBuffer, in pieces of whole lines"""
+    if isinstance(source, str):
+        yield source.encode()
+    elif isinstance(source, InputBuffer):
+        # translate() needs real bytes, so copy the mapping a chunk at a time
+        for chunk in source.chunks(CHUNK_BYTES):
+            yield chunk.tobytes()
+    else:
+        yield bytes(source)
+
+
+def split_ints(data, signed):
+    """Every integer in bytes, as a list of ints"""
+    table, pattern = (SIGNED, SIGNED_NUMBER) if signed else (UNSIGNED, UNSIGNED_NUMBER)
+    try:
+        return list(map(int, data.translate(table).split()))
+    except ValueError:
+        # a "-" that isn't a sign ("3-4", a lone dash) leaves a token int() rejects
+        return list(map(int, pattern.findall(data)))
+
+
+def ints(source, signed=True):
+    """Every integer in the input, in order, as an array('q')"""
+    values = array('q')
+    for data in byte_chunks(source):
+        values.extend(split_ints(data, signed))
+    return values
+
+
+def int_list(source, signed=True):
+    """Every integer in the input as a list, for values that may not fit in 64 bits"""
+    values = []
+    for data in byte_chunks(source):
+        values.extend(split_ints(data, signed))
+    return values
+
+
+def records(source, width, signed=True):
+    """The integers of the input grouped into tuples of width, one per record"""
+    values = ints(source, signed)
+    if len(values) % width:
+        raise ValueError(f"{len(values)} integers don't split into records of {width}")
+    return list(zip(*[iter(values)] * width))
+
+
+def columns(source, width, signed=True):
+    """The integers of the input split into width columns, each an array('q')"""
+    values = ints(source, signed)
+    if len(values) % width:
+        raise ValueError(f"{len(values)} integers don't split into records of {width}")
+    return [values[column::width] for column in range(width)]
+
+
+def line_ints(source, signed=True):
+    """The integers on each line holding any, as one list per line"""
+    table = SIGNED_LINES if signed else UNSIGNED_LINES
+    rows = []
+    for data in byte_chunks(source):
+        for line in data.translate(table).split(b"\n"):
+            if line and not line.isspace():
+                rows.append(split_ints(line, signed))
+    return rows
+
+
+def as_numpy(values, width=None):
+    """A NumPy view of an array('q'), reshaped into rows of width if given"""
+    if numpy is None:
+        raise ImportError("as_numpy() needs numpy installed")
+    view = numpy.frombuffer(values, dtype=numpy.int64)
+    return view if width is None else view.reshape(-1, width)
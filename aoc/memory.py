@@ -0,0 +1,172 @@
+"""
+Memory profiling for solver runs: peak usage, the lines holding the most
+memory at the peak, and per-day budgets.
+
+tracemalloc only reports the peak as a number, and a snapshot taken after
+the call has returned misses everything that was freed on the way out. So
+while a part runs, a sampler thread watches the traced size and takes a
+new snapshot whenever it climbs past the largest one seen so far; the top
+lines come from the snapshot nearest the peak, compared with one taken
+before the call.
+
+Budgets are peak bytes per day, stored in MiB in memory_budgets.json as
+{"default": mib, "<day>": mib}. Any part whose peak goes over its day's
+budget fails the run, and so does a parse that does.
+"""
+import gc
+import json
+import threading
+import time
+import tracemalloc
+from pathlib import Path
+
+from aoc.days import ROOT
+
+BUDGETS_PATH = ROOT / "memory_budgets.json"
+MIB = 1024 * 1024
+
+# how often the sampler checks the traced size, and how much it must grow
+# past the last snapshot before another (slow) snapshot is worth taking
+SAMPLE_INTERVAL = 0.02
+SNAPSHOT_GROWTH = 1.1
+
+# frames kept per traceback; only the allocating line is reported
+TRACEBACK_FRAMES = 1
+
+
+class PeakSampler(threading.Thread):
+    def __init__(self, baseline, interval=SAMPLE_INTERVAL):
+        super().__init__(daemon=True)
+        self.baseline = baseline
+        self.interval = interval
+        self.snapshot = None
+        self.snapshot_size = 0
+        self.done = threading.Event()
+
+    def run(self):
+        while not self.done.wait(self.interval):
+            self.sample()
+
+    def sample(self):
+        """Snapshot the heap if it's grown well past the last snapshot"""
+        current, _ = tracemalloc.get_traced_memory()
+        if current > max(self.snapshot_size * SNAPSHOT_GROWTH, self.baseline):
+            self.snapshot = tracemalloc.take_snapshot()
+            self.snapshot_size = current
+
+    def stop(self):
+        """Stop sampling, with a last look in case the peak was at the very end"""
+        self.done.set()
+        self.join()
+        self.sample()
+
+
+# allocations made by the profiler itself, not the solver
+IGNORED = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, threading.__file__),
+    tracemalloc.Filter(False, "*/_weakrefset.py"),
+    tracemalloc.Filter(False, __file__),
+)
+
+
+def source_line(frame):
+    """file:line of a frame, relative to the repo when it's one of ours"""
+    try:
+        filename = Path(frame.filename).relative_to(ROOT)
+    except ValueError:
+        filename = frame.filename
+    return f"{filename}:{frame.lineno}"
+
+
+def top_lines(snapshot, before, top):
+    """The top source lines by memory held in snapshot but not in before"""
+    snapshot, before = snapshot.filter_traces(IGNORED), before.filter_traces(IGNORED)
+    stats = snapshot.compare_to(before, "lineno")
+    lines = []
+    for stat in stats[:top]:
+        if stat.size_diff <= 0:
+            break
+        lines.append({
+            "line": source_line(stat.traceback[0]),
+            "size": stat.size_diff,
+            "count": stat.count_diff,
+        })
+    return lines
+
+
+def profile(func, *args, top=10):
+    """
+    Call func(*args) under tracemalloc and return (result, stats) where stats
+    holds wall time, CPU time, peak traced memory and the top allocating lines
+    near the peak.
+    """
+    gc.collect()
+    started_tracing = not tracemalloc.is_tracing()
+    if started_tracing:
+        tracemalloc.start(TRACEBACK_FRAMES)
+    tracemalloc.reset_peak()
+    before = tracemalloc.take_snapshot()
+    baseline, _ = tracemalloc.get_traced_memory()
+
+    sampler = PeakSampler(baseline)
+    sampler.start()
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time()
+    try:
+        result = func(*args)
+    finally:
+        wall_time = time.perf_counter() - wall_start
+        cpu_time = time.process_time() - cpu_start
+        sampler.stop()
+        _, peak = tracemalloc.get_traced_memory()
+        if started_tracing:
+            tracemalloc.stop()
+
+    top_allocations = top_lines(sampler.snapshot, before, top) if sampler.snapshot else []
+    return result, {
+        "wall_time": wall_time,
+        "cpu_time": cpu_time,
+        "peak_memory": max(peak - baseline, 0),
+        "top_allocations": top_allocations,
+    }
+
+
+def load_budgets(path=BUDGETS_PATH):
+    """Per-day memory budgets in MiB, keyed by day number or "default" (empty if there's no file)"""
+    try:
+        with open(path) as file:
+            return json.load(file)
+    except FileNotFoundError:
+        return {}
+
+
+def budget_for(budgets, day):
+    """A day's budget in bytes, or None if it has none"""
+    mib = budgets.get(str(day), budgets.get("default"))
+    return None if mib is None else int(mib * MIB)
+
+
+def check_budgets(reports, budgets):
+    """
+    Mark every part whose peak memory went over its day's budget and return
+    the violations as (day, part, peak, budget) tuples, with "parse" as the
+    part when it was the shared parse that went over
+    """
+    violations = []
+    for report in reports:
+        budget = budget_for(budgets, report["day"])
+        if budget is None:
+            continue
+        rows = list(report["parts"].items())
+        if "parse" in report:
+            rows.insert(0, ("parse", report["parse"]))
+        for part, row in rows:
+            peak = row.get("peak_memory")
+            if peak is None:
+                continue
+            row["memory_budget"] = budget
+            if peak > budget:
+                row["over_budget"] = True
+                violations.append((report["day"], part, peak, budget))
+    return violations
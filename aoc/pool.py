@@ -0,0 +1,171 @@
+"""
+Run day/part jobs concurrently on a process pool.
+
+Jobs are submitted longest-expected-first (using the wall times recorded by
+earlier runs in a timings history file), so the slow days start straight
+away and the short ones fill in the gaps on the other workers. With enough
+workers the whole run takes about as long as the slowest single job.
+"""
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+
+try:
+    import resource
+except ImportError:  # not available on Windows; jobs just report no max_rss
+    resource = None
+
+from aoc.days import ROOT, discover_days, get_day, get_parts
+from aoc.inputs import InputBuffer
+from aoc.runner import read_input, run_parse, run_part, wants_buffer
+
+TIMINGS_PATH = ROOT / ".aoc-timings.json"
+
+
+@dataclass(frozen=True)
+class Job:
+    day: int
+    part: int
+
+    @property
+    def key(self):
+        """Key of the job in the timings history"""
+        return f"{self.day}.{self.part}"
+
+
+def load_timings(path=TIMINGS_PATH):
+    """Wall times of previous runs, keyed by "day.part" (empty if there's no history yet)"""
+    try:
+        with open(path) as file:
+            return json.load(file)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def save_timings(timings, path=TIMINGS_PATH):
+    """Write the timings history"""
+    with open(path, "w") as file:
+        json.dump(timings, file, indent=2, sort_keys=True)
+        file.write("\n")
+
+
+def record_timings(results, path=TIMINGS_PATH):
+    """Fold the wall times of successful jobs into the timings history"""
+    timings = load_timings(path)
+    for job, row in results.items():
+        if "error" not in row:
+            timings[job.key] = round(row["wall_time"], 4)
+    save_timings(timings, path)
+
+
+def list_jobs(days, parts=None):
+    """One job per part each day exposes"""
+    jobs = []
+    for day in days:
+        for number, _ in get_parts(day.load()):
+            if not parts or number in parts:
+                jobs.append(Job(day.number, number))
+    return jobs
+
+
+def schedule(jobs, timings):
+    """
+    Order jobs longest-expected-first. Jobs with no recorded time go first,
+    since a slow unknown job started last would hold up the whole run.
+    """
+    return sorted(jobs, key=lambda job: -timings.get(job.key, float("inf")))
+
+
+def warm_worker(day_numbers=None):
+    """
+    Worker initializer: import the day modules up front and run their warm()
+    hooks, so the first job for a day doesn't pay for it and module-level
+    memo tables are filled once per worker rather than once per input
+    """
+    for day in discover_days():
+        if day_numbers is None or day.number in day_numbers:
+            warm = getattr(day.load(), "warm", None)
+            if callable(warm):
+                warm()
+
+
+def run_job(day_number, part, input_path=None, track_memory=True, instrumented=False,
+            memory_top=0, input_text=None, time_budget=None):
+    """Worker entry point: run one part of one day and return its result row"""
+    day = get_day(day_number)
+    module = day.load()
+    _, input_text = read_input(day, input_path, input_text, wants_buffer(module))
+    func = dict(get_parts(module))[part]
+
+    parsed, parse_row = run_parse(module, input_text, track_memory, memory_top)
+    if "error" in parse_row:
+        row = {"answer": None, "error": parse_row["error"]}
+    else:
+        row = run_part(func, parsed, track_memory, instrumented, memory_top, time_budget)
+    row["parse"] = parse_row
+    if isinstance(input_text, InputBuffer):
+        input_text.close()
+    row["worker"] = os.getpid()
+    if resource is not None:
+        # ru_maxrss is the worker's high-water mark (KiB on Linux) across every job it ran
+        row["max_rss"] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+    return row
+
+
+def run_pool(days, input_path=None, parts=None, track_memory=True, workers=None,
+             timings_path=TIMINGS_PATH, instrumented=False, memory_top=0, time_budget=None):
+    """Run the days' parts on a process pool and return one combined report"""
+    jobs = schedule(list_jobs(days, parts), load_timings(timings_path))
+    workers = workers or os.cpu_count() or 1
+    results = {}
+
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            executor.submit(
+                run_job, job.day, job.part, input_path, track_memory, instrumented, memory_top,
+                time_budget=time_budget,
+            ): job
+            for job in jobs
+        }
+        for future in as_completed(futures):
+            job = futures[future]
+            try:
+                results[job] = future.result()
+            except Exception as error:
+                # the worker itself died (e.g. killed for memory), not just the solver
+                results[job] = {"answer": None, "error": f"{type(error).__name__}: {error}"}
+    wall_time = time.perf_counter() - start
+
+    # only the bundled inputs have comparable timings from run to run, and
+    # profiling snapshots slow some parts far more than others
+    if input_path is None and not memory_top:
+        record_timings(results, timings_path)
+
+    reports = []
+    for day in days:
+        source = str(day.input_path if input_path is None else input_path)
+        report = {"day": day.number, "name": day.name, "input": source, "parts": {}}
+        parses = []
+        for job in jobs:
+            if job.day == day.number:
+                row = results[job]
+                if "parse" in row:
+                    parses.append(row.pop("parse"))
+                report["parts"][str(job.part)] = row
+        report["parts"] = dict(sorted(report["parts"].items()))
+        if parses:
+            # every job parsed for itself; report the hungriest parse, as the budget sees it
+            report["parse"] = max(parses, key=lambda row: row.get("peak_memory") or 0)
+        reports.append(report)
+
+    job_time = sum(row.get("wall_time", 0) for row in results.values())
+    return {
+        "workers": workers,
+        "wall_time": wall_time,
+        "job_time": job_time,
+        "order": [job.key for job in jobs],
+        "days": reports,
+    }
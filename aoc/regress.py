@@ -0,0 +1,233 @@
+"""
+Regression gate: golden answers plus time and memory budgets.
+
+Every day is checked on its bundled input and on one scaled synthetic input
+(the generator's base size times SYNTHETIC_SCALE). For each part the
+golden file stores the answer, the best wall time and the peak traced
+memory of the run that was accepted with --update. A later run fails when
+an answer changes, or when a part needs more than its stored time or
+memory plus a noise margin. Timings are taken without tracemalloc, which
+would distort them, and memory in a separate traced run (skipped for
+parts slower than MEMORY_MAX_SECONDS).
+
+Several days take a NumPy path when NumPy is installed, with its own
+timings and memory, so the golden file keeps one set of cases per backend
+("numpy" or "python") and a run is checked against its own backend's.
+
+Every check is also appended as one JSON line to a history file, so
+trends in the timings can be followed across commits.
+"""
+import json
+import math
+import platform
+import subprocess
+import time
+from dataclasses import dataclass, field
+
+from aoc.bench import accepted_options
+from aoc.days import ROOT, Day, get_parts, prepare_input
+from aoc.generators import GENERATORS, generate
+from aoc.runner import format_answer, measure
+
+try:
+    import numpy
+except ImportError:  # numpy is optional; without it the solvers run their pure-Python paths
+    numpy = None
+
+GOLDEN_PATH = ROOT / "regression_golden.json"
+HISTORY_PATH = ROOT / "regression_history.jsonl"
+
+SYNTHETIC_SCALE = 4
+
+# relative headroom over the stored measurement before a part fails
+DEFAULT_TIME_MARGIN = 0.5
+DEFAULT_MEMORY_MARGIN = 0.25
+
+# parts slower than this skip the traced run; tracemalloc makes them several
+# times slower still, which would dominate the whole gate
+MEMORY_MAX_SECONDS = 20
+
+# absolute headroom, so parts taking a few milliseconds aren't failed by jitter
+MIN_TIME_SLACK = 0.05
+MIN_MEMORY_SLACK = 256 * 1024
+
+
+@dataclass
+class Case:
+    key: str
+    day: Day
+    text: str
+    options: dict = field(default_factory=dict)
+
+
+def list_cases(days, synthetic=True, seed=0):
+    """The bundled input of each day, and a scaled synthetic one where there's a generator"""
+    cases = []
+    for day in days:
+        with open(day.input_path) as file:
+            cases.append(Case(f"{day.number}:bundled", day, file.read()))
+        if synthetic and day.number in GENERATORS:
+            size = GENERATORS[day.number].base * SYNTHETIC_SCALE
+            generated = generate(day.number, size, seed)
+            cases.append(Case(
+                f"{day.number}:synthetic:{size}:{seed}", day, generated.text, generated.options
+            ))
+    return cases
+
+
+def measure_part(func, case, repeats=1, track_memory=True, memory_max_seconds=MEMORY_MAX_SECONDS):
+    """Answer, best wall time and peak memory of one part on one case, parse included"""
+    module = case.day.load()
+    options = accepted_options(func, case.options)
+    call = lambda: func(prepare_input(module, case.text), **options)
+
+    seconds = math.inf
+    for _ in range(repeats):
+        answer, stats = measure(call, track_memory=False)
+        seconds = min(seconds, stats["wall_time"])
+
+    peak_memory = None
+    if track_memory and seconds <= memory_max_seconds:
+        _, stats = measure(call, track_memory=True)
+        peak_memory = stats["peak_memory"]
+
+    return {"answer": format_answer(answer), "seconds": seconds, "peak_memory": peak_memory}
+
+
+def run_cases(cases, repeats=1, track_memory=True, memory_max_seconds=MEMORY_MAX_SECONDS):
+    """Measure every part of every case, keyed {case: {part: measurement}}"""
+    results = {}
+    for case in cases:
+        results[case.key] = {}
+        for number, func in get_parts(case.day.load()):
+            try:
+                entry = measure_part(func, case, repeats, track_memory, memory_max_seconds)
+            except Exception as error:
+                entry = {"answer": None, "error": f"{type(error).__name__}: {error}"}
+            results[case.key][str(number)] = entry
+    return results
+
+
+def current_backend():
+    """The backend this interpreter's solvers run on, which goldens are kept by"""
+    return "python" if numpy is None else "numpy"
+
+
+def load_backends(path=GOLDEN_PATH):
+    """The whole golden file, {backend: {case: {part: measurement}}}"""
+    try:
+        with open(path) as file:
+            return json.load(file)
+    except FileNotFoundError:
+        return {}
+
+
+def load_golden(path=GOLDEN_PATH, backend=None):
+    """Load a backend's stored answers and measurements (empty if there are none yet)"""
+    return load_backends(path).get(backend or current_backend(), {})
+
+
+def save_golden(results, path=GOLDEN_PATH, backend=None):
+    """Store the results of a run as the backend's new golden answers and budgets"""
+    backends = load_backends(path)
+    golden = backends.setdefault(backend or current_backend(), {})
+    for key, parts in results.items():
+        golden[key] = {
+            part: {
+                "answer": entry["answer"],
+                "seconds": round(entry["seconds"], 4),
+                "peak_memory": entry["peak_memory"],
+            }
+            for part, entry in parts.items()
+            if "error" not in entry
+        }
+    for name, cases in backends.items():
+        backends[name] = dict(sorted(cases.items(), key=lambda item: case_order(item[0])))
+    with open(path, "w") as file:
+        json.dump(dict(sorted(backends.items())), file, indent=2)
+        file.write("\n")
+    return golden
+
+
+def case_order(key):
+    """Sort cases by day, bundled before synthetic"""
+    day, kind, *rest = key.split(":")
+    return int(day), kind != "bundled", rest
+
+
+def time_budget(seconds, margin):
+    """Longest acceptable wall time for a part stored as taking seconds"""
+    return seconds + max(seconds * margin, MIN_TIME_SLACK)
+
+
+def memory_budget(peak, margin):
+    """Largest acceptable peak for a part stored as peaking at peak bytes"""
+    return peak + max(peak * margin, MIN_MEMORY_SLACK)
+
+
+def compare(results, golden, time_margin=DEFAULT_TIME_MARGIN, memory_margin=DEFAULT_MEMORY_MARGIN):
+    """
+    Check a run against the golden file. Returns one row per case and part
+    with a status of "ok", "new" (nothing stored yet), "error", "wrong",
+    "slow" or "memory".
+    """
+    rows = []
+    for key, parts in results.items():
+        for part, entry in parts.items():
+            expected = golden.get(key, {}).get(part)
+            row = {"case": key, "part": int(part), **entry, "status": "ok"}
+            if "error" in entry:
+                row["status"] = "error"
+            elif expected is None:
+                row["status"] = "new"
+            else:
+                row["time_budget"] = time_budget(expected["seconds"], time_margin)
+                if expected["peak_memory"] is not None and entry["peak_memory"] is not None:
+                    row["memory_budget"] = memory_budget(expected["peak_memory"], memory_margin)
+                if entry["answer"] != expected["answer"]:
+                    row["status"] = "wrong"
+                    row["expected"] = expected["answer"]
+                elif entry["seconds"] > row["time_budget"]:
+                    row["status"] = "slow"
+                elif entry["peak_memory"] is not None and entry["peak_memory"] > row.get("memory_budget", math.inf):
+                    row["status"] = "memory"
+            rows.append(row)
+    return rows
+
+
+def failed(rows):
+    """Rows that should fail the gate"""
+    return [row for row in rows if row["status"] not in ("ok", "new")]
+
+
+def current_commit():
+    """Hash of the checked-out commit, if this is a git checkout"""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"], cwd=ROOT, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def append_history(rows, path=HISTORY_PATH):
+    """Append one JSON line describing this run to the history file"""
+    record = {
+        "time": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "commit": current_commit(),
+        "python": platform.python_version(),
+        "backend": current_backend(),
+        "rows": [
+            {
+                "case": row["case"],
+                "part": row["part"],
+                "status": row["status"],
+                "seconds": row.get("seconds"),
+                "peak_memory": row.get("peak_memory"),
+            }
+            for row in rows
+        ],
+    }
+    with open(path, "a") as file:
+        file.write(json.dumps(record) + "\n")
+    return record
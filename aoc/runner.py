@@ -0,0 +1,158 @@
+"""Run day solvers in-process and collect answers with per-part timings"""
+import gc
+import sys
+import time
+import tracemalloc
+
+from aoc import cancel, instrument, memory
+from aoc.days import discover_days, get_parts, prepare_input
+from aoc.inputs import InputBuffer
+
+
+def format_answer(answer):
+    """Answers are reported as strings, the way they're submitted"""
+    return None if answer is None else str(answer)
+
+
+def measure(func, *args, track_memory=True):
+    """
+    Call func(*args) and return (result, stats) where stats holds wall time,
+    CPU time and peak traced memory (in bytes) for the call.
+    """
+    gc.collect()
+    started_tracing = False
+    if track_memory:
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            started_tracing = True
+        tracemalloc.reset_peak()
+        baseline, _ = tracemalloc.get_traced_memory()
+
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time()
+    try:
+        result = func(*args)
+    finally:
+        wall_time = time.perf_counter() - wall_start
+        cpu_time = time.process_time() - cpu_start
+        peak_memory = None
+        if track_memory:
+            _, peak = tracemalloc.get_traced_memory()
+            peak_memory = max(peak - baseline, 0)
+            if started_tracing:
+                tracemalloc.stop()
+
+    return result, {"wall_time": wall_time, "cpu_time": cpu_time, "peak_memory": peak_memory}
+
+
+def read_input(day, input_path=None, input_text=None, mapped=False):
+    """
+    Resolve the input for a run: explicit text, a file path, or the bundled
+    input. With mapped=True a file is memory-mapped and returned as an
+    InputBuffer instead of being read into a str.
+    """
+    if input_text is not None:
+        return "<memory>", input_text
+    path = day.input_path if input_path is None else input_path
+    if str(path) == "-":
+        return "<stdin>", sys.stdin.read()
+    if mapped:
+        return str(path), InputBuffer.open(path)
+    with open(path) as file:
+        return str(path), file.read()
+
+
+def wants_buffer(module):
+    """Whether a day's parse takes the mapped input directly (BUFFER_INPUT = True)"""
+    return getattr(module, "BUFFER_INPUT", False)
+
+
+def run_parse(module, input_text, track_memory=True, memory_top=0):
+    """
+    Parse the input once for all of a day's parts. Returns (parsed, row),
+    where the row holds the parse's timings or the error it raised. With
+    memory_top set, the parse is memory-profiled like the parts.
+    """
+    try:
+        if memory_top:
+            parsed, stats = memory.profile(prepare_input, module, input_text, top=memory_top)
+        else:
+            parsed, stats = measure(prepare_input, module, input_text, track_memory=track_memory)
+    except Exception as error:
+        return None, {"error": f"{type(error).__name__}: {error}"}
+    return parsed, stats
+
+
+def run_part(func, parsed, track_memory=True, instrumented=False, memory_top=0,
+             time_budget=None):
+    """
+    Run a single part on the parsed input and return its result row. With
+    memory_top set, the part is memory-profiled and the row lists its top
+    allocating lines. With time_budget set, a part still running after that
+    many seconds is cancelled and its row reports how far it got.
+    """
+    recorder = instrument.enable() if instrumented else None
+    try:
+        with cancel.limit(time_budget):
+            if memory_top:
+                answer, stats = memory.profile(func, parsed, top=memory_top)
+            else:
+                answer, stats = measure(func, parsed, track_memory=track_memory)
+    except cancel.Cancelled as cancelled:
+        return cancel.timed_out_row(cancelled)
+    except Exception as error:
+        return {"answer": None, "error": f"{type(error).__name__}: {error}"}
+    finally:
+        if recorder is not None:
+            instrument.disable()
+
+    row = {"answer": format_answer(answer), **stats}
+    if recorder is not None:
+        row["instrument"] = recorder.as_dict()
+    return row
+
+
+def run_day(day, input_path=None, input_text=None, parts=None, track_memory=True,
+            instrumented=False, memory_top=0, time_budget=None):
+    """Run the requested parts of a day and return a JSON-serializable report"""
+    module = day.load()
+    source, input_text = read_input(day, input_path, input_text, wants_buffer(module))
+    report = {"day": day.number, "name": day.name, "input": source, "parts": {}}
+
+    # every part shares one parse of the input
+    parsed, report["parse"] = run_parse(module, input_text, track_memory, memory_top)
+    for number, func in get_parts(module):
+        if parts and number not in parts:
+            continue
+        if "error" in report["parse"]:
+            report["parts"][str(number)] = {"answer": None, "error": report["parse"]["error"]}
+            continue
+        report["parts"][str(number)] = run_part(
+            func, parsed, track_memory, instrumented, memory_top, time_budget
+        )
+
+    if isinstance(input_text, InputBuffer):
+        input_text.close()
+    return report
+
+
+def select_days(numbers=None):
+    """Return the days to run, all of them if no numbers are given"""
+    days = discover_days()
+    if not numbers:
+        return days
+    wanted = {int(number) for number in numbers}
+    missing = wanted - {day.number for day in days}
+    if missing:
+        raise KeyError(f"no solution folder for day(s) {sorted(missing)}")
+    return [day for day in days if day.number in wanted]
+
+
+def run_days(days, input_path=None, input_text=None, parts=None, track_memory=True,
+             instrumented=False, memory_top=0, time_budget=None):
+    """Run several days in this interpreter, one after another"""
+    return [
+        run_day(day, input_path, input_text, parts, track_memory, instrumented, memory_top,
+                time_budget)
+        for day in days
+    ]
@@ -0,0 +1,332 @@
+"""
+Graph search over integer node ids: BFS, 0-1 BFS, Dijkstra and A*.
+
+Nodes are plain ints in range(size), e.g. Grid cell indices or
+index * 4 + direction for searches that also track a heading. Distances
+and predecessors live in flat arrays instead of dicts keyed by tuples, and
+every search accepts several sources and an optional set of targets (the
+search stops at the first target it settles).
+
+`neighbors` is a function of a node. For bfs it returns the next nodes;
+for the weighted searches it returns (node, cost) pairs. bfs_grid is the
+same search specialised for Grid cells, where the neighbors are fixed
+offsets and a cell is enterable based on its byte alone, which avoids a
+function call per node.
+
+A fresh search allocates arrays over all size nodes. Callers that run many
+small searches over the same nodes (a flood fill per region, say) can pass
+the two BFSes their own seen and distances buffers and reuse them across
+calls: nodes marked seen by an earlier call are skipped, and each call only
+writes the entries of the nodes it reaches.
+"""
+import heapq
+from array import array
+from collections import deque
+from dataclasses import dataclass, field
+
+UNREACHED = -1
+NO_PARENT = -1
+
+
+@dataclass
+class SearchStats:
+    pushed: int = 0    # queue insertions
+    popped: int = 0    # queue removals, including stale entries
+    expanded: int = 0  # nodes whose neighbors were generated
+    relaxed: int = 0   # edges that improved a distance
+
+    def as_dict(self):
+        return {
+            "pushed": self.pushed,
+            "popped": self.popped,
+            "expanded": self.expanded,
+            "relaxed": self.relaxed,
+        }
+
+
+@dataclass
+class SearchResult:
+    distances: array
+    parents: array = None
+    order: list = field(default_factory=list)  # nodes in the order they were settled
+    target: int = None  # the target the search stopped at, if any
+    stats: SearchStats = field(default_factory=SearchStats)
+
+    def reached(self, node):
+        """Whether the search found a path to node"""
+        return self.distances[node] != UNREACHED
+
+    def path(self, node):
+        """Nodes from a source to node; needs track_parents=True"""
+        if self.parents is None:
+            raise ValueError("search was run without track_parents")
+        if not self.reached(node):
+            return []
+        path = [node]
+        while self.parents[path[-1]] != NO_PARENT:
+            path.append(self.parents[path[-1]])
+        return path[::-1]
+
+
+def new_arrays(size, track_parents, distances=None):
+    """Distance (and optionally predecessor) arrays for size nodes, reusing distances if given"""
+    if distances is None:
+        distances = array('q', [UNREACHED]) * size
+    parents = array('q', [NO_PARENT]) * size if track_parents else None
+    return distances, parents
+
+
+def bfs(neighbors, sources, size, targets=(), track_parents=False, seen=None, distances=None):
+    """
+    Breadth-first search where every edge costs 1. seen (a bytearray) and
+    distances can be buffers shared with earlier searches over the same nodes.
+    """
+    distances, parents = new_arrays(size, track_parents, distances)
+    # reading a bytearray is cheaper than reading the distance array back
+    if seen is None:
+        seen = bytearray(size)
+    result = SearchResult(distances, parents)
+    order = result.order
+
+    queue = deque()
+    for source in sources:
+        if not seen[source]:
+            seen[source] = 1
+            distances[source] = 0
+            queue.append(source)
+
+    # counters are kept in locals on the hot path and stored once at the end
+    sources_pushed = pushed = len(queue)
+    expanded = 0
+    popleft, push, settle = queue.popleft, queue.append, order.append
+    while queue:
+        node = popleft()
+        settle(node)
+        if node in targets:
+            result.target = node
+            break
+
+        expanded += 1
+        next_distance = distances[node] + 1
+        for neighbor in neighbors(node):
+            if not seen[neighbor]:
+                seen[neighbor] = 1
+                distances[neighbor] = next_distance
+                if parents is not None:
+                    parents[neighbor] = node
+                push(neighbor)
+                pushed += 1
+
+    stats = result.stats
+    stats.pushed = pushed
+    stats.popped = len(order)
+    stats.expanded = expanded
+    stats.relaxed = pushed - sources_pushed
+    return result
+
+
+def bfs_grid(cells, offsets, passable, sources, targets=(), track_parents=False, seen=None, distances=None):
+    """
+    BFS over grid cells: moves are the given index offsets, and a cell can be
+    entered when its byte value is in passable (e.g. b".SE"). seen and
+    distances can be shared buffers, as for bfs.
+    """
+    enterable = bytearray(256)
+    for value in passable:
+        enterable[value] = 1
+
+    distances, parents = new_arrays(len(cells), track_parents, distances)
+    # reading a bytearray is cheaper than reading the distance array back
+    if seen is None:
+        seen = bytearray(len(cells))
+    result = SearchResult(distances, parents)
+    order = result.order
+
+    queue = deque()
+    for source in sources:
+        if not seen[source]:
+            seen[source] = 1
+            distances[source] = 0
+            queue.append(source)
+
+    sources_pushed = pushed = len(queue)
+    expanded = 0
+    popleft, push, settle = queue.popleft, queue.append, order.append
+    while queue:
+        node = popleft()
+        settle(node)
+        if node in targets:
+            result.target = node
+            break
+
+        expanded += 1
+        next_distance = distances[node] + 1
+        for step in offsets:
+            neighbor = node + step
+            if enterable[cells[neighbor]] and not seen[neighbor]:
+                seen[neighbor] = 1
+                distances[neighbor] = next_distance
+                if parents is not None:
+                    parents[neighbor] = node
+                push(neighbor)
+                pushed += 1
+
+    stats = result.stats
+    stats.pushed = pushed
+    stats.popped = len(order)
+    stats.expanded = expanded
+    stats.relaxed = pushed - sources_pushed
+    return result
+
+
+def bfs_01(neighbors, sources, size, targets=(), track_parents=False):
+    """Shortest paths when every edge costs 0 or 1, using a deque instead of a heap"""
+    distances, parents = new_arrays(size, track_parents)
+    settled = bytearray(size)
+    result = SearchResult(distances, parents)
+    stats, order = result.stats, result.order
+
+    queue = deque()
+    for source in sources:
+        distances[source] = 0
+        queue.append(source)
+        stats.pushed += 1
+
+    while queue:
+        node = queue.popleft()
+        stats.popped += 1
+        if settled[node]:
+            continue
+        settled[node] = 1
+        order.append(node)
+        if node in targets:
+            result.target = node
+            return result
+
+        stats.expanded += 1
+        distance = distances[node]
+        for neighbor, cost in neighbors(node):
+            new_distance = distance + cost
+            if not settled[neighbor] and (
+                distances[neighbor] == UNREACHED or new_distance < distances[neighbor]
+            ):
+                distances[neighbor] = new_distance
+                if parents is not None:
+                    parents[neighbor] = node
+                # free edges go to the front so the deque stays sorted by distance
+                if cost:
+                    queue.append(neighbor)
+                else:
+                    queue.appendleft(neighbor)
+                stats.pushed += 1
+                stats.relaxed += 1
+
+    return result
+
+
+def dijkstra(neighbors, sources, size, targets=(), track_parents=False, max_weight=None):
+    """
+    Shortest paths with non-negative integer edge costs. When the largest
+    edge cost is known and small, pass it as max_weight to use a bucket
+    queue (Dial's algorithm) instead of a binary heap.
+    """
+    if max_weight is not None:
+        return _dial(neighbors, sources, size, targets, track_parents, max_weight)
+    return _best_first(neighbors, sources, size, targets, track_parents, heuristic=None)
+
+
+def astar(neighbors, sources, size, targets, heuristic, track_parents=False):
+    """A* search; heuristic(node) must never overestimate the cost to a target"""
+    return _best_first(neighbors, sources, size, targets, track_parents, heuristic)
+
+
+def _best_first(neighbors, sources, size, targets, track_parents, heuristic):
+    """Heap-based Dijkstra, or A* when a heuristic is given"""
+    distances, parents = new_arrays(size, track_parents)
+    settled = bytearray(size)
+    result = SearchResult(distances, parents)
+    stats, order = result.stats, result.order
+
+    heap = []
+    for source in sources:
+        distances[source] = 0
+        heapq.heappush(heap, (heuristic(source) if heuristic else 0, source))
+        stats.pushed += 1
+
+    while heap:
+        _, node = heapq.heappop(heap)
+        stats.popped += 1
+        if settled[node]:
+            continue
+        settled[node] = 1
+        order.append(node)
+        if node in targets:
+            result.target = node
+            return result
+
+        stats.expanded += 1
+        distance = distances[node]
+        for neighbor, cost in neighbors(node):
+            new_distance = distance + cost
+            if not settled[neighbor] and (
+                distances[neighbor] == UNREACHED or new_distance < distances[neighbor]
+            ):
+                distances[neighbor] = new_distance
+                if parents is not None:
+                    parents[neighbor] = node
+                priority = new_distance + heuristic(neighbor) if heuristic else new_distance
+                heapq.heappush(heap, (priority, neighbor))
+                stats.pushed += 1
+                stats.relaxed += 1
+
+    return result
+
+
+def _dial(neighbors, sources, size, targets, track_parents, max_weight):
+    """Dijkstra with a circular array of buckets, one per distance modulo max_weight + 1"""
+    distances, parents = new_arrays(size, track_parents)
+    settled = bytearray(size)
+    result = SearchResult(distances, parents)
+    stats, order = result.stats, result.order
+
+    width = max_weight + 1
+    buckets = [[] for _ in range(width)]
+    pending = 0
+    for source in sources:
+        distances[source] = 0
+        buckets[0].append(source)
+        pending += 1
+        stats.pushed += 1
+
+    distance = 0
+    while pending:
+        bucket = buckets[distance % width]
+        while bucket:
+            node = bucket.pop()
+            pending -= 1
+            stats.popped += 1
+            # stale entries were superseded by a shorter distance
+            if settled[node] or distances[node] != distance:
+                continue
+            settled[node] = 1
+            order.append(node)
+            if node in targets:
+                result.target = node
+                return result
+
+            stats.expanded += 1
+            for neighbor, cost in neighbors(node):
+                new_distance = distance + cost
+                if not settled[neighbor] and (
+                    distances[neighbor] == UNREACHED or new_distance < distances[neighbor]
+                ):
+                    distances[neighbor] = new_distance
+                    if parents is not None:
+                        parents[neighbor] = node
+                    buckets[new_distance % width].append(neighbor)
+                    pending += 1
+                    stats.pushed += 1
+                    stats.relaxed += 1
+        distance += 1
+
+    return result
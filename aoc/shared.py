@@ -0,0 +1,111 @@
+"""
+Broadcast read-only arrays to process-pool workers through shared memory.
+
+Handing a grid or distance field to every task of a pool means pickling
+it into each task, so per-task overhead grows with the grid. Instead the
+owner copies the arrays once into a single multiprocessing.shared_memory
+block and passes workers a Handle: the block's name plus each array's
+typecode, offset and length, a few hundred bytes whatever the grid size.
+A worker attaches once (as the pool initializer) and gets memoryviews cast
+to the original typecodes, reading the block in place.
+
+Workers detach when they exit, and the owner unlinks the block when the
+SharedArrays context closes, after the pool has shut down. map_shared()
+wraps the whole lifecycle for the common case.
+"""
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import partial
+from multiprocessing import shared_memory, util
+
+# item sizes are aligned to this, so every cast view starts on a boundary
+ALIGNMENT = 8
+
+
+@dataclass(frozen=True)
+class Handle:
+    name: str
+    # (key, typecode, offset in bytes, length in items) for each shared array
+    fields: tuple
+
+
+class SharedArrays:
+    def __init__(self, arrays):
+        """Copy a dict of arrays (array.array, bytes or bytearray) into one shared block"""
+        layout = []
+        size = 0
+        for key, values in arrays.items():
+            view = memoryview(values)
+            layout.append((key, view.format, size, len(view), view.cast("B")))
+            size += -(-view.nbytes // ALIGNMENT) * ALIGNMENT
+
+        # a zero-size block isn't allowed, even when every array is empty
+        self.memory = shared_memory.SharedMemory(create=True, size=max(size, 1))
+        for _, _, offset, _, data in layout:
+            self.memory.buf[offset:offset + len(data)] = data
+        self.handle = Handle(
+            self.memory.name,
+            tuple((key, typecode, offset, length) for key, typecode, offset, length, _ in layout),
+        )
+
+    def close(self):
+        """Free the block; workers still attached keep their mapping until they detach"""
+        if self.memory is not None:
+            self.memory.close()
+            self.memory.unlink()
+            self.memory = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+# blocks this process has attached to, by name: (SharedMemory, {key: view})
+attached = {}
+
+
+def attach(handle):
+    """The shared arrays as zero-copy memoryviews keyed like the shared dict, attaching once per process"""
+    entry = attached.get(handle.name)
+    if entry is None:
+        memory = shared_memory.SharedMemory(name=handle.name)
+        views = {
+            key: memory.buf[offset:offset + length * array(typecode).itemsize].cast(typecode)
+            for key, typecode, offset, length in handle.fields
+        }
+        attached[handle.name] = entry = (memory, views)
+        # release the mapping when the worker exits (pool workers skip atexit hooks)
+        util.Finalize(None, detach, args=(handle.name,), exitpriority=10)
+    return entry[1]
+
+
+def detach(name):
+    """Release the views of an attached block and close this process's mapping of it"""
+    entry = attached.pop(name, None)
+    if entry is None:
+        return
+    memory, views = entry
+    for view in views.values():
+        view.release()
+    memory.close()
+
+
+def run_shared(func, handle, task):
+    """Worker entry point: func(views, task) on the attached arrays"""
+    return func(attach(handle), task)
+
+
+def map_shared(func, arrays, tasks, workers=None):
+    """
+    Run func(views, task) for every task on a process pool whose workers
+    share arrays, returning the results in task order. func must be a
+    module-level function so it can be sent to the workers by name.
+    """
+    with SharedArrays(arrays) as shared:
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=attach, initargs=(shared.handle,)
+        ) as executor:
+            return list(executor.map(partial(run_shared, func, shared.handle), tasks))
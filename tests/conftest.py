@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# make the shared aoc package importable when pytest runs from anywhere
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
@@ -0,0 +1,33 @@
+import io
+import json
+
+from aoc import batch
+from aoc.days import get_day
+
+EXAMPLE = "3   4\n4   3\n2   5\n1   3\n3   9\n3   3\n"
+
+
+def test_expand_inputs_dedupes_and_keeps_missing_files(tmp_path):
+    (tmp_path / "b.txt").write_text(EXAMPLE)
+    (tmp_path / "a.txt").write_text(EXAMPLE)
+    (tmp_path / "sub").mkdir()
+    a, b = str(tmp_path / "a.txt"), str(tmp_path / "b.txt")
+    missing = str(tmp_path / "missing.txt")
+    assert batch.expand_inputs([str(tmp_path), str(tmp_path / "*.txt"), missing]) == [a, b, missing]
+
+
+def test_run_batch_writes_a_row_per_input(tmp_path):
+    for name in ("one.txt", "two.txt"):
+        (tmp_path / name).write_text(EXAMPLE)
+    missing = str(tmp_path / "missing.txt")
+    out = io.StringIO()
+    failures = batch.run_batch(
+        get_day(1), [str(tmp_path / "*.txt"), missing], workers=2,
+        write=batch.json_line_writer(out),
+    )
+    rows = {row["input"]: row for row in map(json.loads, out.getvalue().splitlines())}
+    assert failures == 1 and len(rows) == 3
+    assert rows[missing]["error"].startswith("FileNotFoundError")
+    for name in ("one.txt", "two.txt"):
+        parts = rows[str(tmp_path / name)]["parts"]
+        assert (parts["1"]["answer"], parts["2"]["answer"]) == ("11", "31")
@@ -0,0 +1,64 @@
+import random
+
+import pytest
+
+from aoc.bitset import BitArray, Bitset, Index, bits_from_indices, iter_bits
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_bits_round_trip(seed):
+    rng = random.Random(seed)
+    members = set(rng.sample(range(rng.choice([10, 70, 1000])), rng.randint(0, 10)))
+    bits = bits_from_indices(members)
+    assert bits == sum(1 << index for index in members)
+    assert list(iter_bits(bits)) == sorted(members)
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_bitset_matches_set(seed):
+    rng = random.Random(seed)
+    a = set(rng.sample(range(200), 30))
+    b = set(rng.sample(range(200), 30))
+    first, second = Bitset.from_indices(a), Bitset.from_indices(b)
+
+    assert set(first | second) == a | b
+    assert set(first & second) == a & b
+    assert set(first - second) == a - b
+    assert set(first ^ second) == a ^ b
+    assert len(first) == len(a)
+    assert all((index in first) == (index in a) for index in range(210))
+    assert set(first.shifted(5)) == {index + 5 for index in a}
+    assert set(first.shifted(-5)) == {index - 5 for index in a if index >= 5}
+    assert set(first.above(99)) == {index for index in a if index > 99}
+    assert first == Bitset.from_indices(sorted(a)) and hash(first) == hash(Bitset.from_indices(a))
+
+
+def test_empty_bitset():
+    assert bits_from_indices([]) == 0
+    assert not Bitset() and len(Bitset()) == 0 and list(Bitset()) == []
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_bit_array_matches_set(seed):
+    rng = random.Random(seed)
+    size = rng.randint(1, 300)
+    bits, expected = BitArray(size), set()
+    for _ in range(200):
+        index = rng.randrange(size)
+        if rng.random() < 0.7:
+            bits.add(index)
+            expected.add(index)
+        else:
+            bits.discard(index)
+            expected.discard(index)
+    assert all((index in bits) == (index in expected) for index in range(size))
+    assert len(bits) == len(expected)
+    assert list(bits) == sorted(expected)
+    assert set(bits.to_bitset()) == expected
+
+
+def test_index_numbers_keys_in_order():
+    index = Index(["kh", "tc", "qp"])
+    assert index.add("tc") == 1 and index.add("de") == 3
+    assert len(index) == 4 and index["qp"] == 2
+    assert index.keys_of(index.bitset(["de", "kh"])) == ["kh", "de"]
@@ -0,0 +1,86 @@
+import os
+from array import array
+
+import pytest
+
+from aoc import cache
+
+
+@pytest.fixture
+def store(tmp_path):
+    yield cache.configure(tmp_path / "cache")
+    cache.configure(None)
+
+
+def test_content_keys_follow_the_content():
+    key = cache.content_key("grid", b"ab", "c")
+    assert key.startswith("grid-")
+    assert key == cache.content_key("grid", bytearray(b"ab"), "c")
+    # parts are length-prefixed, and arrays keyed by their typecode too
+    assert key != cache.content_key("grid", b"a", "bc")
+    assert cache.content_key("n", array('b', [1])) != cache.content_key("n", array('B', [1]))
+    assert key != cache.content_key("other", b"ab", "c")
+
+
+def test_entries_survive_a_new_cache_instance(tmp_path):
+    first = cache.ArtifactCache(tmp_path)
+    first.put("key", {"cells": array('q', [1, 2, 3])})
+    second = cache.ArtifactCache(tmp_path)
+    assert second.get("key") == {"cells": array('q', [1, 2, 3])}
+    assert second.get("missing", "default") == "default"
+    assert (second.hits, second.misses) == (1, 1)
+
+
+def test_unreadable_entry_is_a_miss(tmp_path):
+    store = cache.ArtifactCache(tmp_path)
+    (tmp_path / "broken.pkl").write_bytes(b"not a pickle")
+    assert store.get("broken") is None
+    assert not (tmp_path / "broken.pkl").exists()
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    store = cache.ArtifactCache(tmp_path, max_bytes=10**9)
+    for number, key in enumerate(["old", "used", "new"]):
+        store.put(key, bytes(1000))
+        os.utime(tmp_path / f"{key}.pkl", (number, number))
+    # reading an entry marks it as used now
+    cache.ArtifactCache(tmp_path).get("used")
+
+    store.max_bytes = 2500
+    store.evict()
+    assert sorted(path.stem for path, _, _ in store.entries()) == ["new", "used"]
+    store.clear()
+    assert store.stats()["entries"] == 0
+
+
+def test_cached_computes_once(store):
+    calls = []
+    compute = lambda: calls.append(1) or [1, 2]
+    assert cache.cached("numbers", (b"input",), compute) == [1, 2]
+    assert cache.cached("numbers", (b"input",), compute) == [1, 2]
+    assert cache.cached("numbers", (b"other",), compute) == [1, 2]
+    assert len(calls) == 2 and store.stats()["hits"] == 1
+
+
+def test_cached_without_a_directory_just_computes(monkeypatch):
+    monkeypatch.delenv("AOC_CACHE_DIR", raising=False)
+    cache.configure(None)
+    assert cache.active() is None
+    assert cache.cached("numbers", (), lambda: 5) == 5
+
+
+def test_cache_directory_from_the_environment(tmp_path, monkeypatch):
+    monkeypatch.setenv("AOC_CACHE_DIR", str(tmp_path))
+    cache.configure(None)
+    try:
+        assert cache.active().directory == tmp_path
+    finally:
+        cache.configure(None)
+
+
+def test_array_dicts_are_stored_as_npz(tmp_path):
+    numpy = pytest.importorskip("numpy")
+    store = cache.ArtifactCache(tmp_path)
+    store.put("arrays", {"left": numpy.arange(5)})
+    assert (tmp_path / "arrays.npz").exists()
+    assert cache.ArtifactCache(tmp_path).get("arrays")["left"].tolist() == [0, 1, 2, 3, 4]
@@ -0,0 +1,63 @@
+import time
+
+import pytest
+
+from aoc import cancel, runner
+from aoc.cancel import Cancelled
+
+
+def spin(_):
+    """A solver loop that polls its budget until it's cancelled"""
+    budget = cancel.current()
+    steps = 0
+    while True:
+        steps += 1
+        budget.progress["steps"] = steps
+        budget.tick()
+
+
+def never_polls(_):
+    """A solver loop that only the alarm backstop can stop"""
+    while True:
+        time.sleep(0.01)
+
+
+def test_limit_sets_and_clears_the_budget():
+    with cancel.limit(None) as budget:
+        assert budget is None and cancel.current() is None
+    with cancel.limit(5) as budget:
+        assert cancel.current() is budget and budget.seconds == 5
+        budget.check()
+    assert cancel.current() is None
+
+
+def test_tick_only_reads_the_clock_now_and_then():
+    budget = cancel.Budget(0)
+    for _ in range(cancel.TICKS_PER_CHECK - 1):
+        budget.tick()
+    with pytest.raises(Cancelled):
+        budget.tick()
+
+
+def test_cancelled_carries_the_progress():
+    budget = cancel.Budget(0)
+    budget.progress["seen"] = 7
+    with pytest.raises(Cancelled) as caught:
+        budget.check()
+    row = cancel.timed_out_row(caught.value)
+    assert row["timed_out"] and row["answer"] is None and row["progress"] == {"seen": 7}
+    assert row["error"].startswith("Cancelled: time budget of 0s")
+
+
+def test_a_polling_part_times_out_with_its_progress():
+    row = runner.run_part(spin, None, track_memory=False, time_budget=0.05)
+    assert row["timed_out"] and row["progress"]["steps"] > 0
+    assert 0.05 <= row["wall_time"] < 0.05 + cancel.BACKSTOP_GRACE
+
+
+@pytest.mark.skipif(not cancel.can_interrupt(), reason="needs SIGALRM on the main thread")
+def test_the_backstop_stops_a_part_that_never_polls(monkeypatch):
+    monkeypatch.setattr(cancel, "BACKSTOP_GRACE", 0.05)
+    row = runner.run_part(never_polls, None, track_memory=False, time_budget=0.05)
+    assert row["timed_out"] and row["progress"] == {}
+    assert cancel.current() is None
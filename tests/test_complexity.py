@@ -0,0 +1,36 @@
+import pytest
+
+from aoc import complexity
+from aoc.days import get_day
+
+
+def test_fit_exponent_recovers_power_laws():
+    for exponent in (1, 1.5, 2):
+        points = [(n, 3e-6 * n ** exponent) for n in (100, 200, 400, 800)]
+        assert complexity.fit_exponent(points) == pytest.approx(exponent)
+
+
+def test_fit_exponent_needs_two_sizes():
+    with pytest.raises(ValueError):
+        complexity.fit_exponent([(100, 0.1), (100, 0.2)])
+
+
+def test_compare_flags_rises_past_the_tolerance():
+    measured = {"9": {"1": {"exponent": 1.1}, "2": {"exponent": 2.0}}, "4": {"1": {"exponent": None}}}
+    baseline = {"9": {"1": 1.0, "2": 1.0}, "4": {"1": 1.0}}
+    rows = {(row["day"], row["part"]): row["regressed"] for row in complexity.compare(measured, baseline, 0.35)}
+    assert rows == {(9, 1): False, (9, 2): True, (4, 1): False}
+
+
+def test_save_baseline_merges_measured_days(tmp_path):
+    path = tmp_path / "baseline.json"
+    complexity.save_baseline({"10": {"1": {"exponent": 1.2}}}, path)
+    complexity.save_baseline({"9": {"1": {"exponent": 1.0}, "2": {"exponent": None}}}, path)
+    assert complexity.load_baseline(path) == {"9": {"1": 1.0}, "10": {"1": 1.2}}
+    assert list(complexity.load_baseline(path)) == ["9", "10"]
+
+
+def test_measure_day_fits_each_part():
+    result = complexity.measure_day(get_day(9), [500, 1000, 2000], repeats=1)
+    assert set(result) == {"1", "2"}
+    assert all(len(entry["points"]) == 3 for entry in result.values())
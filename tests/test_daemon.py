@@ -0,0 +1,74 @@
+import asyncio
+import json
+import os
+import signal
+
+import pytest
+
+from aoc.daemon import Daemon
+
+EXAMPLE = "3   4\n4   3\n2   5\n1   3\n3   9\n3   3\n"
+
+
+@pytest.fixture
+def daemon():
+    daemon = Daemon(workers=1, track_memory=False)
+    yield daemon
+    daemon.close()
+
+
+def serve(daemon, *requests):
+    """Feed request lines through the daemon and collect its responses"""
+
+    async def main():
+        reader = asyncio.StreamReader()
+        for request in requests:
+            line = request if isinstance(request, str) else json.dumps(request)
+            reader.feed_data(line.encode() + b"\n")
+        reader.feed_eof()
+        responses = []
+
+        async def send(response):
+            responses.append(response)
+
+        await daemon.serve_stream(reader, send)
+        return responses
+
+    return asyncio.run(main())
+
+
+def test_solve_ping_and_bad_requests(daemon):
+    responses = serve(
+        daemon,
+        {"id": 1, "op": "ping"},
+        {"id": 2, "day": 1, "input": EXAMPLE},
+        {"id": 3, "day": 99},
+        {"id": 4, "day": 1, "part": 5},
+        "not json",
+    )
+    by_id = {}
+    for response in responses:
+        by_id.setdefault(response["id"], []).append(response)
+    assert by_id[1] == [{"id": 1, "ok": True}]
+    assert sorted((row["part"], row["answer"]) for row in by_id[2]) == [(1, "11"), (2, "31")]
+    assert by_id[3][0]["error"].startswith("bad request")
+    assert by_id[4][0]["error"].startswith("bad request")
+    assert by_id[None][0]["error"].startswith("bad request")
+
+
+def test_shutdown_stops_reading_requests(daemon):
+    responses = serve(daemon, {"id": 1, "op": "shutdown"}, {"id": 2, "op": "ping"})
+    assert responses == [{"id": 1, "ok": True}]
+    assert daemon.stopping.is_set()
+
+
+def test_a_killed_worker_only_costs_a_new_pool(daemon):
+    [first] = serve(daemon, {"id": 1, "day": 1, "part": 2, "input": EXAMPLE})
+    assert first["answer"] == "31"
+
+    broken = daemon.executor
+    for pid in list(broken._processes):
+        os.kill(pid, signal.SIGKILL)
+    [second] = serve(daemon, {"id": 2, "day": 1, "part": 2, "input": EXAMPLE})
+    assert second["answer"] == "31" and "error" not in second
+    assert daemon.executor is not broken
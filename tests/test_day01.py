@@ -0,0 +1,105 @@
+import random
+from collections import Counter
+
+import pytest
+
+from aoc import cli
+from aoc.days import get_day
+
+day01 = get_day(1).load()
+
+EXAMPLE = "3   4\n4   3\n2   5\n1   3\n3   9\n3   3\n"
+
+
+def expected_answers(lefts, rights):
+    return (
+        day01.find_distance(sorted(lefts), sorted(rights)),
+        day01.find_similarity_score(lefts, Counter(rights)),
+    )
+
+
+def test_stream_example():
+    answers = list(day01.stream(EXAMPLE.splitlines()))
+    assert len(answers) == 6
+    assert answers[-1] == {1: 11, 2: 31}
+
+
+@pytest.mark.parametrize("seed, values", [(0, 10), (1, 100), (2, 10**5)])
+def test_incremental_historian_matches_sorting(seed, values, monkeypatch):
+    # count the block restructurings, to be sure the run went through them
+    calls = Counter()
+    for name in ("split", "rebuild"):
+        method = getattr(day01.IncrementalHistorian, name)
+        monkeypatch.setattr(
+            day01.IncrementalHistorian, name,
+            lambda self, *args, method=method, name=name: (calls.update([name]), method(self, *args))[1],
+        )
+
+    rng = random.Random(seed)
+    historian = day01.IncrementalHistorian()
+    lefts, rights = [], []
+    for count in range(1, 12001):
+        left, right = rng.randrange(values), rng.randrange(values)
+        lefts.append(left)
+        rights.append(right)
+        historian.add(left, right)
+        if count < 200 or count % 1000 == 0:
+            assert (historian.total_distance, historian.similarity_score) == expected_answers(lefts, rights)
+
+    if values > 10**4:
+        # more than 4 * MIN_BLOCK_SEGMENTS ** 2 distinct numbers
+        assert calls["split"] and calls["rebuild"]
+
+
+def test_stream_command(tmp_path, capsys):
+    path = tmp_path / "input.txt"
+    path.write_text(EXAMPLE)
+    assert cli.main(["stream", "1", "--input", str(path), "--every", "4"]) == 0
+    assert capsys.readouterr().out.splitlines() == [
+        '{"lines": 4, "answers": {"1": "5", "2": "10"}}',
+        '{"lines": 6, "answers": {"1": "11", "2": "31"}}',
+    ]
+
+
+def test_stream_command_needs_a_streaming_day():
+    with pytest.raises(SystemExit):
+        cli.main(["stream", "2"])
+
+
+
+def random_lists_text(rng, pairs, values):
+    return "".join(f"{rng.randrange(values)}   {rng.randrange(values)}\n" for _ in range(pairs))
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_vectorized_answers_match_the_lists(seed):
+    pytest.importorskip("numpy")
+    lefts, rights = day01.parse(random_lists_text(random.Random(seed), 2000, 50))
+    assert day01.find_distance_vectorized(lefts, rights) == day01.find_distance(sorted(lefts), sorted(rights))
+    assert day01.find_similarity_vectorized(lefts, rights) == day01.find_similarity_score(lefts, Counter(rights))
+
+
+def test_parts_answer_the_same_without_numpy(monkeypatch):
+    parsed = day01.parse(random_lists_text(random.Random(9), 500, 30))
+    answers = day01.part1(parsed), day01.part2(parsed)
+    monkeypatch.setattr(day01, "numpy", None)
+    assert (day01.part1(parsed), day01.part2(parsed)) == answers == expected_answers(*map(list, parsed))
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_external_solve_matches_in_memory(seed, tmp_path):
+    path = tmp_path / "input.txt"
+    path.write_text(random_lists_text(random.Random(seed), 3000, 10 ** seed + 1))
+    lefts, rights = day01.read_file(path)
+
+    # runs far shorter than the lists, so the answers come out of several merge passes
+    answers = day01.solve_external(path, directory=tmp_path, run_length=97, merge_width=4)
+    assert answers == expected_answers(list(lefts), list(rights))
+
+
+def test_merged_similarity_score():
+    rng = random.Random(0)
+    for _ in range(200):
+        lefts = sorted(rng.randrange(8) for _ in range(rng.randint(0, 10)))
+        rights = sorted(rng.randrange(8) for _ in range(rng.randint(0, 10)))
+        assert day01.find_merged_similarity_score(lefts, rights) == day01.find_similarity_score(lefts, Counter(rights))
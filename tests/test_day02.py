@@ -0,0 +1,97 @@
+import random
+import tracemalloc
+from itertools import combinations
+
+import pytest
+
+from aoc.days import get_day
+
+day02 = get_day(2).load()
+
+EXAMPLE = """\
+7 6 4 2 1
+1 2 7 8 9
+9 7 6 2 1
+1 3 2 4 5
+8 6 4 4 1
+1 3 6 7 9
+"""
+
+
+def brute_force_safe(levels, removals):
+    """Try every way of taking out up to removals levels"""
+    return any(
+        day02.is_safe([level for index, level in enumerate(levels) if index not in dropped])
+        for count in range(min(removals, len(levels)) + 1)
+        for dropped in combinations(range(len(levels)), count)
+    )
+
+
+def random_reports(rng, count):
+    return [[rng.randint(0, 9) for _ in range(rng.randint(0, 9))] for _ in range(count)]
+
+
+@pytest.mark.parametrize("levels", [[], [5], [4, 4], [4, 4, 4, 4], [7, 7, 7, 7, 7, 7], [1, 5], [3, 2, 1, 9, 0]])
+@pytest.mark.parametrize("removals", range(4))
+def test_edge_cases_match_brute_force(levels, removals):
+    assert day02.is_safe_with_removals(levels, removals) == brute_force_safe(levels, removals)
+
+
+@pytest.mark.parametrize("removals", range(4))
+def test_random_reports_match_brute_force(removals):
+    rng = random.Random(removals)
+    for levels in random_reports(rng, 3000):
+        assert day02.is_safe_with_removals(levels, removals) == brute_force_safe(levels, removals), levels
+
+
+def test_example():
+    reports = day02.parse(EXAMPLE)
+    assert (day02.part1(reports), day02.part2(reports)) == (2, 4)
+    assert day02.part2(reports, removals=0) == 2
+
+
+
+def test_vectorized_counts_match_report_by_report():
+    pytest.importorskip("numpy")
+    rng = random.Random(0)
+    reports = [levels for levels in random_reports(rng, 5000) if levels]
+    # a few long reports, each in a group of its own length
+    reports += [list(range(length)) for length in (40, 300)] + [[1] * 50]
+    assert day02.count_safe_vectorized(reports) == sum(day02.is_safe(levels) for levels in reports)
+    assert day02.count_safe_vectorized(reports, dampener=True) == sum(
+        day02.is_safe_with_dampener(levels) for levels in reports
+    )
+
+
+def test_parts_answer_the_same_without_numpy(monkeypatch):
+    pytest.importorskip("numpy")
+    reports = [levels for levels in random_reports(random.Random(2), 2000) if levels]
+    answers = day02.part1(reports), day02.part2(reports)
+    monkeypatch.setattr(day02, "numpy", None)
+    assert (day02.part1(reports), day02.part2(reports)) == answers
+
+
+def test_one_long_report_does_not_widen_the_others():
+    pytest.importorskip("numpy")
+    rng = random.Random(3)
+    reports = [list(range(3000))] + [[rng.randint(0, 9) for _ in range(5)] for _ in range(5000)]
+    tracemalloc.start()
+    try:
+        day02.count_safe_vectorized(reports, dampener=True)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    # padding every report to 3000 levels took hundreds of MiB
+    assert peak < 8 * 1024 * 1024
+
+
+def test_file_counts_match_for_any_chunk_size(tmp_path):
+    pytest.importorskip("numpy")
+    rng = random.Random(1)
+    reports = [levels for levels in random_reports(rng, 500) if levels]
+    path = tmp_path / "input.txt"
+    path.write_text("".join(" ".join(map(str, levels)) + "\n" for levels in reports))
+
+    expected = day02.count_safe_vectorized(reports), day02.count_safe_vectorized(reports, dampener=True)
+    for chunk_bytes in (1, 7, 64, 1 << 20):
+        assert day02.count_safe_file(path, chunk_bytes) == expected
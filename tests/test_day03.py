@@ -0,0 +1,83 @@
+import io
+import random
+
+import pytest
+
+from aoc.days import get_day
+
+day03 = get_day(3).load()
+
+EXAMPLE = "xmul(2,4)&mul[3,7]!^don't()_mul(5,5)+mul(32,64](mul(11,8)undo()?mul(8,5))"
+
+# whole instructions, and pieces of them that must not count
+PIECES = ["mul(", "mul(1,2)", "mul(999,999)", "mul(12,34", "1", "23", ",", ")", "do()", "don't()", "don't(", "do(", "x", " "]
+
+
+def random_dump(rng, pieces):
+    return "".join(rng.choice(PIECES) for _ in range(pieces)).encode()
+
+
+def expected_total(data):
+    return day03.calculate_total(day03.extract_instructions(data))
+
+
+def test_example():
+    assert day03.part1(day03.parse(EXAMPLE)) == 48
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_stream_matches_whole_scan_for_any_chunk_size(seed):
+    rng = random.Random(seed)
+    data = random_dump(rng, rng.randint(0, 300))
+    expected = expected_total(data)
+    for chunk_bytes in range(1, 14):
+        matches = [match for chunk in day03.stream_instructions(io.BytesIO(data), chunk_bytes) for match in chunk]
+        assert day03.calculate_total(matches) == expected, chunk_bytes
+
+
+def test_streaming_total_of_a_file(tmp_path):
+    data = random_dump(random.Random(0), 5000)
+    path = tmp_path / "input.txt"
+    path.write_bytes(data)
+    for chunk_bytes in (1, 5, 13, 4096):
+        assert day03.calculate_total_streaming(path, chunk_bytes) == expected_total(data)
+
+
+def test_main_streams_big_dumps(tmp_path, monkeypatch):
+    data = random_dump(random.Random(1), 2000)
+    (tmp_path / "input.txt").write_bytes(data)
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(day03.os, "cpu_count", lambda: 1)
+    monkeypatch.setattr(day03, "STREAMING_BYTES", 100)
+
+    streamed = []
+    stream = day03.calculate_total_streaming
+    monkeypatch.setattr(day03, "calculate_total_streaming", lambda *args: streamed.append(args) or stream(*args))
+    assert day03.main() == expected_total(data)
+    assert streamed
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_segment_summaries_fold_to_the_total(seed):
+    rng = random.Random(seed)
+    data = random_dump(rng, rng.randint(0, 200))
+    expected = expected_total(data)
+    for segments in range(1, 12):
+        step = max(1, -(-len(data) // segments))
+        summaries = [
+            day03.summarize_segment(data, start, min(start + step, len(data)))
+            for start in range(0, len(data), step)
+        ]
+        assert day03.fold_summaries(summaries) == expected, segments
+
+
+def test_parallel_total_reads_segments_from_the_file(tmp_path):
+    data = random_dump(random.Random(2), 3000)
+    path = tmp_path / "input.txt"
+    path.write_bytes(data)
+    assert day03.calculate_total_parallel(path, workers=2) == expected_total(data)
+
+    # the runner's mapped input goes to the workers by path, and text in memory stays serial
+    with day03.read_file(path) as buffer:
+        assert day03.part1(buffer, workers=2) == expected_total(data)
+    assert day03.part1(day03.parse(data.decode()), workers=2) == expected_total(data)
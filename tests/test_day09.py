@@ -0,0 +1,50 @@
+import random
+
+import pytest
+
+from aoc.days import get_day
+
+day09 = get_day(9).load()
+
+
+def brute_force_whole_files(blocks):
+    """Move each file, highest ID first, to the leftmost free run that fits, rescanning every time"""
+    blocks = blocks.copy()
+    for file_id in range(max((block for block in blocks if block != '.'), default=-1), -1, -1):
+        positions = [i for i, block in enumerate(blocks) if block == file_id]
+        if not positions:
+            continue
+        start, size = positions[0], len(positions)
+        run = 0
+        for i in range(start):
+            run = run + 1 if blocks[i] == '.' else 0
+            if run == size:
+                blocks[start:start + size] = ['.'] * size
+                blocks[i - size + 1:i + 1] = [file_id] * size
+                break
+    return blocks
+
+
+def test_example():
+    blocks = day09.parse("2333133121414131402\n")
+    assert (day09.part1(blocks), day09.part2(blocks)) == (1928, 2858)
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_whole_file_compaction_matches_brute_force(seed):
+    rng = random.Random(seed)
+    for _ in range(500):
+        # zero-length files and free runs included, so free runs can merge
+        digits = "".join(str(rng.randint(0, 9)) for _ in range(rng.randint(1, 40)))
+        blocks = day09.parse_disk_map(digits)
+        if not any(block != '.' for block in blocks):
+            continue
+        assert day09.compact_disk_whole_files(blocks) == brute_force_whole_files(blocks), digits
+
+
+def test_compaction_leaves_the_parsed_blocks_alone():
+    blocks = day09.parse("12345\n")
+    before = list(blocks)
+    day09.part1(blocks)
+    day09.part2(blocks)
+    assert blocks == before
@@ -0,0 +1,30 @@
+import copy
+
+from aoc.days import get_day
+
+day11 = get_day(11).load()
+
+
+def test_example():
+    stones = day11.parse("125 17\n")
+    assert day11.count_stones_after_blinks(6, stones) == 22
+    assert day11.part1(stones) == 55312
+
+
+def test_parts_leave_the_parsed_stones_alone():
+    stones = day11.parse("0 1 10 99 999\n")
+    before = copy.deepcopy(stones)
+    second = day11.part2(stones)
+    first = day11.part1(stones)
+    assert stones == before
+
+    # the shared counts give the same answers as a fresh parse, in either order
+    day11.blinked.clear()
+    assert day11.part1(day11.parse("0 1 10 99 999\n")) == first
+    assert day11.part2(day11.parse("0 1 10 99 999\n")) == second
+
+
+def test_counts_follow_the_input():
+    assert day11.part1(day11.parse("125 17\n")) == 55312
+    assert day11.part1(day11.parse("0\n")) != 55312
+    assert day11.part1(day11.parse("125 17\n")) == 55312
@@ -0,0 +1,76 @@
+import random
+
+import pytest
+
+from aoc.days import get_day
+
+day12 = get_day(12).load()
+
+EXAMPLE = """\
+RRRRIICCFF
+RRRRIICCCF
+VVRRRCCFFF
+VVRCCCJFFF
+VVVVCJJCFE
+VVIVCCJJEE
+VVIIICJJEE
+MIIIIIJJEE
+MIIISIJEEE
+MMMISSJEEE
+"""
+
+
+def brute_force_prices(text):
+    """Both prices by walking every cell and every grid point of every region"""
+    rows = text.split()
+    height, width = len(rows), len(rows[0])
+    plant = lambda row, col: rows[row][col] if 0 <= row < height and 0 <= col < width else None
+
+    seen, perimeter_price, sides_price = set(), 0, 0
+    for start in ((row, col) for row in range(height) for col in range(width)):
+        if start in seen:
+            continue
+        region, stack = {start}, [start]
+        while stack:
+            row, col = stack.pop()
+            for step in ((row - 1, col), (row + 1, col), (row, col - 1), (row, col + 1)):
+                if step not in region and plant(*step) == plant(*start):
+                    region.add(step)
+                    stack.append(step)
+        seen |= region
+
+        perimeter = sum(
+            (row + d_row, col + d_col) not in region
+            for row, col in region
+            for d_row, d_col in ((-1, 0), (1, 0), (0, -1), (0, 1))
+        )
+        # a point is a corner when 1 or 3 of its cells are in the region, two when
+        # just a diagonal pair is; sides and corners are the same count
+        corners = 0
+        for row in range(-1, height):
+            for col in range(-1, width):
+                around = [(row, col) in region, (row, col + 1) in region, (row + 1, col) in region, (row + 1, col + 1) in region]
+                if sum(around) % 2:
+                    corners += 1
+                elif around in ([True, False, False, True], [False, True, True, False]):
+                    corners += 2
+        perimeter_price += len(region) * perimeter
+        sides_price += len(region) * corners
+    return perimeter_price, sides_price
+
+
+def test_example():
+    parsed = day12.parse(EXAMPLE)
+    assert (day12.part1(parsed), day12.part2(parsed)) == (1930, 1206)
+
+
+@pytest.mark.parametrize("seed", range(40))
+def test_matches_brute_force(seed):
+    rng = random.Random(seed)
+    width, height = rng.randint(1, 14), rng.randint(1, 14)
+    plants = "ABCD"[:rng.randint(1, 4)]
+    text = "\n".join("".join(rng.choice(plants) for _ in range(width)) for _ in range(height)) + "\n"
+
+    parsed = day12.parse(text)
+    assert (day12.part1(parsed), day12.part2(parsed)) == brute_force_prices(text)
+    assert sum(region["regionSize"] for region in parsed["regions"]) == width * height
@@ -0,0 +1,65 @@
+import os
+import random
+
+import pytest
+
+from aoc import external
+from aoc.external import ExternalSorter, read_run
+
+
+@pytest.mark.parametrize("count", [0, 1, 10, 1000, 5000])
+def test_sorter_merges_runs_in_order(count, tmp_path):
+    rng = random.Random(count)
+    values = [rng.randint(-2**62, 2**62) for _ in range(count)]
+    with ExternalSorter(tmp_path, run_length=128, block_length=16) as sorter:
+        # added in pieces of any size, spilling whenever a run fills
+        for start in range(0, count, 300):
+            sorter.extend(values[start:start + 300])
+        assert len(sorter) == count
+        assert list(sorter) == sorted(values)
+        # a second pass merges the same runs again
+        assert list(sorter) == sorted(values)
+        workdir = sorter.workdir.name
+    assert not os.path.exists(workdir)
+
+
+def test_read_run_returns_the_short_last_block(tmp_path):
+    with ExternalSorter(tmp_path, run_length=10) as sorter:
+        sorter.extend(range(25, 0, -1))
+        list(sorter)
+        assert [list(read_run(path, block_length=4)) for path in sorter.runs] == [
+            list(range(16, 26)), list(range(6, 16)), list(range(1, 6)),
+        ]
+
+
+@pytest.mark.parametrize("merge_width", [2, 3, 8])
+def test_many_runs_merge_in_passes_of_bounded_width(merge_width, tmp_path, monkeypatch):
+    rng = random.Random(merge_width)
+    values = [rng.randrange(1000) for _ in range(2000)]
+
+    # every run file open at once while the final merge is under way
+    open_runs = set()
+    opened = []
+
+    def tracked_read_run(path, block_length):
+        open_runs.add(path)
+        opened.append(len(open_runs))
+        try:
+            yield from read_run(path, block_length)
+        finally:
+            open_runs.discard(path)
+
+    monkeypatch.setattr(external, "read_run", tracked_read_run)
+    with ExternalSorter(tmp_path, run_length=7, block_length=5, merge_width=merge_width) as sorter:
+        sorter.extend(values)
+        assert list(sorter) == sorted(values)
+        # 286 runs took several passes to come down to merge_width
+        assert len(sorter.runs) <= merge_width
+        assert len(os.listdir(sorter.workdir.name)) == len(sorter.runs)
+        assert list(sorter) == sorted(values) and len(sorter) == len(values)
+    assert max(opened) <= merge_width
+
+
+def test_merge_width_below_two_is_refused(tmp_path):
+    with pytest.raises(ValueError):
+        ExternalSorter(tmp_path, merge_width=1)
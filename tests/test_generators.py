@@ -0,0 +1,38 @@
+import pytest
+
+from aoc.bench import accepted_options, bench_size, size_ladder
+from aoc.days import get_day, get_parts, prepare_input
+from aoc.generators import GENERATORS, generate
+
+
+@pytest.mark.parametrize("day", sorted(GENERATORS))
+def test_base_rung_has_non_trivial_answers(day):
+    module = get_day(day).load()
+    generated = generate(day, GENERATORS[day].base)
+    parsed = prepare_input(module, generated.text)
+    for part, func in get_parts(module):
+        answer = func(parsed, **accepted_options(func, generated.options))
+        assert answer not in (None, 0, ""), (day, part)
+
+
+@pytest.mark.parametrize("day", sorted(GENERATORS))
+def test_generators_are_reproducible(day):
+    size = GENERATORS[day].base
+    assert generate(day, size, seed=3) == generate(day, size, seed=3)
+
+
+def test_unknown_day():
+    with pytest.raises(KeyError):
+        generate(26, 10)
+
+
+def test_size_ladder_starts_at_the_base():
+    assert size_ladder(13) == [50, 100, 200, 400]
+    assert size_ladder(13, steps=3, factor=1.5, base=10) == [10, 15, 22]
+
+
+def test_bench_size_reports_each_part():
+    row = bench_size(get_day(1), 100, track_memory=False)
+    assert row["size"] == 100 and row["input_bytes"] > 0
+    assert set(row["parts"]) == {"1", "2"}
+    assert all(part["answer"] and part["wall_time"] >= 0 for part in row["parts"].values())
@@ -0,0 +1,53 @@
+import pytest
+
+from aoc.grid import OUTSIDE, Grid
+from aoc.inputs import InputBuffer
+
+TEXT = "#..\n.S.\n..E\n"
+
+
+def test_parse_and_index():
+    grid = Grid.parse(TEXT)
+    assert (grid.width, grid.height, grid.stride) == (3, 3, 5)
+    assert grid.rows() == ["#..", ".S.", "..E"] and str(grid) == TEXT.strip()
+    start = grid.find("S")
+    assert grid.position(start) == (1, 1) and grid.index(1, 1) == start
+    assert [grid[start + step] for step in grid.offsets4] == [".", ".", ".", "."]
+    assert grid.get(2, 2) == "E" and grid.find("X") == -1
+
+
+def test_border_is_outside():
+    grid = Grid.parse(TEXT, pad=2)
+    corner = grid.index(0, 0)
+    assert grid.cells[corner - 2] == OUTSIDE and grid.cells[corner + grid.offset(-2, 0)] == OUTSIDE
+    assert not grid.contains(corner - 1) and grid.contains(corner)
+    assert grid.is_edge(corner) and not grid.is_edge(grid.index(1, 1))
+
+
+def test_scan_find_all_and_copy():
+    grid = Grid.parse(TEXT)
+    assert [grid[index] for index in grid.scan()] == list("#...S...E")
+    assert [grid.position(index) for index in grid.find_all(".")] == [(0, 1), (0, 2), (1, 0), (1, 2), (2, 0), (2, 1)]
+    copy = grid.copy()
+    copy[copy.find("S")] = "."
+    assert grid.find("S") != -1 and copy.find("S") == -1
+
+
+def test_crlf_and_mapped_input(tmp_path):
+    path = tmp_path / "grid.txt"
+    path.write_bytes(TEXT.replace("\n", "\r\n").encode())
+    with InputBuffer.open(path) as buffer:
+        assert Grid.parse(buffer).rows() == Grid.parse(TEXT).rows()
+
+
+@pytest.mark.parametrize("text", ["abc\nab\nabc\n", "ab\nabc\n", "abc\nabcd\n"])
+def test_ragged_rows_are_rejected(text):
+    with pytest.raises(ValueError):
+        Grid.parse(text)
+
+
+@pytest.mark.parametrize("text", ["", "\n\n", "   \n"])
+def test_empty_input_gives_an_empty_grid(text):
+    grid = Grid.parse(text)
+    assert (grid.width, grid.height, len(grid)) == (0, 0, 0)
+    assert list(grid.scan()) == [] and grid.rows() == []
@@ -0,0 +1,66 @@
+import random
+
+import pytest
+
+from aoc.inputs import InputBuffer, as_buffer
+
+
+def test_lines_of_text_with_surrounding_whitespace():
+    buffer = InputBuffer.from_text("\n  a b\r\ncd\n\nef  \n\n")
+    assert buffer.span() == (3, 14)
+    assert bytes(buffer.stripped()) == b"a b\r\ncd\n\nef"
+    assert [bytes(line) for line in buffer.lines()] == [b"a b", b"cd", b"", b"ef"]
+    assert buffer.text() == "a b\r\ncd\n\nef"
+
+
+def test_sections_skip_repeated_blank_lines():
+    buffer = InputBuffer.from_text("a\nb\n\n\nc\n\nd\ne\n")
+    assert [[bytes(line) for line in section] for section in buffer.sections()] == [
+        [b"a", b"b"], [b"c"], [b"d", b"e"]
+    ]
+
+
+@pytest.mark.parametrize("text", ["", "   \n\n"])
+def test_blank_input_has_no_lines(text):
+    buffer = InputBuffer.from_text(text)
+    assert buffer.lines() == [] and list(buffer.sections()) == [] and buffer.text() == ""
+
+
+def test_a_mapped_file_reads_like_text(tmp_path):
+    path = tmp_path / "input.txt"
+    path.write_text("12 34\n56 78\n")
+    with InputBuffer.open(path) as buffer:
+        assert buffer.source == str(path) and len(buffer) == 12
+        assert [bytes(line) for line in buffer.lines()] == [b"12 34", b"56 78"]
+    (tmp_path / "empty.txt").write_text("")
+    with InputBuffer.open(tmp_path / "empty.txt") as buffer:
+        assert buffer.lines() == []
+
+
+def test_as_buffer_wraps_text_and_bytes_once():
+    buffer = as_buffer("x\ny")
+    assert as_buffer(buffer) is buffer
+    assert [bytes(line) for line in as_buffer(b"x\ny").lines()] == [b"x", b"y"]
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_chunks_split_at_line_breaks(seed):
+    rng = random.Random(seed)
+    lines = ["".join(rng.choice("ab ") for _ in range(rng.randint(0, 12))) for _ in range(rng.randint(0, 30))]
+    text = "\n".join(lines) + rng.choice(["", "\n", "\n\n"])
+    buffer = InputBuffer.from_text(text)
+
+    for size in (1, 2, 5, 16, 1 << 20):
+        chunks = [bytes(chunk) for chunk in buffer.chunks(size)]
+        assert b"".join(chunks) == bytes(buffer.stripped())
+        assert all(chunks)
+        # every chunk but the last ends a line, and only runs past size when one line does
+        assert all(chunk.endswith(b"\n") for chunk in chunks[:-1])
+        assert all(len(chunk) <= size or chunk.count(b"\n") <= 1 for chunk in chunks)
+
+
+def test_chunks_of_a_file(tmp_path):
+    path = tmp_path / "input.txt"
+    path.write_text("1 2\n3 4\n5 6\n")
+    with InputBuffer.open(path) as buffer:
+        assert [bytes(chunk) for chunk in buffer.chunks(5)] == [b"1 2\n", b"3 4\n", b"5 6"]
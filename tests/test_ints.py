@@ -0,0 +1,47 @@
+import random
+import re
+
+import pytest
+
+from aoc import ints
+from aoc.inputs import InputBuffer
+
+
+def test_numbers_between_any_separators():
+    text = "p=0,4 v=-3,-3\nButton A: X+94, Y+34\n47|53\n"
+    assert list(ints.ints(text)) == [0, 4, -3, -3, 94, 34, 47, 53]
+    assert list(ints.ints(text, signed=False)) == [0, 4, 3, 3, 94, 34, 47, 53]
+    # a dash between numbers falls back to the regex scan
+    assert list(ints.ints("3-4 - 5")) == [3, -4, 5]
+    assert ints.int_list("1 99999999999999999999999") == [1, 99999999999999999999999]
+
+
+def test_records_columns_and_lines():
+    assert ints.records("1 2\n3 4\n", 2) == [(1, 2), (3, 4)]
+    assert [list(column) for column in ints.columns("1 2\n3 4\n", 2)] == [[1, 3], [2, 4]]
+    with pytest.raises(ValueError):
+        ints.records("1 2 3", 2)
+    assert ints.line_ints("1 2\n\nx\n3\n") == [[1, 2], [3]]
+
+
+@pytest.mark.parametrize("chunk_bytes", [1, 7, 64, 1 << 20])
+def test_a_mapped_input_parses_the_same_in_any_chunk_size(tmp_path, monkeypatch, chunk_bytes):
+    monkeypatch.setattr(ints, "CHUNK_BYTES", chunk_bytes)
+    rng = random.Random(chunk_bytes)
+    rows = [[rng.randint(-10**6, 10**6) for _ in range(rng.randint(0, 5))] for _ in range(200)]
+    text = "\n".join(", ".join(map(str, row)) for row in rows) + "\n"
+    path = tmp_path / "input.txt"
+    path.write_text(text)
+
+    expected = [int(number) for number in re.findall(r"-?\d+", text)]
+    with InputBuffer.open(path) as buffer:
+        assert list(ints.ints(buffer)) == expected
+        assert ints.int_list(buffer) == expected
+        assert ints.line_ints(buffer) == [row for row in rows if row]
+
+
+def test_as_numpy_views_the_array():
+    numpy = pytest.importorskip("numpy")
+    values = ints.ints("1 2 3 4")
+    assert ints.as_numpy(values, 2).tolist() == [[1, 2], [3, 4]]
+    assert isinstance(ints.as_numpy(values), numpy.ndarray)
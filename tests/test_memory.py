@@ -0,0 +1,40 @@
+from aoc import memory, pool, runner
+from aoc.days import get_day
+
+
+def test_check_budgets_covers_the_parse():
+    reports = [
+        {"day": 9, "parse": {"peak_memory": 3 * memory.MIB}, "parts": {"1": {"peak_memory": 100}}},
+        {"day": 2, "parse": {"error": "boom"}, "parts": {"1": {"peak_memory": None}}},
+    ]
+    violations = memory.check_budgets(reports, {"default": 2})
+    assert violations == [(9, "parse", 3 * memory.MIB, 2 * memory.MIB)]
+    assert reports[0]["parse"]["over_budget"] and "over_budget" not in reports[0]["parts"]["1"]
+    assert memory.check_budgets(reports, {"2": 1}) == []
+
+
+def test_budgets_by_day_with_a_default():
+    assert memory.budget_for({"default": 2, "9": 0.5}, 9) == memory.MIB // 2
+    assert memory.budget_for({"default": 2, "9": 0.5}, 3) == 2 * memory.MIB
+    assert memory.budget_for({}, 3) is None
+
+
+def test_profile_reports_the_allocating_line():
+    allocate = lambda: [bytes(1000) for _ in range(2000)]
+    result, stats = memory.profile(allocate, top=3)
+    assert len(result) == 2000 and stats["peak_memory"] >= 2000 * 1000
+    assert stats["top_allocations"][0]["line"].startswith("tests/test_memory.py:")
+
+
+def test_the_parse_is_profiled_and_budgeted_like_the_parts():
+    [report] = runner.run_days([get_day(9)], parts=[1], memory_top=3)
+    assert report["parse"]["top_allocations"] and report["parse"]["peak_memory"] > 0
+    assert (9, "parse", report["parse"]["peak_memory"], 1024) in memory.check_budgets([report], {"9": 1 / 1024})
+
+
+def test_pool_reports_carry_the_parse(tmp_path):
+    timings = tmp_path / "timings.json"
+    report = pool.run_pool([get_day(9)], workers=1, timings_path=timings, memory_top=3)
+    [day] = report["days"]
+    assert day["parse"]["peak_memory"] > 0 and day["parse"]["top_allocations"]
+    assert all("parse" not in row for row in day["parts"].values())
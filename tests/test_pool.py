@@ -0,0 +1,45 @@
+from aoc import pool, runner
+from aoc.days import get_day
+from aoc.pool import Job
+
+
+def test_schedule_runs_unknown_then_slowest_jobs_first():
+    jobs = [Job(1, 1), Job(7, 1), Job(9, 2), Job(3, 1)]
+    timings = {"1.1": 0.01, "7.1": 40.0, "3.1": 0.5}
+    assert [job.key for job in pool.schedule(jobs, timings)] == ["9.2", "7.1", "3.1", "1.1"]
+
+
+def test_list_jobs_keeps_the_wanted_parts():
+    days = [get_day(1), get_day(7)]
+    assert pool.list_jobs(days) == [Job(1, 1), Job(1, 2), Job(7, 1)]
+    assert pool.list_jobs(days, parts=[2]) == [Job(1, 2)]
+
+
+def test_record_timings_skips_failed_jobs(tmp_path):
+    path = tmp_path / "timings.json"
+    pool.save_timings({"2.1": 1.0}, path)
+    pool.record_timings({Job(1, 1): {"wall_time": 0.123456}, Job(2, 1): {"error": "boom"}}, path)
+    assert pool.load_timings(path) == {"1.1": 0.1235, "2.1": 1.0}
+    (tmp_path / "broken.json").write_text("{")
+    assert pool.load_timings(tmp_path / "broken.json") == {}
+
+
+def test_run_job_on_an_input_file(tmp_path):
+    path = tmp_path / "input.txt"
+    path.write_text("3   4\n4   3\n2   5\n1   3\n3   9\n3   3\n")
+    row = pool.run_job(1, 2, str(path), track_memory=False)
+    assert row["answer"] == "31" and row["worker"] and "wall_time" in row["parse"]
+
+
+def test_run_pool_matches_the_serial_runner(tmp_path):
+    days = [get_day(1), get_day(2), get_day(3)]
+    timings = tmp_path / "timings.json"
+    report = pool.run_pool(days, track_memory=False, workers=2, timings_path=timings)
+
+    answers = lambda reports: {
+        (day["day"], part): row["answer"] for day in reports for part, row in day["parts"].items()
+    }
+    assert answers(report["days"]) == answers(runner.run_days(days, track_memory=False))
+    assert report["workers"] == 2 and len(report["order"]) == 5
+    # the bundled inputs' times go into the history for the next schedule
+    assert set(pool.load_timings(timings)) == {"1.1", "1.2", "2.1", "2.2", "3.1"}
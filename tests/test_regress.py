@@ -0,0 +1,78 @@
+import json
+
+from aoc import regress
+from aoc.days import get_day
+from aoc.generators import GENERATORS
+
+
+def test_budgets_have_a_floor_for_tiny_measurements():
+    assert regress.time_budget(0.001, 0.5) == 0.001 + regress.MIN_TIME_SLACK
+    assert regress.time_budget(10.0, 0.5) == 15.0
+    assert regress.memory_budget(1000, 0.25) == 1000 + regress.MIN_MEMORY_SLACK
+    assert regress.memory_budget(8 << 20, 0.25) == 10 << 20
+
+
+def test_compare_statuses():
+    golden = {"1:bundled": {
+        "1": {"answer": "11", "seconds": 1.0, "peak_memory": 10 << 20},
+        "2": {"answer": "31", "seconds": 1.0, "peak_memory": None},
+    }}
+    run = lambda answer, seconds, peak: {"answer": answer, "seconds": seconds, "peak_memory": peak}
+    results = {
+        "1:bundled": {"1": run("11", 1.2, 11 << 20), "2": run("32", 0.1, None)},
+        "1:synthetic:4000:0": {"1": run("5", 0.1, 1000), "2": {"answer": None, "error": "boom"}},
+    }
+    statuses = [(row["case"], row["part"], row["status"]) for row in regress.compare(results, golden)]
+    assert statuses == [
+        ("1:bundled", 1, "ok"),
+        ("1:bundled", 2, "wrong"),
+        ("1:synthetic:4000:0", 1, "new"),
+        ("1:synthetic:4000:0", 2, "error"),
+    ]
+
+    results["1:bundled"]["1"] = run("11", 1.6, 11 << 20)
+    assert regress.compare(results, golden)[0]["status"] == "slow"
+    results["1:bundled"]["1"] = run("11", 1.0, 13 << 20)
+    assert regress.compare(results, golden)[0]["status"] == "memory"
+    assert [row["status"] for row in regress.failed(regress.compare(results, golden))] == [
+        "memory", "wrong", "error"
+    ]
+
+
+def test_save_golden_merges_and_sorts_cases(tmp_path):
+    path = tmp_path / "golden.json"
+    entry = {"answer": "1", "seconds": 0.123456, "peak_memory": 100}
+    regress.save_golden({"10:bundled": {"1": entry}, "2:synthetic:4000:0": {"1": entry}}, path)
+    golden = regress.save_golden({"2:bundled": {"1": entry, "2": {"answer": None, "error": "x"}}}, path)
+    assert golden["2:bundled"] == {"1": {"answer": "1", "seconds": 0.1235, "peak_memory": 100}}
+    assert list(regress.load_golden(path)) == ["2:bundled", "2:synthetic:4000:0", "10:bundled"]
+    assert regress.load_golden(path) == golden
+    assert regress.load_golden(tmp_path / "missing.json") == {}
+
+
+def test_cases_run_and_pass_their_own_golden(tmp_path):
+    cases = regress.list_cases([get_day(1)])
+    size = GENERATORS[1].base * regress.SYNTHETIC_SCALE
+    assert [case.key for case in cases] == ["1:bundled", f"1:synthetic:{size}:0"]
+    results = regress.run_cases(cases)
+    assert results["1:bundled"]["1"]["answer"] == "1590491"
+    golden = regress.save_golden(results, tmp_path / "golden.json")
+    assert regress.failed(regress.compare(results, golden)) == []
+
+    history = tmp_path / "history.jsonl"
+    record = regress.append_history(regress.compare(results, golden), history)
+    assert json.loads(history.read_text()) == record and len(record["rows"]) == 4
+
+
+def test_goldens_are_kept_per_backend(tmp_path, monkeypatch):
+    path = tmp_path / "golden.json"
+    entry = lambda peak: {"answer": "218", "seconds": 0.001, "peak_memory": peak}
+    regress.save_golden({"2:bundled": {"1": entry(500)}}, path, backend="python")
+    regress.save_golden({"2:bundled": {"1": entry(900)}}, path, backend="numpy")
+    assert list(regress.load_backends(path)) == ["numpy", "python"]
+
+    monkeypatch.setattr(regress, "numpy", None)
+    assert regress.current_backend() == "python"
+    assert regress.load_golden(path)["2:bundled"]["1"]["peak_memory"] == 500
+    assert regress.load_golden(path, backend="numpy")["2:bundled"]["1"]["peak_memory"] == 900
+    assert regress.load_golden(path, backend="other") == {}
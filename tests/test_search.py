@@ -0,0 +1,156 @@
+import heapq
+import random
+
+import pytest
+
+from aoc.grid import Grid
+from aoc.search import UNREACHED, astar, bfs, bfs_01, bfs_grid, dijkstra
+
+
+def random_graph(rng, size, max_weight):
+    """Adjacency lists of (node, cost) for a random directed graph"""
+    edges = [[] for _ in range(size)]
+    for _ in range(size * 3):
+        edges[rng.randrange(size)].append((rng.randrange(size), rng.randint(0, max_weight)))
+    return edges
+
+
+def reference_distances(edges, sources):
+    """Plain heapq Dijkstra over a dict, the answer every search must match"""
+    distances = {}
+    heap = [(0, source) for source in sources]
+    while heap:
+        distance, node = heapq.heappop(heap)
+        if node in distances:
+            continue
+        distances[node] = distance
+        for neighbor, cost in edges[node]:
+            if neighbor not in distances:
+                heapq.heappush(heap, (distance + cost, neighbor))
+    return [distances.get(node, UNREACHED) for node in range(len(edges))]
+
+
+def check_paths(result, edges, sources):
+    """Every reached node's parent chain is a real path of its reported length"""
+    for node, distance in enumerate(result.distances):
+        if distance == UNREACHED:
+            continue
+        path = result.path(node)
+        assert path[0] in sources and path[-1] == node
+        costs = [min(cost for next_node, cost in edges[a] if next_node == b) for a, b in zip(path, path[1:])]
+        assert sum(costs) == distance
+
+
+def weighted_searches(edges, max_weight):
+    neighbors = edges.__getitem__
+    return {
+        "best_first": lambda sources, **kw: dijkstra(neighbors, sources, len(edges), **kw),
+        "dial": lambda sources, **kw: dijkstra(neighbors, sources, len(edges), max_weight=max_weight, **kw),
+        "astar": lambda sources, targets=(), **kw: astar(neighbors, sources, len(edges), targets, lambda node: 0, **kw),
+    }
+
+
+@pytest.mark.parametrize("seed", range(30))
+def test_weighted_searches_match_reference(seed):
+    rng = random.Random(seed)
+    max_weight = rng.choice([1, 3, 9])
+    edges = random_graph(rng, rng.randint(1, 60), max_weight)
+    sources = rng.sample(range(len(edges)), rng.randint(1, min(3, len(edges))))
+    expected = reference_distances(edges, sources)
+
+    for name, search in weighted_searches(edges, max_weight).items():
+        result = search(sources, track_parents=True)
+        assert list(result.distances) == expected, name
+        check_paths(result, edges, sources)
+
+
+@pytest.mark.parametrize("seed", range(30))
+def test_bfs_and_bfs_01_match_reference(seed):
+    rng = random.Random(seed)
+    edges = random_graph(rng, rng.randint(1, 60), 1)
+    sources = [rng.randrange(len(edges))]
+
+    unit = [[(node, 1) for node, _ in adjacent] for adjacent in edges]
+    result = bfs(lambda node: [next_node for next_node, _ in unit[node]], sources, len(edges), track_parents=True)
+    assert list(result.distances) == reference_distances(unit, sources)
+    check_paths(result, unit, sources)
+
+    result = bfs_01(edges.__getitem__, sources, len(edges), track_parents=True)
+    assert list(result.distances) == reference_distances(edges, sources)
+    check_paths(result, edges, sources)
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_searches_stop_at_the_nearest_target(seed):
+    rng = random.Random(seed)
+    edges = random_graph(rng, 50, 5)
+    expected = reference_distances(edges, [0])
+    targets = set(rng.sample(range(50), 5))
+    reachable = [expected[node] for node in targets if expected[node] != UNREACHED]
+
+    for name, search in weighted_searches(edges, 5).items():
+        result = search([0], targets=targets)
+        if reachable:
+            assert result.target in targets, name
+            assert result.distances[result.target] == min(reachable), name
+        else:
+            assert result.target is None, name
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_astar_with_admissible_heuristic(seed):
+    rng = random.Random(seed)
+    edges = random_graph(rng, 50, 9)
+    target = rng.randrange(50)
+
+    # half the true remaining cost never overestimates it
+    reverse = [[] for _ in edges]
+    for node, adjacent in enumerate(edges):
+        for next_node, cost in adjacent:
+            reverse[next_node].append((node, cost))
+    remaining = reference_distances(reverse, [target])
+    heuristic = lambda node: max(remaining[node], 0) // 2
+
+    result = astar(edges.__getitem__, [0], 50, {target}, heuristic)
+    assert result.distances[target] == reference_distances(edges, [0])[target]
+
+
+def random_grid(rng, width, height, plants="AB"):
+    rows = ["".join(rng.choice(plants) for _ in range(width)) for _ in range(height)]
+    return Grid.parse("\n".join(rows) + "\n")
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_bfs_grid_matches_bfs(seed):
+    rng = random.Random(seed)
+    grid = random_grid(rng, rng.randint(1, 15), rng.randint(1, 15), ".#")
+    start = rng.choice([index for index in grid.scan()])
+    passable = b"." if grid.cells[start] == ord(".") else b"#"
+
+    def neighbors(node):
+        return [node + step for step in grid.offsets4 if grid.cells[node + step] in passable]
+
+    expected = bfs(neighbors, [start], len(grid.cells))
+    result = bfs_grid(grid.cells, grid.offsets4, passable, [start])
+    assert list(result.distances) == list(expected.distances)
+    assert result.order == expected.order
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_shared_buffers_fill_each_cell_once(seed):
+    rng = random.Random(seed)
+    grid = random_grid(rng, 20, 20, "ABC")
+    seen = bytearray(len(grid.cells))
+    distances = bfs_grid(grid.cells, grid.offsets4, b"", []).distances
+
+    filled = []
+    for index in grid.scan():
+        if seen[index]:
+            continue
+        region = bfs_grid(grid.cells, grid.offsets4, (grid.cells[index],), [index], seen=seen, distances=distances).order
+        # a fill through fresh buffers finds the same region
+        alone = bfs_grid(grid.cells, grid.offsets4, (grid.cells[index],), [index]).order
+        assert sorted(region) == sorted(alone)
+        filled += region
+
+    assert sorted(filled) == sorted(grid.scan())
@@ -0,0 +1,40 @@
+import os
+from array import array
+from multiprocessing import shared_memory
+
+import pytest
+
+from aoc import shared
+
+
+def total_and_pid(views, task):
+    """Sum one shared array's slice, reporting which process read it"""
+    start, stop = task
+    return sum(views["values"][start:stop]), bytes(views["label"]).decode(), os.getpid()
+
+
+def test_map_shared_reads_the_arrays_in_the_workers():
+    values = array('q', range(-500, 1000))
+    tasks = [(start, start + 100) for start in range(0, len(values), 100)]
+    results = shared.map_shared(total_and_pid, {"values": values, "label": b"grid"}, tasks, workers=2)
+    assert [total for total, _, _ in results] == [sum(values[start:stop]) for start, stop in tasks]
+    assert {label for _, label, _ in results} == {"grid"}
+    assert os.getpid() not in {pid for _, _, pid in results}
+
+
+def test_attach_views_every_typecode_in_place():
+    arrays = {"b": bytearray(b"xyz"), "i": array('i', [1, -2, 3]), "d": array('d', [0.5]), "none": array('q')}
+    with shared.SharedArrays(arrays) as block:
+        # every array starts on an aligned offset
+        assert all(offset % shared.ALIGNMENT == 0 for _, _, offset, _ in block.handle.fields)
+        views = shared.attach(block.handle)
+        assert shared.attach(block.handle) is views
+        assert {key: list(view) for key, view in views.items()} == {
+            "b": list(b"xyz"), "i": [1, -2, 3], "d": [0.5], "none": []
+        }
+        shared.detach(block.handle.name)
+        assert block.handle.name not in shared.attached
+        name = block.handle.name
+    # closing the owner unlinks the block
+    with pytest.raises(FileNotFoundError):
+        shared_memory.SharedMemory(name=name)